@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+DTYPE_MIXES = {
+    "numeric": {"float": 0.7, "int": 0.3},
+    "object": {"object": 1.0},
+    "categorical": {"category": 1.0},
+    "datetime": {"datetime": 1.0},
+    "mixed": {"float": 0.4, "int": 0.2, "object": 0.2, "category": 0.1, "datetime": 0.1},
+}
+
+
+def make_column(kind, n_rows, rng, missing_rate=0.05):
+    """
+    Generate one synthetic column of the given kind, with about `missing_rate` missing values.
+    """
+    if kind == "float":
+        values = rng.normal(rng.uniform(-100, 100), rng.uniform(1, 50), size=n_rows)
+        values[rng.random(n_rows) < missing_rate] = np.nan
+        return values
+    if kind == "int":
+        return rng.integers(0, 1_000, size=n_rows)
+    if kind == "object":
+        return pd.Series(rng.integers(0, 500, size=n_rows)).map("value_{}".format).to_numpy(dtype=object)
+    if kind == "category":
+        return pd.Categorical.from_codes(rng.integers(0, 20, size=n_rows), [f"level_{i}" for i in range(20)])
+    if kind == "datetime":
+        return pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 3 * 365 * 24 * 3600, size=n_rows), unit="s")
+    raise ValueError(f"Unknown column kind: {kind}")
+
+
+def make_dataset(n_rows, n_columns, mix="mixed", n_classes=5, seed=0):
+    """
+    Generate a synthetic dataset with a categorical `target` column.
+
+    Parameters
+    ----------
+    n_rows : int
+        The number of rows.
+    n_columns : int
+        The number of feature columns, the target excluded.
+    mix : str
+        The dtype mix of the feature columns, one of `DTYPE_MIXES`.
+    n_classes : int
+        The number of classes of the target, with imbalanced class frequencies.
+    seed : int
+        The seed of the random generator.
+
+    Returns
+    -------
+    pd.DataFrame
+        The dataset.
+    """
+    assert mix in DTYPE_MIXES, f"Argument 'mix' should be one of {sorted(DTYPE_MIXES)}! You have {mix}."
+    rng = np.random.default_rng(seed)
+
+    kinds, weights = zip(*DTYPE_MIXES[mix].items())
+    counts = np.floor(np.array(weights) * n_columns).astype(int)
+    counts[0] += n_columns - counts.sum()
+
+    columns = {}
+    for kind, count in zip(kinds, counts):
+        for _ in range(count):
+            columns[f"{kind}_{len(columns)}"] = make_column(kind, n_rows, rng)
+
+    proportions = rng.dirichlet(np.ones(n_classes))
+    columns["target"] = rng.choice([f"class_{i}" for i in range(n_classes)], size=n_rows, p=proportions)
+    return pd.DataFrame(columns)
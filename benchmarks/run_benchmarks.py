@@ -0,0 +1,204 @@
+"""
+Benchmark suite of the public summarease functions on synthetic datasets.
+
+Every benchmark is timed on datasets of several sizes (rows x columns) and dtype mixes (see
+`datasets.py`). The results are written as JSON, so a run can be compared with a baseline saved
+earlier on the same machine.
+
+Usage (from the root of the repository, with the package installed):
+
+    python benchmarks/run_benchmarks.py --suite quick --output benchmarks/results/baseline.json
+    python benchmarks/run_benchmarks.py --suite quick --baseline benchmarks/results/baseline.json
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from datasets import DTYPE_MIXES, make_dataset  # noqa: E402
+
+from summarease.summarize import summarize  # noqa: E402
+from summarease.summarize_numeric import summarize_numeric  # noqa: E402
+from summarease.summarize_target import summarize_target_df, summarize_target_balance_plot  # noqa: E402
+from summarease.summarize_dtypes import summarize_dtypes_table  # noqa: E402
+
+SUITES = {
+    "quick": {"rows": [10_000], "columns": [2, 20], "mixes": ["numeric", "mixed"]},
+    "default": {"rows": [10_000, 100_000, 1_000_000], "columns": [2, 20, 200], "mixes": list(DTYPE_MIXES)},
+    "full": {"rows": [10_000, 100_000, 1_000_000, 10_000_000], "columns": [2, 20, 200, 2_000], "mixes": list(DTYPE_MIXES)},
+}
+
+
+def _summarize_numeric_plot(dataset, _):
+    # Build the Vega-Lite specifications, which is where the charts spend their time
+    for chart in (summarize_numeric(dataset, summarize_by="plot", density_method="numpy") or {}).values():
+        chart.to_dict()
+
+
+def _summarize_target_balance_plot(dataset, _):
+    summary = summarize_target_df(dataset, "target", "categorical")
+    summarize_target_balance_plot(summary).to_dict()
+
+
+def _summarize_report(summarize_by):
+    def run(dataset, output_dir):
+        with contextlib.redirect_stdout(io.StringIO()):
+            summarize(dataset, summarize_by=summarize_by, target_variable="target", output_file="benchmark.pdf",
+                      output_dir=str(output_dir) + "/")
+    return run
+
+
+# Maps the benchmark names to (function of the dataset and a scratch directory, draws charts)
+BENCHMARKS = {
+    "summarize_numeric_table": (lambda dataset, _: summarize_numeric(dataset, summarize_by="table"), False),
+    "summarize_numeric_plot": (_summarize_numeric_plot, True),
+    "summarize_target_df": (lambda dataset, _: summarize_target_df(dataset, "target", "categorical"), False),
+    "summarize_target_balance_plot": (_summarize_target_balance_plot, True),
+    "summarize_dtypes_table": (lambda dataset, _: summarize_dtypes_table(dataset), False),
+    "summarize_table": (_summarize_report("table"), False),
+    "summarize_plot": (_summarize_report("plot"), True),
+}
+
+
+def time_call(function, dataset, repeat):
+    """
+    Time `function` on `dataset` `repeat` times, after one warm-up call.
+    """
+    times = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        function(dataset, output_dir)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function(dataset, output_dir)
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(rows, columns, mixes, benchmarks, repeat=3, max_cells=50_000_000, max_plot_cells=5_000_000, seed=0):
+    """
+    Run the benchmarks on every combination of sizes and dtype mixes.
+
+    Datasets larger than `max_cells` cells are skipped, and the benchmarks drawing charts are
+    skipped above `max_plot_cells` cells. Skipped runs are recorded with the reason.
+
+    Returns
+    -------
+    list of dict
+        One result per benchmark and dataset.
+    """
+    results = []
+    for mix in mixes:
+        for n_columns in columns:
+            for n_rows in rows:
+                case = {"n_rows": n_rows, "n_columns": n_columns, "mix": mix}
+                if n_rows * n_columns > max_cells:
+                    results.extend({"benchmark": name, **case, "skipped": f"more than {max_cells} cells"} for name in benchmarks)
+                    continue
+
+                dataset = make_dataset(n_rows, n_columns, mix=mix, seed=seed)
+                for name in benchmarks:
+                    function, draws_charts = BENCHMARKS[name]
+                    if draws_charts and n_rows * n_columns > max_plot_cells:
+                        results.append({"benchmark": name, **case, "skipped": f"charts on more than {max_plot_cells} cells"})
+                        continue
+
+                    times = time_call(function, dataset, repeat)
+                    result = {"benchmark": name, **case, "times": times, "min": min(times), "median": statistics.median(times)}
+                    results.append(result)
+                    print(f"{name:32} {n_rows:>10} x {n_columns:<5} {mix:12} median {result['median']:.4f}s", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Compare the median times of `results` with those of a baseline run.
+
+    Returns
+    -------
+    list of dict
+        The results present in both runs, with the `ratio` of their median times and whether it is
+        a `regression` (slower than the baseline by more than `tolerance`).
+    """
+    def key(result):
+        return result["benchmark"], result["n_rows"], result["n_columns"], result["mix"]
+
+    baseline_medians = {key(result): result["median"] for result in baseline if "median" in result}
+    comparison = []
+    for result in results:
+        if "median" not in result or key(result) not in baseline_medians:
+            continue
+        ratio = result["median"] / baseline_medians[key(result)]
+        comparison.append({**result, "baseline_median": baseline_medians[key(result)], "ratio": ratio,
+                           "regression": ratio > 1 + tolerance})
+    return comparison
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", choices=SUITES, default="quick", help="The preset sizes and dtype mixes.")
+    parser.add_argument("--rows", type=int, nargs="+", help="Override the numbers of rows of the suite.")
+    parser.add_argument("--columns", type=int, nargs="+", help="Override the numbers of columns of the suite.")
+    parser.add_argument("--mixes", nargs="+", choices=DTYPE_MIXES, help="Override the dtype mixes of the suite.")
+    parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3, help="Timed calls per benchmark, after a warm-up call.")
+    parser.add_argument("--max-cells", type=int, default=50_000_000, help="Skip datasets with more cells.")
+    parser.add_argument("--max-plot-cells", type=int, default=5_000_000, help="Skip chart benchmarks on datasets with more cells.")
+    parser.add_argument("--output", type=Path, help="The JSON file the results are written to.")
+    parser.add_argument("--baseline", type=Path, help="A JSON file of an earlier run to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="The slowdown reported as a regression. Default is 25%%.")
+    args = parser.parse_args(argv)
+
+    suite = SUITES[args.suite]
+    results = run_suite(args.rows or suite["rows"], args.columns or suite["columns"], args.mixes or suite["mixes"],
+                        args.benchmarks, repeat=args.repeat, max_cells=args.max_cells, max_plot_cells=args.max_plot_cells)
+
+    report = {
+        "metadata": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "suite": args.suite,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+        },
+        "results": results,
+    }
+    output = args.output or Path(__file__).resolve().parent / "results" / f"{args.suite}_{datetime.datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+    if args.baseline is not None:
+        comparison = compare(results, json.loads(args.baseline.read_text())["results"], tolerance=args.tolerance)
+        for item in comparison:
+            flag = "REGRESSION" if item["regression"] else ""
+            print(f"{item['benchmark']:32} {item['n_rows']:>10} x {item['n_columns']:<5} {item['mix']:12} "
+                  f"{item['baseline_median']:.4f}s -> {item['median']:.4f}s ({item['ratio']:.2f}x) {flag}")
+        if any(item["regression"] for item in comparison):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
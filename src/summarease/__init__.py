@@ -1,3 +1,46 @@
 # read version from installed package
 # from importlib.metadata import version
 # __version__ = version("summarease")
+
+# The public functions are imported from their modules on first access, so `import summarease`
+# stays cheap and pandas, Altair and FPDF are only loaded by the functions that need them.
+# The functions named after their module (`summarize`, `summarize_dict`, `summarize_numeric` and
+# `summarize_missing`) are not exported: the package attribute is the submodule, so they are
+# imported from it, e.g. `from summarease.summarize import summarize`.
+_EXPORTS = {
+    "summarize_async": "summarease.summarize",
+    "summarize_target_df": "summarease.summarize_target",
+    "summarize_target_balance_plot": "summarease.summarize_target",
+    "summarize_dtypes_table": "summarease.summarize_dtypes",
+    "compute_missing_summary": "summarease.summarize_missing",
+    "compute_column_stats": "summarease.column_stats",
+    "describe_from_stats": "summarease.column_stats",
+    "compute_arrow_stats": "summarease.arrow_stats",
+    "accumulate_stats": "summarease.accumulators",
+    "accumulate_partitions": "summarease.partitioned",
+    "KLLSketch": "summarease.sketches",
+    "RenderCache": "summarease.rendering",
+    "render_charts": "summarease.rendering",
+    "render_charts_async": "summarease.rendering",
+    "StageProfiler": "summarease.profiling",
+    "SummaryCache": "summarease.memoize",
+    "fingerprint": "summarease.memoize",
+    "sample_rows": "summarease.sampling",
+    "summarize_batch": "summarease.batch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'summarease' has no attribute '{name}'")
+
+    from importlib import import_module
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
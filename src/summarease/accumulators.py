@@ -0,0 +1,628 @@
+import copy
+import pickle
+from collections.abc import Iterable
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from summarease.column_stats import STATS_COLUMNS, DatasetStats, is_summarizable_numeric, select_columns
+from summarease.sketches import KLLSketch
+
+CSV_SUFFIXES = {'.csv', '.tsv', '.txt'}
+PARQUET_SUFFIXES = {'.parquet', '.pq'}
+STATE_FORMAT_VERSION = 2
+# The minimum number of values counted by the heavy hitters sketch of a streamed target
+DEFAULT_HEAVY_HITTERS = 1_000
+
+
+class NumericAccumulator:
+    """
+    Mergeable accumulator of the count, missing values, mean, sum of squared deviations, min and max
+    of a numeric column.
+
+    Batches are folded in with the parallel form of Welford's algorithm (Chan et al.), so the
+    result does not depend on how the column was split into batches.
+
+    Examples
+    --------
+    >>> acc = NumericAccumulator()
+    >>> acc.update(df["col1"])
+    >>> acc.merge(other_acc)
+    >>> acc.mean, acc.std
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.nulls = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+    def update(self, values):
+        """
+        Fold a batch of values into the accumulator. Missing values are counted and skipped.
+        """
+        values = pd.Series(values).to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(values)
+        self.nulls += int(missing.sum())
+        values = values[~missing]
+
+        if values.size == 0:
+            return self
+
+        batch = NumericAccumulator()
+        batch.count = values.size
+        batch.mean = values.mean()
+        deviations = values - batch.mean
+        batch.m2 = np.dot(deviations, deviations)
+        batch.min = values.min()
+        batch.max = values.max()
+        return self._merge_moments(batch)
+
+    def merge(self, other):
+        """
+        Merge another accumulator, computed on a disjoint set of rows, into this one.
+        """
+        assert isinstance(other, NumericAccumulator), f"Argument 'other' should be a NumericAccumulator! You have {type(other)}."
+        self.nulls += other.nulls
+        return self._merge_moments(other)
+
+    def _merge_moments(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def sum(self):
+        return self.mean * self.count
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+
+class ValueCountsAccumulator:
+    """
+    Mergeable accumulator of the value counts of a column, missing values excluded.
+
+    With a `capacity`, only the heavy hitters are kept, as in a Misra-Gries sketch: whenever more
+    than `capacity` values are counted, the (capacity + 1)-th largest count is subtracted from every
+    count and the values left without a positive count are dropped. Every value occurring more than
+    n / (capacity + 1) times is kept, and its count is underestimated by at most `error`.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        The maximum number of values counted. If None, every value is counted exactly.
+
+    Attributes
+    ----------
+    counts : pd.Series
+        The (lower bounds of the) counts, indexed by the values.
+    error : int
+        The maximum underestimation of any count, 0 if the counts are exact.
+    """
+    capacity = None
+    error = 0
+
+    def __init__(self, capacity: int = None):
+        assert capacity is None or (isinstance(capacity, int) and capacity > 0), f"Argument 'capacity' should be a positive integer! You have {capacity}."
+        self.capacity = capacity
+        self.error = 0
+        self.counts = pd.Series(dtype='int64')
+
+    def update(self, values):
+        """
+        Fold a batch of values into the accumulator.
+        """
+        return self._add(pd.Series(values).value_counts(dropna=True))
+
+    def merge(self, other):
+        """
+        Merge another accumulator, computed on a disjoint set of rows, into this one.
+        """
+        assert isinstance(other, ValueCountsAccumulator), f"Argument 'other' should be a ValueCountsAccumulator! You have {type(other)}."
+        self.error += other.error
+        return self._add(other.counts)
+
+    def _add(self, counts):
+        if self.counts.empty:
+            self.counts = counts.astype('int64').rename('count')
+        elif not counts.empty:
+            self.counts = self.counts.add(counts, fill_value=0).astype('int64').rename('count')
+        if self.capacity is not None and len(self.counts) > self.capacity:
+            decrement = int(np.partition(self.counts.to_numpy(), len(self.counts) - self.capacity - 1)[len(self.counts) - self.capacity - 1])
+            self.counts = self.counts[self.counts > decrement] - decrement
+            self.error += decrement
+        return self
+
+    @property
+    def exact(self):
+        """Whether the counts are exact."""
+        return self.error == 0
+
+
+class CoMomentsAccumulator:
+    """
+    Mergeable accumulator of the co-moments of numeric columns, from which their Pearson
+    correlation matrix is derived.
+
+    For every pair of columns, the count, the means, the sums of squared deviations and the sum of
+    the products of deviations are kept over the rows where both columns are present (pairwise
+    deletion, like `pd.DataFrame.corr`). Batches are merged with the formulas of Chan et al., so
+    the result does not depend on how the rows were split.
+
+    Attributes
+    ----------
+    columns : list
+        The names of the columns, in the order they were first seen.
+    count, mean_x, mean_y, m2_x, m2_y, cross : np.ndarray
+        k x k arrays of the co-moments. Entry (i, j) holds, over the rows where both columns i and j
+        are present, their count, the means of column i and of column j, their sums of squared
+        deviations and the sum of the products of their deviations.
+
+    Examples
+    --------
+    >>> acc = CoMomentsAccumulator()
+    >>> acc.update(chunk[numeric_columns])
+    >>> acc.merge(other_acc).correlation()
+    """
+
+    def __init__(self):
+        self.columns = []
+        empty = np.zeros((0, 0))
+        self.count, self.mean_x, self.mean_y, self.m2_x, self.m2_y, self.cross = (empty,) * 6
+
+    def update(self, frame: pd.DataFrame):
+        """
+        Fold a batch of rows of numeric columns into the accumulator. Missing values are skipped.
+        """
+        values = frame.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        # The values are centered on the column means of the batch, to limit cancellation
+        with np.errstate(invalid="ignore", divide="ignore"):
+            shift = np.nan_to_num(np.nansum(values, axis=0) / present.sum(axis=0))
+        centered = np.where(present, values - shift, 0.0)
+        present = present.astype(np.float64)
+
+        batch = CoMomentsAccumulator()
+        batch.columns = list(frame.columns)
+        batch.count = present.T @ present
+        sum_x, sum_y = centered.T @ present, present.T @ centered
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_x = np.where(batch.count > 0, sum_x / batch.count, 0.0)
+            mean_y = np.where(batch.count > 0, sum_y / batch.count, 0.0)
+        batch.m2_x = (centered ** 2).T @ present - sum_x * mean_x
+        batch.m2_y = present.T @ centered ** 2 - sum_y * mean_y
+        batch.cross = centered.T @ centered - sum_x * mean_y
+        batch.mean_x, batch.mean_y = mean_x + shift[:, None], mean_y + shift[None, :]
+        return self.merge(batch)
+
+    def _reindex(self, columns):
+        """Return the co-moments laid out for `columns`, zero for the columns not seen."""
+        arrays = (self.count, self.mean_x, self.mean_y, self.m2_x, self.m2_y, self.cross)
+        if columns == self.columns:
+            return arrays
+        positions = np.ix_(*[[columns.index(col) for col in self.columns]] * 2)
+        reindexed = []
+        for array in arrays:
+            padded = np.zeros((len(columns), len(columns)))
+            padded[positions] = array
+            reindexed.append(padded)
+        return reindexed
+
+    def merge(self, other):
+        """
+        Merge another accumulator, computed on a disjoint set of rows, into this one. The columns
+        of both are kept.
+        """
+        assert isinstance(other, CoMomentsAccumulator), f"Argument 'other' should be a CoMomentsAccumulator! You have {type(other)}."
+        columns = self.columns + [col for col in other.columns if col not in self.columns]
+        count_a, mean_x_a, mean_y_a, m2_x_a, m2_y_a, cross_a = self._reindex(columns)
+        count_b, mean_x_b, mean_y_b, m2_x_b, m2_y_b, cross_b = other._reindex(columns)
+
+        count = count_a + count_b
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(count > 0, count_b / count, 0.0)
+            factor = np.where(count > 0, count_a * count_b / count, 0.0)
+        delta_x, delta_y = mean_x_b - mean_x_a, mean_y_b - mean_y_a
+
+        self.columns = columns
+        self.count = count
+        self.mean_x = mean_x_a + delta_x * weight
+        self.mean_y = mean_y_a + delta_y * weight
+        self.m2_x = m2_x_a + m2_x_b + delta_x ** 2 * factor
+        self.m2_y = m2_y_a + m2_y_b + delta_y ** 2 * factor
+        self.cross = cross_a + cross_b + delta_x * delta_y * factor
+        return self
+
+    def correlation(self) -> pd.DataFrame:
+        """
+        Return the Pearson correlation matrix of the columns, laid out like `compute_correlation`.
+
+        Correlations involving a constant column, or pairs with less than two complete rows, are
+        missing.
+        """
+        # Sums of squared deviations within rounding error of zero are those of constant columns
+        tolerance = self.count * (64 * np.finfo(np.float64).eps * np.abs(np.stack([self.mean_x, self.mean_y]))) ** 2
+        constant = (self.m2_x <= tolerance[0]) | (self.m2_y <= tolerance[1])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = self.cross / np.sqrt(self.m2_x * self.m2_y)
+        corr[constant | (self.count < 2)] = np.nan
+        np.clip(corr, -1, 1, out=corr)
+        # A constant column has no correlation, except with itself
+        defined = ~np.isnan(np.diag(corr))
+        corr[np.diag_indices(len(self.columns))] = np.where(defined, 1, np.nan)
+        return pd.DataFrame(corr.astype(np.float32), index=pd.Index(self.columns), columns=pd.Index(self.columns))
+
+
+def _merge_dtypes(dtype, other):
+    """
+    Return the dtype able to hold the values of two chunks of the same column.
+    """
+    if dtype is None or dtype == other:
+        return other
+    if is_summarizable_numeric(dtype) and is_summarizable_numeric(other):
+        try:
+            return np.result_type(dtype, other)
+        except TypeError:
+            return np.dtype('float64')
+    return np.dtype('object')
+
+
+class DatasetAccumulator:
+    """
+    Mergeable accumulator of the column statistics of a dataset that is read in chunks of rows.
+
+    The accumulator is also the persisted summary state of an append-only dataset: it can be saved,
+    loaded back, updated with the new rows only and merged with the states of other partitions.
+
+    Parameters
+    ----------
+    value_counts_for : list of str, optional
+        Columns for which the value counts are accumulated as well (e.g., the target variable).
+    quantile_error : float, optional
+        If given, the quartiles of the numeric columns are estimated with mergeable KLL sketches
+        with this normalized rank error. Otherwise the quartiles are not tracked.
+    heavy_hitters : int, optional
+        If given, only the `heavy_hitters` most frequent values of the `value_counts_for` columns
+        are counted, approximately (see `ValueCountsAccumulator`), so high-cardinality columns use
+        bounded memory. Otherwise every value is counted.
+    co_moments : bool, optional
+        If True, the co-moments of the numeric columns are accumulated as well (see
+        `CoMomentsAccumulator`), for their correlation matrix. Default is False.
+    seed : int or np.random.SeedSequence, optional
+        The seed of the KLL sketches. The accumulators of partitions that are merged later should
+        have independent seeds (see `KLLSketch`). Default is 0.
+
+    Examples
+    --------
+    >>> acc = DatasetAccumulator(value_counts_for=["target"], quantile_error=0.01)
+    >>> for chunk in iter_dataset_chunks("data.csv"):
+    ...     acc.update(chunk)
+    >>> stats = acc.to_stats()
+
+    Incremental summaries of a dataset growing by partitions:
+
+    >>> state = DatasetAccumulator.load("events.state")
+    >>> summarize_numeric(new_partition, summarize_by="table", state=state)
+    >>> state.save("events.state")
+    """
+
+    def __init__(self, value_counts_for=None, quantile_error: float = None, heavy_hitters: int = None,
+                 co_moments: bool = False, seed=0):
+        self.value_counts_for = [] if value_counts_for is None else list(value_counts_for)
+        self.quantile_error = quantile_error
+        self.heavy_hitters = heavy_hitters
+        self.seed = seed
+        self.n_rows = 0
+        self.dtypes = {}
+        self.nulls = {}
+        self.numeric = {}
+        self.value_counts = {col: ValueCountsAccumulator(heavy_hitters) for col in self.value_counts_for}
+        self.sketches = {}
+        self.co_moments = CoMomentsAccumulator() if co_moments else None
+
+    def update(self, chunk: pd.DataFrame):
+        """
+        Fold a chunk of rows into the accumulator.
+        """
+        assert isinstance(chunk, pd.DataFrame), f"Argument 'chunk' should be pandas dataframe (pd.DataFrame)! You have {type(chunk)}."
+        missing_columns = set(self.value_counts_for) - set(chunk.columns)
+        if missing_columns:
+            raise KeyError(f"Columns not found in the dataset: {sorted(missing_columns, key=str)}")
+
+        self.n_rows += len(chunk)
+        for col in chunk.columns:
+            series = chunk[col]
+            self.dtypes[col] = _merge_dtypes(self.dtypes.get(col), series.dtype)
+            if is_summarizable_numeric(series.dtype):
+                self.numeric.setdefault(col, NumericAccumulator()).update(series)
+                self.nulls[col] = self.nulls.get(col, 0)
+                if self.quantile_error is not None:
+                    self.sketches.setdefault(col, KLLSketch(epsilon=self.quantile_error, seed=self.seed)).update(series)
+            else:
+                self.nulls[col] = self.nulls.get(col, 0) + int(series.isna().sum())
+            if col in self.value_counts:
+                self.value_counts[col].update(series)
+        if self.co_moments is not None:
+            self.co_moments.update(select_columns(chunk, [col for col, dtype in chunk.dtypes.items()
+                                                          if is_summarizable_numeric(dtype)]))
+        return self
+
+    def update_from(self, source, chunksize: int = 100_000):
+        """
+        Fold every chunk of a dataset into the accumulator.
+
+        Parameters
+        ----------
+        source : pd.DataFrame, str, Path or iterable of pd.DataFrame
+            The rows to add, see `iter_dataset_chunks`.
+        chunksize : int, optional
+            The number of rows read at a time from a file. Default is 100,000.
+        """
+        for chunk in iter_dataset_chunks(source, chunksize=chunksize):
+            self.update(chunk)
+        return self
+
+    def track_value_counts(self, column):
+        """
+        Start accumulating the value counts of `column`.
+
+        Raises
+        ------
+        ValueError
+            If rows were already accumulated without the value counts of `column`.
+        """
+        if column in self.value_counts:
+            return self
+        if self.n_rows > 0:
+            raise ValueError(f"The summary state does not track the value counts of '{column}'. "
+                             f"Create it with value_counts_for=['{column}'].")
+        self.value_counts_for.append(column)
+        self.value_counts[column] = ValueCountsAccumulator(self.heavy_hitters)
+        return self
+
+    def track_co_moments(self):
+        """
+        Start accumulating the co-moments of the numeric columns, for their correlation matrix.
+
+        Raises
+        ------
+        ValueError
+            If rows were already accumulated without the co-moments.
+        """
+        if self.co_moments is not None:
+            return self
+        if self.n_rows > 0:
+            raise ValueError("The summary state does not track the co-moments of the columns. Create it with co_moments=True.")
+        self.co_moments = CoMomentsAccumulator()
+        return self
+
+    def save(self, path):
+        """
+        Save the accumulator to a file, to be loaded back with `DatasetAccumulator.load`.
+        """
+        with open(path, 'wb') as file:
+            pickle.dump({'version': STATE_FORMAT_VERSION, 'state': self.__dict__}, file)
+        return Path(path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an accumulator saved with `save`. Only load files you trust, they are unpickled.
+
+        Raises
+        ------
+        ValueError
+            If the file was not written by `save` or by an incompatible version.
+        """
+        with open(path, 'rb') as file:
+            content = pickle.load(file)
+        if not isinstance(content, dict) or content.get('version') != STATE_FORMAT_VERSION:
+            raise ValueError(f"Not a summary state of version {STATE_FORMAT_VERSION}: {path}")
+        accumulator = cls.__new__(cls)
+        accumulator.__dict__.update(content['state'])
+        return accumulator
+
+    def merge(self, other):
+        """
+        Merge another accumulator, computed on a disjoint set of rows, into this one.
+
+        Raises
+        ------
+        ValueError
+            If the accumulators do not track the same statistics: their `quantile_error`,
+            `heavy_hitters`, value counts columns or co-moments differ.
+        """
+        assert isinstance(other, DatasetAccumulator), f"Argument 'other' should be a DatasetAccumulator! You have {type(other)}."
+        differences = [name for name, mine, theirs in [
+            ("quantile_error", self.quantile_error, other.quantile_error),
+            ("heavy_hitters", self.heavy_hitters, other.heavy_hitters),
+            ("value_counts_for", set(self.value_counts), set(other.value_counts)),
+            ("co_moments", self.co_moments is not None, other.co_moments is not None),
+        ] if mine != theirs]
+        if differences:
+            # The statistics tracked by one side only would be missing the rows of the other
+            raise ValueError(f"The summary states do not track the same statistics, they differ in: {', '.join(differences)}.")
+
+        self.n_rows += other.n_rows
+        for col, dtype in other.dtypes.items():
+            self.dtypes[col] = _merge_dtypes(self.dtypes.get(col), dtype)
+            self.nulls[col] = self.nulls.get(col, 0) + other.nulls[col]
+        for col, acc in other.numeric.items():
+            self.numeric.setdefault(col, NumericAccumulator()).merge(acc)
+        for col, acc in other.value_counts.items():
+            self.value_counts[col].merge(acc)
+        for col, sketch in other.sketches.items():
+            if col in self.sketches:
+                self.sketches[col].merge(sketch)
+            else:
+                # A copy, so updating this accumulator does not change the other one
+                self.sketches[col] = copy.deepcopy(sketch)
+        if self.co_moments is not None:
+            self.co_moments.merge(other.co_moments)
+        return self
+
+    def to_stats(self) -> DatasetStats:
+        """
+        Convert the accumulated statistics to a `DatasetStats` object.
+
+        The quartiles are estimated from the KLL sketches, and are missing if `quantile_error` was
+        not given. The cardinality is only known for the columns in `value_counts_for` counted
+        exactly. The correlation matrix is only given with `co_moments=True`.
+        """
+        rows = []
+        for col, dtype in self.dtypes.items():
+            row = {'dtype': str(dtype), 'is_numeric': is_summarizable_numeric(dtype)}
+            acc = self.numeric.get(col)
+            if row['is_numeric'] and acc is not None:
+                # Numeric nulls are counted by the numeric accumulator
+                row.update({'count': acc.count, 'nulls': acc.nulls, 'sum': acc.sum, 'm2': acc.m2,
+                            'min': acc.min, 'max': acc.max})
+                if col in self.sketches:
+                    row['25%'], row['50%'], row['75%'] = self.sketches[col].quantiles([0.25, 0.5, 0.75])
+            else:
+                nulls = self.nulls[col] + (acc.nulls if acc is not None else 0)
+                row.update({'count': self.n_rows - nulls, 'nulls': nulls})
+            if col in self.value_counts and self.value_counts[col].exact:
+                row['n_unique'] = len(self.value_counts[col].counts)
+            rows.append(row)
+
+        columns = pd.DataFrame(rows, index=pd.Index(list(self.dtypes)), columns=STATS_COLUMNS)
+        value_counts = {col: acc.counts for col, acc in self.value_counts.items()}
+        correlation = None
+        if self.co_moments is not None:
+            numeric_columns = columns.index[columns['is_numeric'].astype(bool)].tolist()
+            correlation = self.co_moments.correlation().reindex(index=numeric_columns, columns=numeric_columns)
+        return DatasetStats(columns=columns, value_counts=value_counts, n_rows=self.n_rows, correlation=correlation)
+
+
+def is_streamable_source(source):
+    """
+    Return True if `source` is a CSV/Parquet file path, a directory of such files or an iterable of
+    DataFrame chunks or of file paths.
+    """
+    if isinstance(source, (str, Path)):
+        return Path(source).suffix.lower() in CSV_SUFFIXES | PARQUET_SUFFIXES or Path(source).is_dir()
+    return isinstance(source, Iterable) and not isinstance(source, (pd.DataFrame, pd.Series, bytes, dict))
+
+
+def list_dataset_files(directory):
+    """
+    Return the CSV and Parquet files of a directory and of its subdirectories (e.g., the partitions
+    of a Hive-partitioned dataset), in sorted order.
+    """
+    return sorted(path for path in Path(directory).rglob("*")
+                  if path.is_file() and path.suffix.lower() in CSV_SUFFIXES | PARQUET_SUFFIXES)
+
+
+def iter_dataset_chunks(source, chunksize: int = 100_000):
+    """
+    Iterate over a dataset in chunks of rows.
+
+    Parameters
+    ----------
+    source : pd.DataFrame, str, Path or iterable of pd.DataFrame
+        A DataFrame, the path of a CSV (.csv, .tsv, .txt) or Parquet (.parquet, .pq) file or of a
+        directory of such files (see `list_dataset_files`), or an iterable of DataFrame chunks or
+        of file paths sharing the same columns.
+    chunksize : int, optional
+        The number of rows read at a time from a file. Default is 100,000.
+
+    Yields
+    ------
+    pd.DataFrame
+        The chunks of the dataset.
+
+    Raises
+    ------
+    ValueError
+        If the file format is not supported.
+    ImportError
+        If a Parquet file is given and pyarrow is not installed.
+    """
+    assert isinstance(chunksize, int) and chunksize > 0, f"Argument 'chunksize' should be a positive integer! You have {chunksize}."
+
+    if isinstance(source, pd.DataFrame):
+        yield source
+        return
+
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        suffix = path.suffix.lower()
+        if path.is_dir():
+            for file in list_dataset_files(path):
+                yield from iter_dataset_chunks(file, chunksize=chunksize)
+        elif suffix in CSV_SUFFIXES:
+            sep = '\t' if suffix == '.tsv' else ','
+            with pd.read_csv(path, sep=sep, chunksize=chunksize) as reader:
+                yield from reader
+        elif suffix in PARQUET_SUFFIXES:
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as error:
+                raise ImportError("Reading Parquet files in chunks requires pyarrow. Install it with `pip install pyarrow`.") from error
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+        else:
+            raise ValueError(f"Unsupported file format: {path.suffix}. Should be one of {sorted(CSV_SUFFIXES | PARQUET_SUFFIXES)}.")
+        return
+
+    for chunk in source:
+        if isinstance(chunk, (str, Path)):
+            yield from iter_dataset_chunks(chunk, chunksize=chunksize)
+            continue
+        assert isinstance(chunk, pd.DataFrame), f"Every chunk should be a pandas dataframe (pd.DataFrame) or a file path! You have {type(chunk)}."
+        yield chunk
+
+
+def accumulate_stats(source, value_counts_for=None, chunksize: int = 100_000, quantile_error: float = None,
+                     heavy_hitters: int = None, co_moments: bool = False) -> DatasetStats:
+    """
+    Compute the column statistics of a dataset chunk by chunk, so peak memory depends on the
+    chunk size rather than on the size of the dataset.
+
+    Parameters
+    ----------
+    source : pd.DataFrame, str, Path or iterable of pd.DataFrame
+        The dataset, see `iter_dataset_chunks`.
+    value_counts_for : list of str, optional
+        Columns for which the value counts are accumulated as well.
+    chunksize : int, optional
+        The number of rows read at a time from a file. Default is 100,000.
+    quantile_error : float, optional
+        The normalized rank error of the quartiles, estimated with KLL sketches. If None, the
+        quartiles are not tracked.
+    heavy_hitters : int, optional
+        If given, only the most frequent values of the `value_counts_for` columns are counted,
+        approximately, see `DatasetAccumulator`.
+    co_moments : bool, optional
+        If True, the correlation matrix of the numeric columns is computed as well, see
+        `DatasetAccumulator`. Default is False.
+
+    Returns
+    -------
+    DatasetStats
+        The column statistics of the dataset.
+
+    Examples
+    --------
+    >>> stats = accumulate_stats("data.csv", value_counts_for=["target"], quantile_error=0.01)
+    >>> describe_from_stats(stats)
+    """
+    accumulator = DatasetAccumulator(value_counts_for=value_counts_for, quantile_error=quantile_error, heavy_hitters=heavy_hitters,
+                                     co_moments=co_moments)
+    return accumulator.update_from(source, chunksize=chunksize).to_stats()
@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+from summarease.column_stats import STATS_COLUMNS, DatasetStats, is_summarizable_numeric
+from summarease.sketches import KLLSketch
+
+
+def is_arrow_table(dataset):
+    """
+    Return True if `dataset` is a pyarrow Table or RecordBatch, without importing pyarrow.
+    """
+    return type(dataset).__module__.startswith("pyarrow") and type(dataset).__name__ in {"Table", "RecordBatch"}
+
+
+def is_polars_frame(dataset):
+    """
+    Return True if `dataset` is a Polars DataFrame, without importing Polars.
+    """
+    return type(dataset).__module__.startswith("polars") and type(dataset).__name__ == "DataFrame"
+
+
+def to_arrow_table(dataset):
+    """
+    Return a pyarrow Table or Polars DataFrame as a pyarrow Table, sharing its memory where possible.
+
+    Polars DataFrames are handed over with `DataFrame.to_arrow`, which does not copy the numeric
+    columns, so both are summarized by the same Arrow compute kernels.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as error:
+        raise ImportError("Summarizing Arrow tables and Polars DataFrames requires pyarrow. Install it with `pip install pyarrow`.") from error
+
+    if is_polars_frame(dataset):
+        return dataset.to_arrow()
+    if isinstance(dataset, pa.RecordBatch):
+        return pa.Table.from_batches([dataset])
+    assert isinstance(dataset, pa.Table), f"Argument 'dataset' should be a pyarrow Table or a Polars DataFrame! You have {type(dataset)}."
+    return dataset
+
+
+def arrow_numpy_dtype(arrow_type):
+    """
+    Return the pandas dtype of the columns of an Arrow type, as they would be converted by `to_pandas`.
+    """
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(arrow_type):
+        return pd.CategoricalDtype()
+    try:
+        return np.dtype(arrow_type.to_pandas_dtype())
+    except (NotImplementedError, TypeError):
+        return np.dtype(object)
+
+
+def arrow_pandas_dtypes(table):
+    """
+    Return the pandas dtypes of the columns of a pyarrow Table, as they would be converted by `to_pandas`.
+
+    The dtypes recorded in the pandas metadata of the table (e.g., the nullable `Int64`) are kept,
+    and integer and boolean columns with missing values become float64 and object columns, like in
+    pandas, so a table and its conversion to pandas have the same data types.
+    """
+    try:
+        # Converting no rows reads the dtypes from the schema and the pandas metadata
+        converted = table.slice(0, 0).to_pandas().dtypes.to_dict()
+    except (NotImplementedError, TypeError, ValueError):
+        converted = {}
+
+    dtypes = []
+    for name, column in zip(table.column_names, table.columns):
+        dtype = converted.get(name, arrow_numpy_dtype(column.type))
+        if column.null_count > 0 and isinstance(dtype, np.dtype):
+            if dtype.kind in "iu":
+                dtype = np.dtype(np.float64)
+            elif dtype.kind == "b":
+                dtype = np.dtype(object)
+        dtypes.append(dtype)
+    return dtypes
+
+
+def _arrow_column_stats(values, quantile_error=None):
+    """
+    Compute the numeric statistics of a single Arrow column without missing values with Arrow kernels.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if len(values) == 0:
+        return {'sum': 0.0, 'm2': 0.0, 'min': np.nan, 'max': np.nan,
+                '25%': np.nan, '50%': np.nan, '75%': np.nan}
+
+    values = values.cast(pa.float64())
+    extremes = pc.min_max(values)
+    if quantile_error is None:
+        q25, q50, q75 = pc.quantile(values, q=[0.25, 0.5, 0.75], interpolation="linear").to_pylist()
+    else:
+        sketch = KLLSketch(epsilon=quantile_error)
+        for chunk in values.chunks:
+            sketch.update(chunk.to_numpy(zero_copy_only=False))
+        q25, q50, q75 = sketch.quantiles([0.25, 0.5, 0.75])
+    return {'sum': pc.sum(values).as_py(), 'm2': pc.variance(values, ddof=0).as_py() * len(values),
+            'min': extremes['min'].as_py(), 'max': extremes['max'].as_py(), '25%': q25, '50%': q50, '75%': q75}
+
+
+def compute_arrow_stats(dataset, value_counts_for=None, quantile_error: float = None) -> DatasetStats:
+    """
+    Compute the column statistics of a pyarrow Table or a Polars DataFrame with Arrow compute kernels,
+    without converting it to pandas.
+
+    The statistics are the ones of `compute_column_stats`, with the same conventions: NaN values of
+    floating point columns are counted as missing, and the dtypes are the pandas dtypes the columns
+    would be converted to (see `arrow_pandas_dtypes`).
+
+    Parameters
+    ----------
+    dataset : pyarrow.Table, pyarrow.RecordBatch or polars.DataFrame
+        The dataset to analyze.
+    value_counts_for : list of str, optional
+        Columns for which the value counts are kept as well (e.g., the target variable).
+    quantile_error : float, optional
+        If given, the quartiles are estimated with a KLL sketch (see `KLLSketch`) with this
+        normalized rank error instead of being computed exactly.
+
+    Returns
+    -------
+    DatasetStats
+        The column statistics of the dataset.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+
+    Examples
+    --------
+    >>> stats = compute_arrow_stats(pq.read_table("data.parquet"))
+    >>> describe_from_stats(stats)
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    table = to_arrow_table(dataset)
+    value_counts_for = [] if value_counts_for is None else list(value_counts_for)
+    missing_columns = set(value_counts_for) - set(table.column_names)
+    if missing_columns:
+        raise KeyError(f"Columns not found in the dataset: {sorted(missing_columns, key=str)}")
+
+    n_rows = table.num_rows
+    rows = []
+    value_counts = {}
+
+    for col, column, dtype in zip(table.column_names, table.columns, arrow_pandas_dtypes(table)):
+        # NaN is a value in Arrow but a missing value in pandas
+        valid = column
+        if pa.types.is_floating(column.type) and pc.any(pc.is_nan(column)).as_py():
+            valid = pc.filter(column, pc.invert(pc.is_nan(column)))
+        nulls = n_rows - (len(valid) - valid.null_count)
+        row = {'dtype': str(dtype), 'is_numeric': is_summarizable_numeric(dtype), 'count': n_rows - nulls, 'nulls': nulls}
+
+        if row['is_numeric']:
+            row.update(_arrow_column_stats(pc.drop_null(valid), quantile_error=quantile_error))
+
+        if col in value_counts_for:
+            counts = pc.value_counts(pc.drop_null(valid))
+            counts = pd.Series(counts.field('counts').to_numpy(), index=counts.field('values').to_pandas(),
+                               name='count').sort_values(ascending=False, kind='stable')
+            counts.index.name = col
+            value_counts[col] = counts
+            row['n_unique'] = len(counts)
+
+        rows.append(row)
+
+    columns = pd.DataFrame(rows, index=pd.Index(table.column_names), columns=STATS_COLUMNS)
+    return DatasetStats(columns=columns, value_counts=value_counts, n_rows=n_rows)
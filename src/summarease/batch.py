@@ -0,0 +1,172 @@
+import contextlib
+import datetime
+import io
+import json
+import multiprocessing
+import os
+import re
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+MANIFEST_FORMAT_VERSION = 1
+
+
+def report_file_name(name):
+    """
+    Return the PDF file name of the report of a dataset, keeping only safe characters of its name.
+    """
+    return re.sub(r"[^\w.-]+", "_", str(name)).strip("._") + ".pdf"
+
+
+def _summarize_one(name, dataset, output_dir, options):
+    """
+    Summarize one dataset and return its manifest entry. Failures are recorded, not raised.
+    """
+    from summarease.summarize import summarize
+
+    entry = {"name": name, "output": str(Path(output_dir) / report_file_name(name)), "pid": os.getpid()}
+    start = time.perf_counter()
+    try:
+        # The "PDF created!" messages of the reports would interleave across the workers
+        with contextlib.redirect_stdout(io.StringIO()):
+            timings = summarize(dataset, **{"dataset_name": str(name), **options},
+                                output_file=report_file_name(name), output_dir=str(output_dir))
+        entry["status"] = "ok"
+        if timings is not None:
+            entry["stages"] = timings.to_dict()["stages"]
+    except Exception as error:
+        entry.update({"status": "failed", "error": f"{type(error).__name__}: {error}", "traceback": traceback.format_exc()})
+    entry["wall_time"] = time.perf_counter() - start
+    return entry
+
+
+def _failed_entry(name, output_dir, error):
+    """
+    Return the manifest entry of a dataset whose worker died or could not be sent the dataset.
+    """
+    return {"name": name, "output": str(Path(output_dir) / report_file_name(name)), "status": "failed",
+            "error": f"{type(error).__name__}: {error}", "wall_time": None}
+
+
+def _summarize_in_pool(datasets, output_dir, options, n_workers):
+    """
+    Summarize the datasets in a shared pool of worker processes.
+
+    Return the manifest entries of the datasets that were summarized, and the names of the datasets
+    left without a result because a worker died, which breaks the whole pool.
+    """
+    entries = {}
+    broken = []
+    # Forked workers can deadlock in the chart renderer, so they are spawned
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = {pool.submit(_summarize_one, name, dataset, output_dir, options): name for name, dataset in datasets.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                entries[name] = future.result()
+            except BrokenProcessPool:
+                broken.append(name)
+            except Exception as error:
+                # The dataset could not be sent to the worker
+                entries[name] = _failed_entry(name, output_dir, error)
+    return entries, broken
+
+
+def _summarize_isolated(name, dataset, output_dir, options):
+    """
+    Summarize one dataset in a worker process of its own, so that a crash only fails this dataset.
+    """
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        try:
+            return pool.submit(_summarize_one, name, dataset, output_dir, options).result()
+        except Exception as error:
+            # The worker died (e.g., out of memory) or the dataset could not be sent to it
+            return _failed_entry(name, output_dir, error)
+
+
+def summarize_batch(datasets, output_dir: str = "./summarease_summary/", max_workers: int = None,
+                    manifest_file: str = "manifest.json", **options):
+    """
+    Summarize many datasets across a pool of worker processes, one PDF report per dataset.
+
+    Every dataset is summarized by `summarize` in a worker process. A dataset that fails is recorded
+    in the manifest with its error and does not stop the others. A worker that crashes (e.g., out
+    of memory) breaks the pool, so the datasets left without a result are summarized again, each in
+    a process of its own: only the datasets that crash again are recorded as failed.
+
+    Parameters
+    ----------
+    datasets : dict
+        Maps the dataset names to DataFrames or CSV/Parquet file paths. File paths are cheaper to
+        send to the workers, DataFrames are pickled. The reports are named after the datasets.
+    output_dir : str, optional
+        The directory of the reports and of the manifest. Default is "./summarease_summary/".
+    max_workers : int, optional
+        The maximum number of datasets summarized at the same time. If None, one per CPU. With 1,
+        the datasets are summarized one after another in the current process.
+    manifest_file : str, optional
+        The name of the JSON manifest written in `output_dir`. Default is "manifest.json".
+    **options
+        The other arguments of `summarize`, used for every dataset (e.g., `summarize_by="table"`).
+        The dataset name defaults to the key of the dataset. The charts of every report are rendered
+        in its worker (`render_workers=1`) unless `render_workers` is given.
+
+    Returns
+    -------
+    dict
+        The manifest: the time of the run, the number of failures, the total wall time and one entry
+        per dataset, in the order of `datasets`, with its status ("ok" or "failed"), output path,
+        wall time, the error and traceback of a failure and, with `profile=True`, the stage timings.
+
+    Examples
+    --------
+    >>> manifest = summarize_batch({"sales": "sales.parquet", "users": users_df}, output_dir="reports/",
+    ...                            max_workers=4, summarize_by="table")
+    >>> [entry["name"] for entry in manifest["datasets"] if entry["status"] == "failed"]
+    """
+    from summarease.accumulators import is_streamable_source
+    import pandas as pd
+
+    assert isinstance(datasets, dict), f"Argument 'datasets' should be a dictionary! You have {type(datasets)}."
+    for name, dataset in datasets.items():
+        assert isinstance(dataset, pd.DataFrame) or (isinstance(dataset, (str, Path)) and is_streamable_source(dataset)), \
+            f"Every dataset should be a pandas dataframe (pd.DataFrame) or a CSV/Parquet file path! You have {type(dataset)} for '{name}'."
+    file_names = [report_file_name(name) for name in datasets]
+    assert len(set(file_names)) == len(file_names), "The dataset names should give distinct report file names!"
+    if max_workers is not None:
+        assert isinstance(max_workers, int) and max_workers > 0, f"Argument 'max_workers' should be a positive integer! You have {max_workers}."
+    assert isinstance(manifest_file, str), f"Argument 'manifest_file' should be a string (str)! You have {type(manifest_file)}."
+    assert not {"output_file", "output_dir"} & set(options), "The reports are written to 'output_dir', named after the datasets!"
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Every report renders its charts in its own worker, rather than starting a pool per report
+    options = {"render_workers": 1, **options}
+
+    start = time.perf_counter()
+    n_workers = min(max_workers or os.cpu_count() or 1, len(datasets))
+    if n_workers <= 1:
+        entries = {name: _summarize_one(name, dataset, output_dir, options) for name, dataset in datasets.items()}
+    else:
+        entries, broken = _summarize_in_pool(datasets, output_dir, options, n_workers)
+        if broken:
+            # Isolate the crash: every dataset of the broken pool is retried in a process of its own
+            with ThreadPoolExecutor(max_workers=min(n_workers, len(broken))) as threads:
+                retried = threads.map(lambda name: _summarize_isolated(name, datasets[name], output_dir, options), broken)
+                entries.update(zip(broken, retried))
+
+    results = [entries[name] for name in datasets]
+    manifest = {
+        "version": MANIFEST_FORMAT_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "n_datasets": len(results),
+        "n_failed": sum(entry["status"] == "failed" for entry in results),
+        "max_workers": n_workers,
+        "wall_time": time.perf_counter() - start,
+        "datasets": results,
+    }
+    (output_dir / manifest_file).write_text(json.dumps(manifest, indent=2, default=str))
+    return manifest
@@ -0,0 +1,190 @@
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+from summarease.sketches import KLLSketch
+
+DEFAULT_QUANTILE_ERROR = 0.01
+STATS_COLUMNS = ['dtype', 'is_numeric', 'count', 'nulls', 'sum', 'm2', 'min', 'max', '25%', '50%', '75%', 'n_unique']
+DESCRIBE_INDEX = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+@dataclass
+class DatasetStats:
+    """
+    Column statistics of a dataset, computed once and shared by every summarizer.
+
+    Attributes
+    ----------
+    columns : pd.DataFrame
+        One row per column of the dataset with the columns listed in `STATS_COLUMNS`. `m2` is the
+        sum of squared deviations from the mean. The numeric statistics are missing for
+        non-numeric columns, and the cardinality `n_unique` for the columns without value counts.
+    value_counts : dict
+        Maps the names of the columns requested with `value_counts_for` to their value counts
+        (missing values excluded).
+    n_rows : int
+        The number of rows of the dataset.
+    correlation : pd.DataFrame, optional
+        The correlation matrix of the numeric columns, if it was accumulated with the statistics
+        (see `CoMomentsAccumulator`).
+    """
+    columns: pd.DataFrame
+    value_counts: dict = field(default_factory=dict)
+    n_rows: int = 0
+    correlation: pd.DataFrame = None
+
+    @property
+    def numeric_columns(self):
+        """The names of the numeric columns, in dataset order."""
+        return self.columns.index[self.columns['is_numeric'].astype(bool)].tolist()
+
+    def select(self, columns):
+        """Return the statistics of a subset of the columns."""
+        columns = list(columns)
+        value_counts = {col: counts for col, counts in self.value_counts.items() if col in columns}
+        correlation = None
+        if self.correlation is not None:
+            numeric_columns = [col for col in columns if col in self.correlation.index]
+            correlation = self.correlation.loc[numeric_columns, numeric_columns]
+        return DatasetStats(columns=self.columns.loc[columns], value_counts=value_counts, n_rows=self.n_rows,
+                            correlation=correlation)
+
+
+def is_summarizable_numeric(dtype):
+    """
+    Return True if columns of this dtype are summarized as numeric (real numbers, booleans excluded).
+    """
+    return (pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+            and not pd.api.types.is_complex_dtype(dtype))
+
+
+def select_columns(dataset: pd.DataFrame, columns) -> pd.DataFrame:
+    """
+    Return a DataFrame holding the given columns of a dataset, without copying their values.
+
+    Unlike `dataset[columns]`, which copies the selected columns, the new DataFrame shares the
+    memory of the columns of `dataset`. It must not be modified in place.
+    """
+    positions = dataset.columns.get_indexer_for(list(columns))
+    if len(positions) == 0:
+        return dataset.iloc[:, []]
+    return pd.concat([dataset.iloc[:, position] for position in positions], axis=1, copy=False)
+
+
+def _numeric_column_stats(series, quantile_error=None):
+    """
+    Compute the numeric statistics of a single column with one materialization of its values.
+    """
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+
+    if values.size == 0:
+        return {'sum': 0.0, 'm2': 0.0, 'min': np.nan, 'max': np.nan,
+                '25%': np.nan, '50%': np.nan, '75%': np.nan}
+
+    total = values.sum()
+    deviations = values - total / values.size
+    if quantile_error is None:
+        q25, q50, q75 = np.quantile(values, [0.25, 0.5, 0.75])
+    else:
+        q25, q50, q75 = KLLSketch(epsilon=quantile_error).update(values).quantiles([0.25, 0.5, 0.75])
+    return {'sum': total, 'm2': np.dot(deviations, deviations), 'min': values.min(), 'max': values.max(),
+            '25%': q25, '50%': q50, '75%': q75}
+
+
+def compute_column_stats(dataset: pd.DataFrame, value_counts_for=None, quantile_error: float = None) -> DatasetStats:
+    """
+    Compute the count, missing values, sum, sum of squared deviations, min, max and quartiles of
+    every column of a dataset in a single pass per column.
+
+    Parameters
+    ----------
+    dataset : pd.DataFrame
+        The dataset to analyze.
+    value_counts_for : list of str, optional
+        Columns for which the value counts are kept as well (e.g., the target variable). The
+        cardinality of these columns is derived from their value counts. It is not computed for
+        the other columns, as counting the distinct values of every column is costly.
+    quantile_error : float, optional
+        If given, the quartiles are estimated with a KLL sketch (see `KLLSketch`) with this
+        normalized rank error instead of being computed exactly.
+
+    Returns
+    -------
+    DatasetStats
+        The column statistics of the dataset.
+
+    Examples
+    --------
+    >>> stats = compute_column_stats(df, value_counts_for=["target"])
+    >>> describe_from_stats(stats)
+    """
+    assert isinstance(dataset, pd.DataFrame), f"Argument 'dataset' should be pandas dataframe (pd.DataFrame)! You have {type(dataset)}."
+    value_counts_for = [] if value_counts_for is None else list(value_counts_for)
+    missing_columns = set(value_counts_for) - set(dataset.columns)
+    if missing_columns:
+        raise KeyError(f"Columns not found in the dataset: {sorted(missing_columns, key=str)}")
+
+    n_rows = len(dataset)
+    rows = []
+    value_counts = {}
+
+    for position, col in enumerate(dataset.columns):
+        series = dataset.iloc[:, position]
+        nulls = int(series.isna().sum())
+        row = {'dtype': str(series.dtype), 'is_numeric': is_summarizable_numeric(series.dtype),
+               'count': n_rows - nulls, 'nulls': nulls}
+
+        if row['is_numeric']:
+            row.update(_numeric_column_stats(series, quantile_error=quantile_error))
+
+        if col in value_counts_for:
+            value_counts[col] = series.value_counts(dropna=True)
+            row['n_unique'] = len(value_counts[col])
+
+        rows.append(row)
+
+    columns = pd.DataFrame(rows, index=dataset.columns, columns=STATS_COLUMNS)
+    return DatasetStats(columns=columns, value_counts=value_counts, n_rows=n_rows)
+
+
+def describe_from_stats(stats: DatasetStats, columns=None) -> pd.DataFrame:
+    """
+    Build a `DataFrame.describe()`-style table from precomputed column statistics.
+
+    Parameters
+    ----------
+    stats : DatasetStats
+        The output of `compute_column_stats`.
+    columns : list of str, optional
+        The numeric columns to describe. If None, every numeric column is described.
+
+    Returns
+    -------
+    pd.DataFrame
+        A table indexed by ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'] with one
+        column per numeric column, laid out like `DataFrame.describe()`.
+    """
+    assert isinstance(stats, DatasetStats), f"Argument 'stats' should be a DatasetStats object! You have {type(stats)}."
+    columns = stats.numeric_columns if columns is None else list(columns)
+
+    table = stats.columns.loc[columns]
+    count = table['count'].astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = table['sum'].astype(np.float64) / count.where(count > 0)
+        std = np.sqrt(table['m2'].astype(np.float64) / (count - 1).where(count > 1))
+
+    described = pd.DataFrame({
+        'count': count,
+        'mean': mean,
+        'std': std,
+        'min': table['min'],
+        '25%': table['25%'],
+        '50%': table['50%'],
+        '75%': table['75%'],
+        'max': table['max'],
+    }).astype(np.float64).T
+
+    described.index = DESCRIBE_INDEX
+    return described
@@ -0,0 +1,221 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+def fingerprint(dataset, n_blocks: int = 8, block_rows: int = 1024) -> str:
+    """
+    Return a fast content fingerprint of a DataFrame.
+
+    The fingerprint hashes the shape, the column names, the dtypes and, with
+    `pd.util.hash_pandas_object`, the values and index of `n_blocks` evenly spaced blocks of
+    `block_rows` rows (the first and last rows included). Frames small enough are hashed entirely.
+
+    Parameters
+    ----------
+    dataset : pd.DataFrame
+        The dataset to fingerprint.
+    n_blocks : int, optional
+        The number of blocks of rows hashed. If None, every row is hashed. Default is 8.
+    block_rows : int, optional
+        The number of rows of every block. Default is 1024.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest of the dataset.
+
+    Notes
+    -----
+    Only the sampled rows are hashed, so a change outside of them that keeps the shape and dtypes
+    goes unnoticed. Use `n_blocks=None` when every change matters.
+    """
+    # Imported here so the render workers, which import this module, don't load pandas
+    import numpy as np
+    import pandas as pd
+    assert isinstance(dataset, pd.DataFrame), f"Argument 'dataset' should be pandas dataframe (pd.DataFrame)! You have {type(dataset)}."
+
+    n_rows = len(dataset)
+    if n_blocks is None or n_rows <= n_blocks * block_rows:
+        sample = dataset
+    else:
+        starts = np.linspace(0, n_rows - block_rows, n_blocks).astype(np.int64)
+        sample = dataset.iloc[(starts[:, None] + np.arange(block_rows)).ravel()]
+
+    digest = hashlib.sha256()
+    digest.update(repr((dataset.shape, list(map(str, dataset.columns)), list(map(str, dataset.dtypes)))).encode())
+    try:
+        hashes = pd.util.hash_pandas_object(sample, index=True)
+    except TypeError:
+        # Unhashable values (e.g., lists) are hashed through their string representation
+        hashes = pd.util.hash_pandas_object(sample.astype(str), index=True)
+    digest.update(hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def evict_least_recently_used(directory, pattern, max_bytes):
+    """
+    Delete the least recently used (oldest modification time) files matching `pattern` in
+    `directory` until their total size is at most `max_bytes`.
+    """
+    entries = []
+    for path in Path(directory).glob(pattern):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+class SummaryCache:
+    """
+    Memoization of computed statistics and chart specifications, keyed by dataset fingerprints.
+
+    Values are pickled, so the cached objects can't be modified through the returned ones. They are
+    kept in memory in a size-bounded LRU and, if `cache_dir` is given, on disk as well, where they
+    outlive the process. The least recently used values are evicted first. The cache can be shared
+    by threads, e.g. the sections of `summarize_async`.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        The maximum size of the pickled values kept in memory. Default is 256 MB.
+    cache_dir : str or Path, optional
+        A directory where the values are saved as well. Only use directories you trust, the files
+        are unpickled.
+    max_disk_bytes : int, optional
+        The maximum size of the values saved in `cache_dir`. Default is 1 GB.
+
+    Attributes
+    ----------
+    hits, misses : int
+        The number of values found in the cache, in memory or on disk, and computed.
+    disk_hits : int
+        The number of hits read from `cache_dir`.
+
+    Examples
+    --------
+    >>> cache = SummaryCache(cache_dir="~/.cache/summarease")
+    >>> summarize(df, summarize_by="table", cache=cache)
+    >>> summarize(df, summarize_by="plot", cache=cache)  # The column statistics are reused
+    >>> cache.hits, cache.misses
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 ** 2, cache_dir=None, max_disk_bytes: int = 1024 ** 3):
+        assert isinstance(max_bytes, int) and max_bytes > 0, f"Argument 'max_bytes' should be a positive integer! You have {max_bytes}."
+        assert isinstance(max_disk_bytes, int) and max_disk_bytes > 0, f"Argument 'max_disk_bytes' should be a positive integer! You have {max_disk_bytes}."
+        assert cache_dir is None or isinstance(cache_dir, (str, Path)), f"Argument 'cache_dir' should be a string or a Path! You have {type(cache_dir)}."
+
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.cache_dir = None if cache_dir is None else Path(cache_dir).expanduser()
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    @staticmethod
+    def key(*parts):
+        """
+        Return the cache key of a tuple of parts, e.g. (kind, dataset fingerprint, parameters).
+        """
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.pkl"
+
+    def _remember(self, key, data):
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def get(self, key, default=None):
+        """
+        Return the cached value of `key`, or `default` if it is not cached.
+        """
+        with self._lock:
+            data = self._get_bytes(key)
+        if data is None:
+            return default
+        return pickle.loads(data)
+
+    def _get_bytes(self, key):
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+        elif self.cache_dir is not None:
+            try:
+                data = self._path(key).read_bytes()
+                os.utime(self._path(key))
+            except FileNotFoundError:
+                data = None
+            if data is not None:
+                self.disk_hits += 1
+                self._remember(key, data)
+
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    def put(self, key, value):
+        """
+        Cache `value` under `key`, evicting the least recently used values if needed.
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, data)
+            if self.cache_dir is not None:
+                self._path(key).write_bytes(data)
+                evict_least_recently_used(self.cache_dir, "*.pkl", self.max_disk_bytes)
+        return value
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value of `key`, or compute, cache and return it.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        """
+        Remove every value, from memory and from `cache_dir`.
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self.cache_dir is not None:
+                for path in self.cache_dir.glob("*.pkl"):
+                    path.unlink(missing_ok=True)
+
+    def __getstate__(self):
+        # The lock can't be pickled, e.g. to send the cache to a worker process
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,167 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+import numpy as np
+from summarease.accumulators import (CSV_SUFFIXES, PARQUET_SUFFIXES, DatasetAccumulator, iter_dataset_chunks,
+                                     list_dataset_files)
+
+PARTITION_MODES = {"row_group", "file"}
+
+
+def is_partitionable_source(source):
+    """
+    Return True if `source` is a CSV/Parquet file path, a directory of such files or a list of file paths.
+    """
+    if isinstance(source, (str, Path)):
+        return Path(source).is_dir() or Path(source).suffix.lower() in CSV_SUFFIXES | PARQUET_SUFFIXES
+    return isinstance(source, (list, tuple)) and len(source) > 0 and all(
+        isinstance(path, (str, Path)) and Path(path).suffix.lower() in CSV_SUFFIXES | PARQUET_SUFFIXES for path in source)
+
+
+def list_partitions(source, partition_by: str = "row_group"):
+    """
+    Split a dataset stored in files into partitions that can be summarized independently.
+
+    Parameters
+    ----------
+    source : str, Path or list of str
+        The path of a CSV or Parquet file, of a directory of such files (see `list_dataset_files`),
+        or a list of file paths.
+    partition_by : str, optional
+        "row_group" (default) makes a partition of every row group of the Parquet files and of
+        every CSV file. "file" makes a partition of every file.
+
+    Returns
+    -------
+    list of tuple of (str, tuple of int or None)
+        The partitions, in the order of the rows: the path of a file and the indices of its row
+        groups, or None for the whole file. Only the metadata of the Parquet files is read.
+
+    Examples
+    --------
+    >>> list_partitions("events/")
+    [('events/day=1/part-0.parquet', (0,)), ('events/day=1/part-0.parquet', (1,)), ...]
+    """
+    assert is_partitionable_source(source), f"Argument 'source' should be a CSV/Parquet file path, a directory or a list of file paths! You have {source}."
+    assert partition_by in PARTITION_MODES, f"Argument 'partition_by' should be one of the following options: [row_group, file]! You have {partition_by}."
+
+    if isinstance(source, (str, Path)):
+        files = list_dataset_files(source) if Path(source).is_dir() else [Path(source)]
+    else:
+        files = [Path(path) for path in source]
+    assert files, f"No CSV or Parquet file was found in {source}!"
+
+    partitions = []
+    for path in files:
+        if partition_by == "row_group" and path.suffix.lower() in PARQUET_SUFFIXES:
+            import pyarrow.parquet as pq
+            n_row_groups = pq.ParquetFile(path).metadata.num_row_groups
+            partitions.extend((str(path), (row_group,)) for row_group in range(n_row_groups))
+        else:
+            partitions.append((str(path), None))
+    return partitions
+
+
+def iter_partition_chunks(partition, chunksize: int = 100_000):
+    """
+    Iterate over the rows of a partition (see `list_partitions`) in chunks of rows.
+    """
+    path, row_groups = partition
+    if row_groups is None:
+        yield from iter_dataset_chunks(path, chunksize=chunksize)
+        return
+
+    import pyarrow.parquet as pq
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, row_groups=list(row_groups)):
+        yield batch.to_pandas()
+
+
+def _accumulate_partition(partition, seed, options, chunksize):
+    """
+    Accumulate the partial summary of one partition, in a worker process.
+    """
+    accumulator = DatasetAccumulator(**options, seed=seed)
+    for chunk in iter_partition_chunks(partition, chunksize=chunksize):
+        accumulator.update(chunk)
+    return accumulator
+
+
+def accumulate_partitions(source, value_counts_for=None, quantile_error: float = None, heavy_hitters: int = None,
+                          co_moments: bool = True, partition_by: str = "row_group", max_workers: int = None,
+                          chunksize: int = 100_000, seed: int = 0) -> DatasetAccumulator:
+    """
+    Summarize a dataset stored in files partition by partition across a pool of worker processes,
+    and merge the partial summaries.
+
+    Every partition (see `list_partitions`) is read and folded into a `DatasetAccumulator` by a
+    worker: the moments, min and max, missing values, value counts, KLL quantile sketches and
+    co-moments of its columns. The partial summaries are merged in the order of the partitions, so
+    the result does not depend on the number of workers. The KLL sketch of every partition gets
+    its own seed, derived from `seed`, so the rank errors of the partitions are independent.
+
+    Parameters
+    ----------
+    source : str, Path or list of str
+        The path of a CSV or Parquet file, of a directory of such files, or a list of file paths.
+    value_counts_for : list of str, optional
+        Columns for which the value counts are accumulated as well (e.g., the target variable).
+    quantile_error : float, optional
+        The normalized rank error of the quartiles, estimated with KLL sketches. If None, the
+        quartiles are not tracked.
+    heavy_hitters : int, optional
+        If given, only the most frequent values of the `value_counts_for` columns are counted,
+        approximately, see `DatasetAccumulator`.
+    co_moments : bool, optional
+        Whether to accumulate the co-moments of the numeric columns, for their correlation matrix.
+        Default is True.
+    partition_by : str, optional
+        How the files are split, "row_group" (default) or "file", see `list_partitions`.
+    max_workers : int, optional
+        The maximum number of partitions summarized at the same time. If None, one per CPU. With 1,
+        the partitions are summarized one after another in the current process.
+    chunksize : int, optional
+        The number of rows read at a time from a partition. Default is 100,000.
+    seed : int, optional
+        The base seed of the KLL sketches of the partitions. Default is 0.
+
+    Returns
+    -------
+    DatasetAccumulator
+        The merged summary. Its `to_stats()` gives the statistics read by the summarizers, and it
+        can be saved as the summary state of the dataset.
+
+    Examples
+    --------
+    >>> stats = accumulate_partitions("events/", value_counts_for=["target"], quantile_error=0.01,
+    ...                               max_workers=8).to_stats()
+    >>> describe_from_stats(stats)
+    """
+    if max_workers is not None:
+        assert isinstance(max_workers, int) and max_workers > 0, f"Argument 'max_workers' should be a positive integer! You have {max_workers}."
+    assert isinstance(chunksize, int) and chunksize > 0, f"Argument 'chunksize' should be a positive integer! You have {chunksize}."
+
+    partitions = list_partitions(source, partition_by=partition_by)
+    options = dict(value_counts_for=value_counts_for, quantile_error=quantile_error, heavy_hitters=heavy_hitters,
+                   co_moments=co_moments)
+    accumulate = partial(_accumulate_partition, options=options, chunksize=chunksize)
+    seeds = np.random.SeedSequence(seed).spawn(len(partitions))
+
+    n_workers = min(max_workers or os.cpu_count() or 1, len(partitions))
+    if n_workers <= 1:
+        partials = map(accumulate, partitions, seeds)
+    else:
+        # Forked workers can deadlock in libraries holding locks (e.g., pyarrow), so they are spawned
+        pool = ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context("spawn"))
+        # Small partitions are sent to the workers in batches
+        partials = pool.map(accumulate, partitions, seeds, chunksize=max(1, len(partitions) // (4 * n_workers)))
+
+    merged = DatasetAccumulator(**options)
+    try:
+        for accumulator in partials:
+            merged.merge(accumulator)
+    finally:
+        if n_workers > 1:
+            pool.shutdown(cancel_futures=True)
+    return merged
@@ -0,0 +1,216 @@
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class StageTiming:
+    """
+    Resources used by one stage of a report.
+
+    Attributes
+    ----------
+    name : str
+        The name of the stage.
+    wall_time : float
+        The elapsed time in seconds.
+    cpu_time : float
+        The user and system CPU time in seconds, including the worker processes that ended during
+        the stage (e.g., the chart renderers).
+    peak_memory : int or None
+        The peak memory allocated by Python during the stage in bytes, above the memory allocated
+        when the stage started. None if memory tracing is disabled.
+    calls : int
+        The number of times the stage ran (e.g., once per chunk of columns). The times add up and
+        the peak memory is the maximum over the calls.
+    peak_rss : int or None
+        The peak resident set size of the process in bytes when the stage ended, i.e. the most
+        physical memory the process used up to then, including memory allocated outside of Python
+        (e.g., by NumPy or the chart renderer threads). None if it is not available on the platform.
+    """
+    name: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: int = None
+    calls: int = 0
+    peak_rss: int = None
+
+
+@dataclass
+class TimingReport:
+    """
+    The stages of a report, in the order they first ran.
+
+    Attributes
+    ----------
+    stages : list of StageTiming
+        The timings of the stages.
+    wall_time : float
+        The elapsed time of the whole report in seconds.
+    """
+    stages: list = field(default_factory=list)
+    wall_time: float = 0.0
+
+    def __getitem__(self, name):
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        raise KeyError(name)
+
+    def to_dict(self):
+        """Return the report as a JSON-serializable dictionary."""
+        return {"wall_time": self.wall_time, "stages": [asdict(stage) for stage in self.stages]}
+
+    def to_dataframe(self):
+        """Return the stages as a DataFrame indexed by the stage names."""
+        import pandas as pd
+        return pd.DataFrame([asdict(stage) for stage in self.stages]).set_index("name")
+
+
+def _cpu_time():
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _peak_rss():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, the other platforms kilobytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageProfiler:
+    """
+    Record the wall time, CPU time, peak memory and peak resident set size of the named stages of
+    a report.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        If False, the stages run without being measured. Default is True.
+    trace_memory : bool, optional
+        Trace the peak memory of every stage with `tracemalloc`. Tracing slows the allocations down,
+        and only covers the current process. Default is True.
+    callback : callable, optional
+        Called with the `StageTiming` of every call of a stage when it ends, e.g. to forward it to a
+        telemetry system as a span. The timing only covers that call (`calls` is 1).
+
+    Notes
+    -----
+    Stages can be measured from several threads, e.g. the sections of `summarize_async`. The CPU
+    time and the traced memory are measured for the whole process, so the stages running at the
+    same time share them.
+
+    Examples
+    --------
+    >>> profiler = StageProfiler(callback=print)
+    >>> with profiler.stage("column_stats"):
+    ...     stats = compute_column_stats(df)
+    >>> profiler.report().to_dataframe()
+    """
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = True, callback=None):
+        assert callback is None or callable(callback), f"Argument 'callback' should be callable! You have {type(callback)}."
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.callback = callback
+        self.stages = {}
+        # Every thread nests its own stages
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._start = None
+        self._end = None
+
+    def start(self):
+        """Start measuring the report, and start tracing the memory if needed."""
+        if self.enabled:
+            if self.trace_memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._start = time.perf_counter()
+        return self
+
+    def stop(self):
+        """Stop measuring the report, and stop tracing the memory if `start` started it."""
+        if self.enabled:
+            self._end = time.perf_counter()
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Measure the code run inside the `with` block as the stage `name`. Stages can be nested.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        if not hasattr(self._local, "open_peaks"):
+            self._local.open_peaks = []
+        open_peaks = self._local.open_peaks
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            # The enclosing stage keeps the peak reached so far, before the peak is reset
+            if open_peaks:
+                open_peaks[-1] = max(open_peaks[-1], peak)
+            tracemalloc.reset_peak()
+            open_peaks.append(current)
+            start_memory = current
+
+        start_wall, start_cpu = time.perf_counter(), _cpu_time()
+        try:
+            yield
+        finally:
+            timing = StageTiming(name, wall_time=time.perf_counter() - start_wall, cpu_time=_cpu_time() - start_cpu, calls=1,
+                                 peak_rss=_peak_rss())
+            if tracing:
+                peak = max(open_peaks.pop(), tracemalloc.get_traced_memory()[1])
+                timing.peak_memory = max(peak - start_memory, 0)
+                if open_peaks:
+                    open_peaks[-1] = max(open_peaks[-1], peak)
+                tracemalloc.reset_peak()
+            self._record(timing)
+
+    def _record(self, timing):
+        with self._lock:
+            total = self.stages.setdefault(timing.name, StageTiming(timing.name))
+            total.wall_time += timing.wall_time
+            total.cpu_time += timing.cpu_time
+            total.calls += 1
+            if timing.peak_memory is not None:
+                total.peak_memory = max(total.peak_memory or 0, timing.peak_memory)
+            if timing.peak_rss is not None:
+                total.peak_rss = max(total.peak_rss or 0, timing.peak_rss)
+        if self.callback is not None:
+            self.callback(timing)
+
+    def report(self):
+        """
+        Return the `TimingReport` of the stages measured so far.
+        """
+        end = self._end if self._end is not None else time.perf_counter()
+        wall_time = end - self._start if self._start is not None else 0.0
+        with self._lock:
+            stages = list(self.stages.values())
+        return TimingReport(stages=stages, wall_time=wall_time)
@@ -0,0 +1,475 @@
+import asyncio
+import hashlib
+import json
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# A worker process pays the cold start of vl-convert (seconds) before rendering its first chart
+# (tens of milliseconds), so it needs this many charts to be worth starting
+CHARTS_PER_WORKER = 40
+
+
+def chart_to_spec(chart):
+    """
+    Return the Vega-Lite specification of a chart as a dictionary.
+
+    Parameters
+    ----------
+    chart : alt.TopLevelMixin or dict
+        An Altair chart, or a Vega-Lite specification which is returned unchanged.
+
+    Returns
+    -------
+    dict
+        The Vega-Lite specification.
+    """
+    if isinstance(chart, dict):
+        return chart
+    import altair as alt
+    assert isinstance(chart, alt.TopLevelMixin), f"Argument 'chart' should be an Altair chart or a Vega-Lite specification (dict)! You have {type(chart)}."
+    return chart.to_dict()
+
+
+def render_spec(spec, scale: float = 1.0):
+    """
+    Rasterize a Vega-Lite specification to PNG bytes with vl-convert.
+
+    Parameters
+    ----------
+    spec : dict
+        The Vega-Lite specification.
+    scale : float, optional
+        The scale factor of the image. Default is 1.
+
+    Returns
+    -------
+    bytes
+        The PNG image.
+    """
+    import vl_convert as vlc
+    return vlc.vegalite_to_png(spec, scale=scale)
+
+
+def png_size(data):
+    """
+    Return the (width, height) in pixels of a PNG image, read from its header.
+
+    Parameters
+    ----------
+    data : bytes
+        The PNG image.
+
+    Returns
+    -------
+    tuple of int
+        The width and height of the image.
+
+    Raises
+    ------
+    ValueError
+        If `data` is not a PNG image.
+    """
+    if data[:8] != PNG_SIGNATURE or data[12:16] != b"IHDR":
+        raise ValueError("Not a PNG image.")
+    return struct.unpack(">II", data[16:24])
+
+
+def encode_png(pixels):
+    """
+    Encode an RGB image as PNG bytes, without filtering the rows.
+
+    Parameters
+    ----------
+    pixels : np.ndarray
+        An array of unsigned 8-bit integers of shape (height, width, 3).
+
+    Returns
+    -------
+    bytes
+        The PNG image.
+    """
+    assert getattr(pixels, "ndim", None) == 3 and pixels.shape[2] == 3 and pixels.dtype == "uint8", "Argument 'pixels' should be an array of uint8 of shape (height, width, 3)!"
+    height, width = pixels.shape[:2]
+    data = pixels.tobytes()
+    stride = 3 * width
+    # Every row starts with its filter type, 0 (None)
+    raw = b"".join(b"\x00" + data[row * stride:(row + 1) * stride] for row in range(height))
+
+    def chunk(kind, body):
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body) & 0xffffffff)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return PNG_SIGNATURE + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+
+
+class RenderCache:
+    """
+    On-disk, content-addressed cache of rendered chart images with LRU eviction.
+
+    Images are stored under a hash of the Vega-Lite specification and the render options, so a
+    chart whose specification did not change is never rendered twice. Every hit refreshes the
+    modification time of the image, and the least recently used images are evicted once the cache
+    grows over `max_bytes`.
+
+    The directory is scanned once, when the cache is opened. The sizes and the access order of the
+    images are then tracked in memory, so storing an image does not list the directory.
+
+    Parameters
+    ----------
+    cache_dir : str or Path
+        The directory of the cache. It is created if it does not exist.
+    max_bytes : int, optional
+        The maximum total size of the cached images. Default is 512 MB.
+
+    Examples
+    --------
+    >>> cache = RenderCache("~/.cache/summarease", max_bytes=100_000_000)
+    >>> render_charts(charts, cache=cache)
+    >>> cache.hits, cache.misses
+    """
+
+    def __init__(self, cache_dir, max_bytes: int = 512 * 1024 ** 2):
+        assert isinstance(cache_dir, (str, Path)), f"Argument 'cache_dir' should be a string or a Path! You have {type(cache_dir)}."
+        assert isinstance(max_bytes, int) and max_bytes > 0, f"Argument 'max_bytes' should be a positive integer! You have {max_bytes}."
+
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # The size of every image, from the least to the most recently used
+        self._sizes = OrderedDict()
+        self._total_bytes = 0
+        self._scan()
+
+    def _scan(self):
+        entries = []
+        for path in self.cache_dir.glob("*.png"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total_bytes += size
+
+    def _track(self, key, size):
+        self._total_bytes += size - self._sizes.pop(key, 0)
+        self._sizes[key] = size
+
+    @staticmethod
+    def key(spec, scale: float = 1.0):
+        """
+        Return the cache key of a specification rendered with the given options.
+        """
+        import vl_convert as vlc
+        payload = json.dumps({"spec": spec, "scale": scale, "vl_convert": vlc.__version__},
+                             sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(self, key):
+        """Return the path of the cached image of `key`."""
+        return self.cache_dir / f"{key}.png"
+
+    def get(self, key):
+        """
+        Return the cached image of `key` as PNG bytes, or None if it is not cached.
+        """
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted, e.g. by another process sharing the directory
+            self._total_bytes -= self._sizes.pop(key, 0)
+            self.misses += 1
+            return None
+        self._track(key, len(data))
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """
+        Store a rendered image (PNG bytes) and evict the least recently used images if needed.
+        """
+        path = self.path(key)
+        path.write_bytes(data)
+        self._track(key, len(data))
+        self.evict()
+        return path
+
+    def evict(self):
+        """
+        Delete the least recently used images until the cache fits in `max_bytes`.
+        """
+        while self._total_bytes > self.max_bytes and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self.path(key).unlink(missing_ok=True)
+            self._total_bytes -= size
+
+
+def render_jobs(jobs_file, output=None):
+    """
+    Render the charts listed in a jobs file, written by `render_charts` for a worker process.
+
+    The images are written to `output` (the standard output by default) as a sequence of frames,
+    each one being the 8-byte big-endian length of the image followed by its PNG bytes.
+
+    Parameters
+    ----------
+    jobs_file : str or Path
+        A JSON file holding a list of [spec, scale] items.
+    output : binary file, optional
+        The stream the frames are written to.
+    """
+    output = sys.stdout.buffer if output is None else output
+    with open(jobs_file) as file:
+        for spec, scale in json.load(file):
+            data = render_spec(spec, scale)
+            output.write(struct.pack(">Q", len(data)))
+            output.write(data)
+    output.flush()
+
+
+def _read_frames(stream):
+    """
+    Split the output of a worker process into the PNG images it rendered.
+    """
+    images = []
+    position = 0
+    while position < len(stream):
+        (size,) = struct.unpack(">Q", stream[position:position + 8])
+        images.append(stream[position + 8:position + 8 + size])
+        position += 8 + size
+    return images
+
+
+def render_charts(charts, max_workers: int = None, scale: float = 1.0, cache: RenderCache = None):
+    """
+    Rasterize several charts to PNG images in memory, in parallel across a pool of worker processes
+    if there are enough of them.
+
+    vl-convert holds the GIL while it renders, so the charts are split across worker processes
+    that render their share concurrently and stream the images back through a pipe. The result
+    keeps the order of `charts`, whatever the order in which the renders finish. Starting a worker
+    costs the cold start of vl-convert, much longer than rendering a chart in a process where it
+    is already running, so by default small reports are rendered in the current process.
+
+    Parameters
+    ----------
+    charts : dict
+        Maps the chart names to Altair charts or Vega-Lite specifications.
+    max_workers : int, optional
+        The number of worker processes. If None, one per `CHARTS_PER_WORKER` charts to render, up to
+        one per CPU, so reports of fewer charts are rendered in the current process. With 1, or a
+        single chart, the charts are rendered one after another in the current process.
+    scale : float, optional
+        The scale factor of the images. Default is 1.
+    cache : RenderCache, optional
+        A cache of rendered images. Charts found in the cache are read from it instead of being
+        rendered, and the newly rendered charts are added to it.
+
+    Returns
+    -------
+    dict
+        Maps the chart names to their PNG images (bytes), in the order of `charts`.
+
+    Raises
+    ------
+    RuntimeError
+        If a worker process fails.
+
+    Notes
+    -----
+    The workers are started with `subprocess` rather than `multiprocessing`: forking a process
+    whose vl-convert runtime is already running can deadlock the child.
+
+    Examples
+    --------
+    >>> images = render_charts({"numeric_plot": chart_1, "corr_plot": chart_2}, max_workers=2)
+    >>> png_size(images["numeric_plot"])
+    """
+    assert isinstance(charts, dict), f"Argument 'charts' should be a dictionary! You have {type(charts)}."
+    if max_workers is not None:
+        assert isinstance(max_workers, int) and max_workers > 0, f"Argument 'max_workers' should be a positive integer! You have {max_workers}."
+
+    if cache is not None:
+        assert isinstance(cache, RenderCache), f"Argument 'cache' should be a RenderCache! You have {type(cache)}."
+
+    images, jobs, cache_keys = _plan_renders(charts, scale, cache)
+    rendered = _render_jobs_in_parallel([spec for _, spec in jobs], max_workers, scale)
+    return _store_renders(images, jobs, rendered, cache, cache_keys)
+
+
+async def render_charts_async(charts, max_workers: int = None, scale: float = 1.0, cache: RenderCache = None):
+    """
+    Rasterize several charts to PNG images in worker processes, without blocking the event loop.
+
+    The asynchronous variant of `render_charts`: the charts are always rendered by worker processes,
+    at least one, whose output is read by the event loop. If the task is cancelled
+    (e.g., by `asyncio.wait_for` on a timeout), the workers are killed.
+
+    Parameters
+    ----------
+    charts : dict
+        Maps the chart names to Altair charts or Vega-Lite specifications.
+    max_workers : int, optional
+        The number of worker processes. If None, one per `CHARTS_PER_WORKER` charts to render, up to
+        one per CPU.
+    scale : float, optional
+        The scale factor of the images. Default is 1.
+    cache : RenderCache, optional
+        A cache of rendered images, see `render_charts`.
+
+    Returns
+    -------
+    dict
+        Maps the chart names to their PNG images (bytes), in the order of `charts`.
+
+    Raises
+    ------
+    RuntimeError
+        If a worker process fails.
+
+    Examples
+    --------
+    >>> images = await asyncio.wait_for(render_charts_async(charts, max_workers=2), timeout=30)
+    """
+    assert isinstance(charts, dict), f"Argument 'charts' should be a dictionary! You have {type(charts)}."
+    if max_workers is not None:
+        assert isinstance(max_workers, int) and max_workers > 0, f"Argument 'max_workers' should be a positive integer! You have {max_workers}."
+    if cache is not None:
+        assert isinstance(cache, RenderCache), f"Argument 'cache' should be a RenderCache! You have {type(cache)}."
+
+    images, jobs, cache_keys = _plan_renders(charts, scale, cache)
+    rendered = await _render_jobs_async([spec for _, spec in jobs], max_workers, scale)
+    return _store_renders(images, jobs, rendered, cache, cache_keys)
+
+
+def _plan_renders(charts, scale, cache):
+    """
+    Read the cached images, and return the images found, the (name, spec) jobs left to render and the
+    cache keys of the charts.
+    """
+    images = dict.fromkeys(charts)
+    jobs = []
+    cache_keys = {}
+
+    for name, chart in charts.items():
+        spec = chart_to_spec(chart)
+        if cache is not None:
+            cache_keys[name] = cache.key(spec, scale)
+            images[name] = cache.get(cache_keys[name])
+            if images[name] is not None:
+                continue
+        jobs.append((name, spec))
+    return images, jobs, cache_keys
+
+
+def _store_renders(images, jobs, rendered, cache, cache_keys):
+    """
+    Add the rendered images to the images found in the cache, and to the cache.
+    """
+    for (name, _), data in zip(jobs, rendered):
+        images[name] = data
+        if cache is not None:
+            cache.put(cache_keys[name], data)
+
+    return images
+
+
+def _write_worker_jobs(specs, n_workers, scale, jobs_dir):
+    """
+    Deal the specifications round-robin to `n_workers` jobs files, so every worker gets a similar share
+    of the report, and return the commands of the workers and their environment.
+    """
+    # Make the package importable by the workers, even when it is not installed
+    package_root = str(Path(__file__).resolve().parents[1])
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [package_root, os.environ.get("PYTHONPATH")]))}
+
+    commands = []
+    for worker_index in range(n_workers):
+        jobs_file = Path(jobs_dir) / f"jobs_{worker_index}.json"
+        jobs_file.write_text(json.dumps([[spec, scale] for spec in specs[worker_index::n_workers]]))
+        commands.append([sys.executable, "-m", "summarease.rendering", str(jobs_file)])
+    return commands, env
+
+
+def _collect_worker_outputs(outputs, n_workers, n_specs):
+    """
+    Check the (returncode, stdout, stderr) of the workers and undo the round-robin split of their images.
+    """
+    for returncode, _, stderr in outputs:
+        if returncode != 0:
+            raise RuntimeError(f"Rendering the charts failed: {stderr.decode(errors='replace')}")
+
+    images = [None] * n_specs
+    for worker_index, (_, stdout, _) in enumerate(outputs):
+        images[worker_index::n_workers] = _read_frames(stdout)
+    return images
+
+
+def default_render_workers(n_charts):
+    """
+    Return the number of worker processes rendering `n_charts` charts by default: one per
+    `CHARTS_PER_WORKER` charts, at least one and at most one per CPU.
+    """
+    return max(1, min(os.cpu_count() or 1, n_charts // CHARTS_PER_WORKER))
+
+
+def _render_jobs_in_parallel(specs, max_workers, scale):
+    """
+    Render a list of specifications to PNG bytes, splitting them across worker processes if needed.
+    """
+    n_workers = min(max_workers or default_render_workers(len(specs)), len(specs))
+
+    if n_workers <= 1:
+        return [render_spec(spec, scale) for spec in specs]
+
+    with tempfile.TemporaryDirectory() as jobs_dir:
+        commands, env = _write_worker_jobs(specs, n_workers, scale, jobs_dir)
+        workers = [subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+                   for command in commands]
+        communicated = [worker.communicate() for worker in workers]
+
+    outputs = [(worker.returncode, stdout, stderr) for worker, (stdout, stderr) in zip(workers, communicated)]
+    return _collect_worker_outputs(outputs, n_workers, len(specs))
+
+
+async def _render_jobs_async(specs, max_workers, scale):
+    """
+    Render a list of specifications to PNG bytes in worker processes, killing them if cancelled.
+    """
+    n_workers = min(max_workers or default_render_workers(len(specs)), len(specs))
+    if n_workers == 0:
+        return []
+
+    with tempfile.TemporaryDirectory() as jobs_dir:
+        commands, env = _write_worker_jobs(specs, n_workers, scale, jobs_dir)
+        workers = []
+        try:
+            for command in commands:
+                workers.append(await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE,
+                                                                    stderr=asyncio.subprocess.PIPE, env=env))
+            communicated = await asyncio.gather(*(worker.communicate() for worker in workers))
+        finally:
+            # On cancellation or failure, don't leave the workers running
+            for worker in workers:
+                if worker.returncode is None:
+                    worker.kill()
+                    await worker.wait()
+
+    outputs = [(worker.returncode, stdout, stderr) for worker, (stdout, stderr) in zip(workers, communicated)]
+    return _collect_worker_outputs(outputs, n_workers, len(specs))
+
+
+if __name__ == "__main__":
+    render_jobs(sys.argv[1])
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+SAMPLING_STRATEGIES = {"uniform", "stratified"}
+
+
+def allocate_sample(counts, n_rows: int):
+    """
+    Split a budget of `n_rows` rows between strata proportionally to their sizes.
+
+    Every stratum gets the floor of its proportional share, and the rows left are given to the
+    strata with the largest remainders, so the shares add up to `n_rows` and no stratum gets more
+    rows than it has.
+
+    Parameters
+    ----------
+    counts : array-like of int
+        The number of rows of every stratum.
+    n_rows : int
+        The total number of rows to sample, at most the sum of `counts`.
+
+    Returns
+    -------
+    np.ndarray
+        The number of rows to sample from every stratum.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    shares = counts * (n_rows / counts.sum())
+    allocation = np.floor(shares).astype(np.int64)
+    remainders = np.argsort(-(shares - allocation), kind="stable")[:n_rows - allocation.sum()]
+    allocation[remainders] += 1
+    return np.minimum(allocation, counts)
+
+
+def sample_rows(dataset: pd.DataFrame, max_rows: int, strategy: str = "uniform", stratify_by: str = None, seed: int = 0):
+    """
+    Sample at most `max_rows` rows of a dataset, keeping their order, for the charts.
+
+    Every row gets a random key and the rows with the smallest keys are kept, which draws a uniform
+    sample without replacement like a reservoir. With the "stratified" strategy, the budget is split
+    between the values of `stratify_by` proportionally to their frequencies (see `allocate_sample`)
+    and every stratum is sampled the same way, so the proportions of the classes are kept. Missing
+    values form a stratum of their own.
+
+    Parameters
+    ----------
+    dataset : pd.DataFrame
+        The dataset to sample.
+    max_rows : int
+        The row budget. Datasets with at most `max_rows` rows are returned unchanged.
+    strategy : str, optional
+        "uniform" (default) or "stratified".
+    stratify_by : str, optional
+        The column whose classes are kept in proportion, required with `strategy="stratified"`
+        (e.g., the target variable).
+    seed : int, optional
+        The seed of the random keys, so the same sample is drawn every time. Default is 0.
+
+    Returns
+    -------
+    tuple of (pd.DataFrame, float)
+        The sampled rows and the sampling rate, the fraction of the rows kept.
+
+    Examples
+    --------
+    >>> sample, rate = sample_rows(df, max_rows=50_000, strategy="stratified", stratify_by="target")
+    """
+    assert isinstance(dataset, pd.DataFrame), f"Argument 'dataset' should be pandas dataframe (pd.DataFrame)! You have {type(dataset)}."
+    assert isinstance(max_rows, int) and max_rows > 0, f"Argument 'max_rows' should be a positive integer! You have {max_rows}."
+    assert strategy in SAMPLING_STRATEGIES, f"Argument 'strategy' should be one of the following options: [uniform, stratified]! You have {strategy}."
+    if strategy == "stratified":
+        assert stratify_by in dataset.columns, f"Argument 'stratify_by' should be a column of the dataset for stratified sampling! You have {stratify_by}."
+
+    n_rows = len(dataset)
+    if n_rows <= max_rows:
+        return dataset, 1.0
+
+    keys = np.random.default_rng(seed).random(n_rows)
+    if strategy == "uniform":
+        selected = np.argpartition(keys, max_rows - 1)[:max_rows]
+    else:
+        codes, _ = pd.factorize(dataset[stratify_by], use_na_sentinel=False)
+        allocation = allocate_sample(np.bincount(codes), max_rows)
+        # Order the rows by stratum and key, and keep the first rows of every stratum
+        order = np.lexsort((keys, codes))
+        sorted_codes = codes[order]
+        starts = np.searchsorted(sorted_codes, np.arange(len(allocation)))
+        rank = np.arange(n_rows) - starts[sorted_codes]
+        selected = order[rank < allocation[sorted_codes]]
+
+    sample = dataset.iloc[np.sort(selected)]
+    return sample, len(sample) / n_rows
+
+
+def describe_sampling(n_sampled: int, n_rows: int, strategy: str = "uniform", stratify_by: str = None):
+    """
+    Return the sentence stating the sampling rate of the numeric plots of a report.
+
+    Only the plots of the numeric columns are drawn from the sample, the tables and the target and
+    missing values sections use every row.
+    """
+    method = f"a sample stratified by '{stratify_by}'" if strategy == "stratified" else "a uniform random sample"
+    return (f"The plots of the numeric columns are drawn from {method} of {n_sampled:,} of the {n_rows:,} rows "
+            f"(sampling rate {n_sampled / n_rows:.2%}), so they are approximate. The tables and the target and "
+            f"missing values sections use every row.")
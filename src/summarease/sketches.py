@@ -0,0 +1,166 @@
+import math
+import numpy as np
+import pandas as pd
+
+
+def kll_k_for_error(epsilon: float) -> int:
+    """
+    Return the smallest KLL parameter `k` whose normalized rank error is at most `epsilon`.
+
+    Uses the empirical error model of the Apache DataSketches KLL sketch,
+    epsilon ~ 2.296 / k^0.9723.
+
+    Parameters
+    ----------
+    epsilon : float
+        The normalized rank error, between 0 and 1 (e.g., 0.01 for 1%).
+
+    Returns
+    -------
+    int
+        The parameter `k` of the sketch.
+    """
+    assert isinstance(epsilon, (int, float)) and 0 < epsilon < 1, f"Argument 'epsilon' should be a number between 0 and 1! You have {epsilon}."
+    return max(8, math.ceil((2.296 / epsilon) ** (1 / 0.9723)))
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch (Karnin, Lang and Liberty) of a numeric column.
+
+    The sketch keeps a stack of compactors. Items at level `h` have a weight of 2**h, and a level
+    that overflows its capacity is compacted: its items are sorted and every other item is promoted
+    to the next level. The memory is O(k) and the rank error of a quantile is about `epsilon` (see
+    `kll_k_for_error`), independently of the number of values.
+
+    Parameters
+    ----------
+    k : int, optional
+        The capacity of the top compactor. Larger values are more accurate. Default is 200.
+    epsilon : float, optional
+        The target normalized rank error. If given, `k` is derived from it.
+    seed : int or np.random.SeedSequence, optional
+        The seed of the random compaction offsets, so sketches are reproducible. Default is 0.
+        Sketches of different partitions that are merged later should have independent seeds
+        (e.g., from `np.random.SeedSequence.spawn`), so their rank errors are independent.
+
+    Examples
+    --------
+    >>> sketch = KLLSketch(epsilon=0.01)
+    >>> sketch.update(df["col1"])
+    >>> sketch.merge(other_sketch)
+    >>> sketch.quantiles([0.25, 0.5, 0.75])
+    """
+    _decay = 2 / 3
+
+    def __init__(self, k: int = 200, epsilon: float = None, seed=0):
+        if epsilon is not None:
+            k = kll_k_for_error(epsilon)
+        assert isinstance(k, int) and k >= 8, f"Argument 'k' should be an integer of at least 8! You have {k}."
+
+        self.k = k
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        capacity = max(2, math.ceil(self.k * self._decay ** depth))
+        return capacity + capacity % 2
+
+    def update(self, values):
+        """
+        Add a batch of values to the sketch. Missing values are skipped.
+        """
+        values = pd.Series(values).to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+
+        self.count += values.size
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Merge another sketch, computed on a disjoint set of rows, into this one.
+        """
+        assert isinstance(other, KLLSketch), f"Argument 'other' should be a KLLSketch! You have {type(other)}."
+        if other.count == 0:
+            return self
+
+        self.k = min(self.k, other.k)
+        self.count += other.count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            capacity = self._capacity(level)
+            items = self.levels[level]
+            if items.size <= capacity:
+                level += 1
+                continue
+
+            if level == len(self.levels) - 1:
+                self.levels.append(np.empty(0, dtype=np.float64))
+                capacity = self._capacity(level)
+
+            # Compact every full block of `capacity` items at once: sort each block and promote
+            # the items at even or odd positions, chosen at random for every block
+            n_blocks = items.size // capacity
+            blocks = np.sort(items[:n_blocks * capacity].reshape(n_blocks, capacity), axis=1)
+            offsets = self._rng.integers(0, 2, size=n_blocks)
+            pairs = blocks.reshape(n_blocks, capacity // 2, 2)
+            promoted = pairs[np.arange(n_blocks), :, offsets].ravel()
+
+            self.levels[level] = items[n_blocks * capacity:]
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    @property
+    def n_retained(self):
+        """The number of items kept by the sketch."""
+        return sum(items.size for items in self.levels)
+
+    def quantiles(self, qs):
+        """
+        Estimate the quantiles of the values added to the sketch.
+
+        Parameters
+        ----------
+        qs : list of float
+            The quantiles to estimate, between 0 and 1.
+
+        Returns
+        -------
+        np.ndarray
+            The estimated quantiles, NaN if the sketch is empty. The quantiles 0 and 1 are the
+            exact min and max.
+        """
+        qs = np.asarray(qs, dtype=np.float64)
+        assert ((qs >= 0) & (qs <= 1)).all(), f"Argument 'qs' should be between 0 and 1! You have {qs}."
+        if self.count == 0:
+            return np.full(qs.shape, np.nan)
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(items.size, 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        values, cumulative = values[order], np.cumsum(weights[order])
+
+        positions = np.searchsorted(cumulative, qs * cumulative[-1], side='left')
+        estimates = values[np.clip(positions, 0, values.size - 1)]
+        estimates = np.where(qs == 0, self.min, estimates)
+        return np.where(qs == 1, self.max, estimates)
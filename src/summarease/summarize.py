@@ -1,10 +1,26 @@
+import asyncio
+import hashlib
+import inspect
+import threading
+import struct
+import zlib
+import numpy as np
 import pandas as pd
-from fpdf import FPDF
+from concurrent.futures import CancelledError
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from summarease.summarize_numeric import summarize_numeric
 from summarease.summarize_target import summarize_target_df, summarize_target_balance_plot
 from summarease.summarize_dtypes import summarize_dtypes_table
-from PIL import Image
+from summarease.summarize_missing import summarize_missing
+from summarease.column_stats import DEFAULT_QUANTILE_ERROR, compute_column_stats, select_columns
+from summarease.accumulators import DEFAULT_HEAVY_HITTERS, DatasetAccumulator, accumulate_stats, is_streamable_source
+from summarease.partitioned import accumulate_partitions, is_partitionable_source
+from summarease.rendering import PNG_SIGNATURE, RenderCache, png_size, render_charts, render_charts_async
+from summarease.profiling import StageProfiler
+from summarease.sampling import SAMPLING_STRATEGIES, describe_sampling, sample_rows
+from summarease.memoize import SummaryCache, fingerprint
 
 
 def validate_or_create_path(path):
@@ -38,6 +54,90 @@ def validate_or_create_path(path):
             
 
 
+def register_png(pdf, data):
+    """
+    Register a PNG image held in memory with a PDF document, so it can be placed with `pdf.image`
+    without being written to or read from a file.
+
+    The compressed image data is embedded as is. For images with an alpha channel, the color and
+    alpha channels are split with NumPy (FPDF splits them row by row in Python).
+
+    Parameters
+    ----------
+    pdf : FPDF
+        The PDF document.
+    data : bytes
+        The PNG image (8 bits per channel at most, not interlaced).
+
+    Returns
+    -------
+    str
+        The name to pass to `pdf.image`. The same image is only embedded once.
+
+    Raises
+    ------
+    ValueError
+        If `data` is not a PNG image FPDF can embed.
+    """
+    from fpdf import FPDF
+    assert isinstance(pdf, FPDF), f"Argument 'pdf' should be FPDF class. You have {type(pdf)}."
+    width, height = png_size(data)
+    name = "png:" + hashlib.sha1(data).hexdigest()
+    if name in pdf.images:
+        return name
+
+    bit_depth, color_type, _, _, interlace = struct.unpack(">BBBBB", data[24:29])
+    if bit_depth > 8:
+        raise ValueError("16-bit depth PNG images are not supported.")
+    if interlace != 0:
+        raise ValueError("Interlaced PNG images are not supported.")
+    color_spaces = {0: 'DeviceGray', 2: 'DeviceRGB', 3: 'Indexed', 4: 'DeviceGray', 6: 'DeviceRGB'}
+    if color_type not in color_spaces:
+        raise ValueError(f"Unknown PNG color type: {color_type}")
+
+    palette, transparency, idat = '', b"", []
+    position = len(PNG_SIGNATURE)
+    while position < len(data):
+        (length,) = struct.unpack(">I", data[position:position + 4])
+        chunk_type = data[position + 4:position + 8]
+        chunk = data[position + 8:position + 8 + length]
+        if chunk_type == b"PLTE":
+            palette = chunk
+        elif chunk_type == b"tRNS":
+            transparency = chunk
+        elif chunk_type == b"IDAT":
+            idat.append(chunk)
+        elif chunk_type == b"IEND":
+            break
+        position += length + 12
+
+    color_space = color_spaces[color_type]
+    colors = 3 if color_space == 'DeviceRGB' else 1
+    info = {'w': width, 'h': height, 'cs': color_space, 'bpc': bit_depth, 'f': 'FlateDecode',
+            'dp': f"/Predictor 15 /Colors {colors} /BitsPerComponent {bit_depth} /Columns {width}",
+            'pal': palette, 'trns': '', 'data': b"".join(idat), 'i': len(pdf.images) + 1}
+
+    if transparency and color_type == 0:
+        info['trns'] = [transparency[1]]
+    elif transparency and color_type == 2:
+        info['trns'] = [transparency[1], transparency[3], transparency[5]]
+    elif transparency and color_type == 3 and 0 in transparency:
+        info['trns'] = [transparency.index(0)]
+
+    if color_type >= 4:
+        # Every row starts with its filter byte. The filters work byte per channel, so the filtered
+        # color and alpha channels are split as they are and decoded by the PDF viewer.
+        rows = np.frombuffer(zlib.decompress(info['data']), dtype=np.uint8).reshape(height, -1)
+        pixels = rows[:, 1:].reshape(height, width, colors + 1)
+        info['data'] = zlib.compress(np.hstack([rows[:, :1], pixels[:, :, :colors].reshape(height, -1)]).tobytes())
+        info['smask'] = zlib.compress(np.hstack([rows[:, :1], pixels[:, :, colors]]).tobytes())
+        if pdf.pdf_version < '1.4':
+            pdf.pdf_version = '1.4'
+
+    pdf.images[name] = info
+    return name
+
+
 def add_image(pdf, image_path, pdf_height, pdf_width, element_padding=15):
     """
     Adds an image to a PDF document at the current y-position with consideration for page size 
@@ -47,8 +147,10 @@ def add_image(pdf, image_path, pdf_height, pdf_width, element_padding=15):
 
     Args:
         pdf: A FPDF object representing the PDF document to which the image will be added.
-        image_path (str or Path): The file path to the image to be added. It supports various image 
-                                  formats such as .jpg, .jpeg, .png, .gif, .bmp, .tiff, and .webp.
+        image_path (str, Path or bytes): The file path to the image to be added. It supports various image 
+                                  formats such as .jpg, .jpeg, .png, .gif, .bmp, .tiff, and .webp. 
+                                  A PNG image held in memory can be passed as bytes, its size is then 
+                                  read from its header and it is embedded without touching the disk.
         pdf_height (float): The total height of the PDF page in units consistent with the FPDF settings.
         pdf_width (float): The total width of the PDF page in units consistent with the FPDF settings.
         element_padding (int, optional): The padding (in units consistent with FPDF) to be applied between 
@@ -59,38 +161,43 @@ def add_image(pdf, image_path, pdf_height, pdf_width, element_padding=15):
 
     Notes:
         - The function checks if the image file exists and has a valid image extension.
+        - Images given as bytes are registered with `register_png`.
         - The image is scaled to fit within the page width, and if necessary, a new page is added.
         - The function assumes a DPI of 96 for the image size conversion from pixels to millimeters.
         - If the image height exceeds the remaining space on the current page, a new page is created before adding the image.
     """
+    from fpdf import FPDF
     assert isinstance(pdf, FPDF), f"Argument 'pdf' should be FPDF class. You have {type(pdf)}."
-    assert isinstance(image_path, Path) or isinstance(image_path, str), f"Argument 'image_path' should be a Path class or string. You have {type(image_path)}."
+    assert isinstance(image_path, (Path, str, bytes)), f"Argument 'image_path' should be a Path class or string. You have {type(image_path)}."
     assert isinstance(pdf_height, int) or isinstance(pdf_height, float), f"Argument 'pdf_height' should be an integer or float. You have {type(pdf_height)}."
     assert isinstance(pdf_width, int) or isinstance(pdf_height, float), f"Argument 'pdf_width' should be an integer or float. You have {type(pdf_width)}."
     assert isinstance(element_padding, int), f"Argument 'element_padding' should be an integer. You have {type(element_padding)}."
 
-    image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}
-    image_path = Path(image_path)
-    assert image_path.suffix in image_extensions, f"Unsupported image format. Should be {image_extensions}"
-    image_path_str = str(image_path)
+    if isinstance(image_path, bytes):
+        _, image_height = png_size(image_path)
+        image_path_str = register_png(pdf, image_path)
+    else:
+        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}
+        image_path = Path(image_path)
+        assert image_path.suffix in image_extensions, f"Unsupported image format. Should be {image_extensions}"
+        image_path_str = str(image_path)
+
+        if not image_path.is_file():
+            raise ValueError(f"File not found: {image_path_str}")
+
+        from PIL import Image
+        with Image.open(image_path_str) as img:
+            _, image_height = img.size
+
     y_position = pdf.get_y()  
     page_height = pdf_height - 2 * pdf.t_margin
+    dpi = 96  
+    element_height_mm = image_height / dpi * 25.4
 
-    if not image_path.is_file():
-        raise ValueError(f"File not found: {image_path_str}")
-
-    if image_path.is_file():
-        # Check if the file has a valid image extension
-        if image_path.suffix.lower() in image_extensions:
-            with Image.open(image_path_str) as img:
-                _, image_height = img.size
-                dpi = 96  
-                element_height_mm = image_height / dpi * 25.4
-
-                if element_height_mm > page_height:
-                    scale_factor = page_height / element_height_mm
-                else:
-                    scale_factor = 1
+    if element_height_mm > page_height:
+        scale_factor = page_height / element_height_mm
+    else:
+        scale_factor = 1
     if y_position + element_height_mm > page_height:
         pdf.add_page()
 
@@ -105,6 +212,31 @@ def add_image(pdf, image_path, pdf_height, pdf_width, element_padding=15):
 
     return pdf
 
+def format_table_column(values):
+    """
+    Format the values of a table column as the strings displayed in its cells, one column at a time.
+
+    Args:
+        values (pandas.Series or pandas.Index): The values of the column.
+
+    Returns:
+        numpy.ndarray: The formatted values. Floating point values are rounded to 2 decimal places, 
+                       and the missing values of nullable columns (e.g., `Int64`) are shown as `<NA>`.
+    """
+    values = pd.Series(values)
+    dtype = values.dtype
+    if pd.api.types.is_float_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype):
+        return np.round(values.to_numpy(), 2).astype(str)
+    if pd.api.types.is_float_dtype(dtype):
+        formatted = np.round(values.to_numpy(dtype=np.float64, na_value=np.nan), 2).astype(str)
+        formatted[values.isna().to_numpy()] = str(pd.NA)
+        return formatted
+    if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        # Formatted as integers, not cast to float: nullable columns keep `<NA>`
+        return values.astype(str).to_numpy(dtype=str)
+    # Mixed or other types, formatted value by value
+    return np.array([str(round(value, 2)) if isinstance(value, (int, float)) else str(value) for value in values], dtype=str)
+
 def add_table(pdf, table, pdf_height, pdf_width, element_padding=15):
     """
     Adds a table to the PDF document with the provided data, scaling the column widths to fit 
@@ -113,8 +245,8 @@ def add_table(pdf, table, pdf_height, pdf_width, element_padding=15):
 
     Args:
         pdf: A FPDF object representing the PDF document to which the table will be added.
-        table (pandas.DataFrame): The table containing the data to be added. The first column 
-                                  (index) will be inserted as a new column in the table.
+        table (pandas.DataFrame): The table containing the data to be added. The index is added 
+                                  as the first column of the PDF table, `table` is not modified.
         pdf_height (float): The total height of the PDF page in units consistent with the FPDF settings.
         pdf_width (float): The total width of the PDF page in units consistent with the FPDF settings.
         element_padding (int, optional): The padding (in units consistent with FPDF) to be applied 
@@ -124,6 +256,8 @@ def add_table(pdf, table, pdf_height, pdf_width, element_padding=15):
         pdf: The updated FPDF object with the table added.
 
     Notes:
+        - The cells are formatted column by column (see `format_table_column`) before being emitted 
+          row by row, and the column widths are computed from the formatted values.
         - The function calculates the maximum column width based on the longest entry or column name, 
           scaling the column widths to fit the available page width while maintaining relative proportions.
         - The first row (header) is filled with a light gray background, and the first column (index) 
@@ -131,7 +265,9 @@ def add_table(pdf, table, pdf_height, pdf_width, element_padding=15):
         - Column names are truncated if they are too long to fit in the cell, and the font size is adjusted 
           accordingly for long column names.
         - Numeric values are rounded to 2 decimal places for consistency.
+        - Tables longer than a page continue on the next page, with the header repeated.
     """
+    from fpdf import FPDF
     assert isinstance(pdf, FPDF), f"Argument 'pdf' should be FPDF class. You have {type(pdf)}."
     assert isinstance(table, pd.DataFrame), f"Argument 'table' should be a pandas Dataframe. You have {type(table)}."
     assert isinstance(pdf_height, int) or isinstance(pdf_height, float), f"Argument 'pdf_height' should be an integer or float. You have {type(pdf_height)}."
@@ -139,74 +275,263 @@ def add_table(pdf, table, pdf_height, pdf_width, element_padding=15):
     assert isinstance(element_padding, int), f"Argument 'element_padding' should be an integer. You have {type(element_padding)}."
     assert not table.empty, f"The table shouldn't be empty"
 
+    row_height = 10
     pdf.set_font('Arial', '', 9)
-    
-    # Insert index as a new column (at the start)
-    table.insert(0, 'Index', table.index)
+
+    # Format every column at once, with the index as the first column
+    header = ['Index'] + [str(col) for col in table.columns]
+    columns = [format_table_column(table.index)] + [format_table_column(table.iloc[:, j]) for j in range(table.shape[1])]
 
     # Calculate maximum column width based on the longest entry
-    col_widths = []
-    for col in table.columns:
-        max_length = max(table[col].apply(lambda x: len(str(x))).max(), len(col)) 
-        col_widths.append(max_length * 2)  
+    col_widths = np.array([max(np.char.str_len(values).max(), len(name)) * 2 for values, name in zip(columns, header)], dtype=float)
 
     # Adjust the index column width to be smaller (as index is usually smaller)
     col_widths[0] = max(col_widths[0], 20)  
 
-    total_width = sum(col_widths)
-    
     # Scale column widths to fit within the page width, maintaining the relative proportions
-    scale_factor = (pdf_width - 2 * element_padding) / total_width
-    col_widths = [w * scale_factor for w in col_widths]
+    col_widths = (col_widths * (pdf_width - 2 * element_padding) / col_widths.sum()).tolist()
+
+    # Truncate the column names that are longer than their cell
+    header_cells = []
+    for name, width in zip(header, col_widths):
+        max_length_for_col = int(width // 2)
+        if len(name) > max_length_for_col:
+            header_cells.append((name[:max_length_for_col] + '...', 8))
+        else:
+            header_cells.append((name, 9))
+
+    rows = np.column_stack(columns).tolist()
+    index_width, value_widths = col_widths[0], col_widths[1:]
 
     # Set gray color for the first row and first column
     pdf.set_fill_color(230, 230, 230)  
 
-    # Add table header with gray background for the first row
-    for i, col in enumerate(table.columns):
-        col_name = col
-        # Convert col_widths[i] to integer for proper slicing
-        max_length_for_col = int(col_widths[i] // 2)   
-        # If the column name is longer than the cell, truncate or wrap the text
-        if len(col_name) > max_length_for_col:  
-            col_name = col_name[:max_length_for_col] + '...'  
-            pdf.set_font('Arial', '', 8)  
-        pdf.cell(col_widths[i], 10, col_name, border=1, align='C', fill=True)
-        pdf.set_font('Arial', '', 9)  
-    pdf.ln()
+    def add_header():
+        for (name, font_size), width in zip(header_cells, col_widths):
+            if font_size != 9:
+                pdf.set_font('Arial', '', font_size)
+            pdf.cell(width, row_height, name, border=1, align='C', fill=True)
+            if font_size != 9:
+                pdf.set_font('Arial', '', 9)
+        pdf.ln()
+
+    if pdf.get_y() + 2 * row_height > pdf.page_break_trigger:
+        pdf.add_page()
+    add_header()
 
     # Add table rows with gray background for the first column (index)
-    for i in range(len(table)):
-        for j, col in enumerate(table.columns):
-            value = table[col].iloc[i]
-            # Round numeric values to 2 decimals
-            if isinstance(value, (int, float)):
-                value = round(value, 2)
-            
-            # Apply gray background for the first column (index)
-            if j == 0:  
-                pdf.set_fill_color(230, 230, 230)  
-                pdf.cell(col_widths[j], 10, str(value), border=1, align='C', fill=True)
-            else:
-                pdf.cell(col_widths[j], 10, str(value), border=1, align='C', fill=False)
+    for row in rows:
+        if pdf.get_y() + row_height > pdf.page_break_trigger:
+            pdf.add_page()
+            add_header()
+
+        pdf.cell(index_width, row_height, row[0], border=1, align='C', fill=True)
+        for width, value in zip(value_widths, row[1:]):
+            pdf.cell(width, row_height, value, border=1, align='C', fill=False)
         pdf.ln()
 
     return pdf
 
 def switch_page_if_needed(pdf):
+    from fpdf import FPDF
     assert isinstance(pdf, FPDF), f"Argument 'pdf' should be FPDF class. You have {pdf}"
     if pdf.get_y() > 50:
         pdf.add_page()
     return pdf
 
-def summarize(dataset: pd.DataFrame,
+def iter_column_chunks(dataset, columns_per_chunk):
+    """
+    Split the columns of a dataset into consecutive chunks of at most `columns_per_chunk` columns.
+
+    Parameters
+    ----------
+    dataset : pd.DataFrame
+        The dataframe whose columns will be chunked.
+    columns_per_chunk : int
+        The maximum number of columns in each chunk.
+
+    Yields
+    ------
+    tuple of (int, pd.DataFrame)
+        The index of the chunk and a dataframe holding only the columns of that chunk.
+
+    Examples
+    --------
+    >>> for chunk_index, chunk in iter_column_chunks(df, columns_per_chunk=10):
+    ...     print(chunk_index, chunk.shape)
+    """
+    # Streamed datasets are split by the columns of their statistics, see `iter_report_chunks`
+    assert isinstance(dataset, pd.DataFrame), f"Argument 'dataset' should be pandas dataframe (pd.DataFrame)! You have {type(dataset)}."
+    assert isinstance(columns_per_chunk, int) and columns_per_chunk > 0, f"Argument 'columns_per_chunk' should be a positive integer! You have {columns_per_chunk}."
+
+    for chunk_index, start in enumerate(range(0, dataset.shape[1], columns_per_chunk)):
+        yield chunk_index, dataset.iloc[:, start:start + columns_per_chunk]
+
+def merge_dtypes_tables(tables):
+    """
+    Merge the data type tables computed on column chunks into a single data type table.
+
+    Parameters
+    ----------
+    tables : list of pd.DataFrame
+        Outputs of `summarize_dtypes_table` computed on disjoint sets of columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with the columns ['DataType', 'Count'], sorted by decreasing count. Data types
+        with equal counts keep the order in which they first appeared.
+    """
+    tables = [table for table in tables if not table.empty]
+    if not tables:
+        return pd.DataFrame(columns=['DataType', 'Count'])
+
+    merged = pd.concat(tables, ignore_index=True).groupby('DataType', sort=False)['Count'].sum()
+    merged = merged.sort_values(ascending=False, kind='stable').reset_index()
+    return merged
+
+def iter_report_chunks(dataset, columns_per_chunk, dataset_stats=None, value_counts_for=None, quantile_error=None, profiler=None,
+                       cache=None, dataset_key=None):
+    """
+    Split a dataset into chunks of columns and pair every chunk with its column statistics.
+
+    Parameters
+    ----------
+    dataset : pd.DataFrame, str, Path or iterable of pd.DataFrame
+        The dataset to summarize.
+    columns_per_chunk : int
+        The maximum number of columns in each chunk.
+    dataset_stats : DatasetStats, optional
+        The statistics of a streamed dataset. If given, they are split by chunk of columns and the 
+        dataset itself is yielded unchanged. Otherwise `dataset` must be a DataFrame, and the 
+        statistics of every chunk are computed with `compute_column_stats`.
+    value_counts_for : list of str, optional
+        Columns for which the value counts are kept as well.
+    quantile_error : float, optional
+        If given, the quartiles of in-memory chunks are estimated with KLL sketches.
+    profiler : StageProfiler, optional
+        If given, the statistics of every chunk are measured as the "column_stats" stage.
+    cache : SummaryCache, optional
+        If given, the statistics of every chunk are memoized under `dataset_key`, the fingerprint 
+        of the dataset.
+    dataset_key : str, optional
+        The fingerprint of the dataset (see `fingerprint`), required with `cache`.
+
+    Yields
+    ------
+    tuple of (int, pd.DataFrame or source, DatasetStats)
+        The index of the chunk, the chunk and the statistics of its columns.
+    """
+    value_counts_for = [] if value_counts_for is None else list(value_counts_for)
+    profiler = StageProfiler(enabled=False) if profiler is None else profiler
+
+    if dataset_stats is not None:
+        columns = dataset_stats.columns.index
+        for chunk_index, start in enumerate(range(0, len(columns), columns_per_chunk)):
+            yield chunk_index, dataset, dataset_stats.select(columns[start:start + columns_per_chunk])
+        return
+
+    for chunk_index, chunk in iter_column_chunks(dataset, columns_per_chunk):
+        chunk_value_counts_for = [col for col in value_counts_for if col in chunk.columns]
+        with profiler.stage("column_stats"):
+            compute = lambda: compute_column_stats(chunk, value_counts_for=chunk_value_counts_for, quantile_error=quantile_error)
+            if cache is None:
+                chunk_stats = compute()
+            else:
+                key = cache.key("column_stats", dataset_key, chunk_index, columns_per_chunk, chunk_value_counts_for, quantile_error)
+                chunk_stats = cache.get_or_compute(key, compute)
+        yield chunk_index, chunk, chunk_stats
+
+def chunk_file_name(key, chunk_index):
+    """
+    Return the image file stem of a chart, suffixed with the chunk index for every chunk but the first.
+    """
+    return key if chunk_index == 0 else f"{key}_{chunk_index}"
+
+def emit_report(pdf, elements, images):
+    """
+    Write the elements of a report to a PDF document, in order.
+
+    Parameters
+    ----------
+    pdf : FPDF
+        The PDF document, with its first page added.
+    elements : list of tuple
+        The report elements. The first item of each tuple is the kind of element:
+        - ("title", text) : the title of the report.
+        - ("text", text) : a paragraph.
+        - ("heading", text) : the heading of a section.
+        - ("subheading", text) : the heading of a chunk of columns.
+        - ("page_break",) : a new page if the current one is already filled (see `switch_page_if_needed`).
+        - ("table", table) : a table (see `add_table`).
+        - ("image", name, padding) : the rendered chart `name` (see `add_image`).
+    images : dict
+        Maps the chart names to their rendered PNG images (bytes) or image files.
+
+    Returns
+    -------
+    FPDF
+        The updated PDF document.
+    """
+    from fpdf import FPDF
+    assert isinstance(pdf, FPDF), f"Argument 'pdf' should be FPDF class. You have {type(pdf)}."
+
+    page_width = pdf.w
+    page_height = pdf.h
+
+    element_padding = 10
+    text_line_padding = 10
+
+    for element in elements:
+        kind = element[0]
+        if kind == "title":
+            pdf.set_font("Helvetica", size=15)
+            pdf.cell(page_width - 2 * pdf.l_margin, element_padding, txt=element[1], ln=True, align='C')
+        elif kind == "text":
+            pdf.set_font("Helvetica", size=11)
+            pdf.multi_cell(page_width - 2 * pdf.l_margin, text_line_padding, txt=element[1], align='L')
+        elif kind == "heading":
+            pdf.set_font("Helvetica", size=13)
+            pdf.cell(page_width - 2 * pdf.l_margin, element_padding, txt=element[1], ln=True, align='C')
+        elif kind == "subheading":
+            pdf.set_font("Helvetica", size=11)
+            pdf.cell(page_width - 2 * pdf.l_margin, element_padding, txt=element[1], ln=True, align='L')
+        elif kind == "page_break":
+            pdf = switch_page_if_needed(pdf)
+        elif kind == "table":
+            pdf = add_table(pdf, table=element[1], pdf_height=page_height, pdf_width=page_width, element_padding=15)
+        elif kind == "image":
+            pdf = add_image(pdf, image_path=images[element[1]], pdf_height=page_height, pdf_width=page_width, element_padding=element[2])
+        else:
+            raise ValueError(f"Unknown report element: {kind}")
+
+    return pdf
+
+def summarize(dataset,
               dataset_name: str = "Dataset Summary", 
               description: str = "Dataset summary generated by summarease.", 
               summarize_by: str = "plot", 
               target_variable: str = None,
               target_type: str = "categorical",
+              target_top_n: int = None,
               output_file: str = "summary.pdf",
-              output_dir: str = "./summarease_summary/"
+              output_dir: str = "./summarease_summary/",
+              columns_per_chunk: int = 15,
+              density_method: str = "numpy",
+              plot_sample_size: int = None,
+              sampling: str = "uniform",
+              sampling_seed: int = 0,
+              chunksize: int = 100_000,
+              quantile_error: float = None,
+              memory_budget: int = None,
+              partition_workers: int = None,
+              render_workers: int = None,
+              render_cache_dir: str = None,
+              render_cache_max_bytes: int = 512 * 1024 ** 2,
+              profile: bool = False,
+              profile_callback=None,
+              state: DatasetAccumulator = None,
+              cache: SummaryCache = None
 ):
     """
     Summarizes the given dataset by generating various statistics, visualizations, 
@@ -214,8 +539,11 @@ def summarize(dataset: pd.DataFrame,
 
     Parameters:
     -----------
-    dataset : pd.DataFrame
-        The dataframe to be summarized.
+    dataset : pd.DataFrame, str, Path or iterable of pd.DataFrame
+        The dataframe to be summarized. It can also be the path of a CSV or Parquet file, of a 
+        directory of such files, or an iterable of DataFrame chunks. Such datasets are read chunk 
+        by chunk into mergeable accumulators and the quartiles are approximate. Their plots are 
+        limited to the correlation heatmap and the target plot, as the density plots need the rows.
 
     dataset_name : str, optional, default="Dataset Summary"
         Represents the title of the summary, can be simply the name of the dataset.
@@ -223,10 +551,12 @@ def summarize(dataset: pd.DataFrame,
     description : str, optional, default="Dataset summary generated by summarease."
         A description of the dataset to provide context in the summary.
 
-    summarize_by : str, optional, default="mix"
+    summarize_by : str, optional, default="plot"
         Specifies what visual elements to use when summarizing the dataset:
         - "table" : Summarize using tables.
         - "plot" : Summarize using plots.
+        - "mix" : Summarize using both tables and plots. The statistics, the correlations and the 
+          target summary are computed once and shared by the tables and the plots.
 
     target_variable : str, optional, default=None
         The name of the target variable in the dataset. This helps in identifying the dependent variable for further analysis.
@@ -234,26 +564,110 @@ def summarize(dataset: pd.DataFrame,
     target_type : str, within {"categorical", "numerical"}
         The type of target variable.
 
+    target_top_n : int, optional, default=None
+        If given, only the `target_top_n` most frequent classes of a categorical target are shown, 
+        and the other classes are folded into an "other" class (see `summarize_target_df`). The 
+        classes of streamed datasets are then counted with a heavy hitters sketch, in bounded memory.
+
     output_file : str, optional, default="summary.pdf"
         The name of the output file where the summary will be saved.
 
     output_dir : str, optional, default="./summarease_summary/"
         The directory where the output summary file will be saved.
 
+    columns_per_chunk : int, optional, default=15
+        The maximum number of columns summarized together. Wide datasets are split into chunks of 
+        columns, and the numeric, density and data type sections are computed for each chunk 
+        independently, so the report grows linearly with the number of columns.
+
+    density_method : str, within {"numpy", "vega"}, optional, default="numpy"
+        Where the density plots are estimated. "numpy" estimates the densities in NumPy and only embeds 
+        the density curves in the charts, "vega" embeds the raw rows and lets the renderer estimate them.
+
+    plot_sample_size : int, optional, default=None
+        If given, the numeric plots are drawn from a sample of at most this many rows (see `sample_rows`), 
+        and the report states the sampling rate. The tables and the target summary still use every row.
+
+    sampling : str, within {"uniform", "stratified"}, optional, default="uniform"
+        How the plot sample is drawn: uniformly, or stratified by `target_variable` so the proportions 
+        of its classes are kept.
+
+    sampling_seed : int, optional, default=0
+        The seed of the plot sample, so the same rows are drawn every time.
+
+    chunksize : int, optional, default=100_000
+        The number of rows read at a time when `dataset` is a file path.
+
+    quantile_error : float, optional, default=None
+        If given, the quartiles of the numeric tables are estimated with mergeable KLL sketches with 
+        this normalized rank error (e.g., 0.01). Streamed datasets always use sketches, with an 
+        error of 0.01 by default.
+
+    memory_budget : int, optional, default=None
+        If given, the working memory of the correlations is kept under about this many bytes (see 
+        `compute_correlation`). The columns are always read without being copied and the inputs 
+        are never modified, so with `profile=True`, the peak memory and resident set size of every 
+        stage tell how much memory a worker needs.
+
+    partition_workers : int, optional, default=None
+        If given, a dataset stored in files (a file path, a directory or a list of file paths) is 
+        split by Parquet row groups and CSV files, which are summarized by this many processes and 
+        merged (see `accumulate_partitions`). The report is the same as with a single process.
+
+    render_workers : int, optional, default=None
+        The number of processes rasterizing the charts in parallel. If None, the charts of small 
+        reports are rendered in the current process, as starting a renderer process costs more than 
+        rendering a few charts, and large reports get one process per `CHARTS_PER_WORKER` charts, 
+        up to one per CPU (see `render_charts`). With 1, the charts are rendered one after another 
+        in the current process.
+
+    render_cache_dir : str, optional, default=None
+        A directory where the rendered charts are cached under a hash of their Vega-Lite 
+        specification. Charts that did not change since a previous run are copied from the cache 
+        instead of being rendered again. If None, every chart is rendered.
+
+    render_cache_max_bytes : int, optional, default=512 MB
+        The maximum size of the render cache. The least recently used images are evicted first.
+
+    profile : bool, optional, default=False
+        Measure the wall time, CPU time and peak memory of every stage of the report: "fingerprint" 
+        (with a `cache`), "sampling" (with a `plot_sample_size`), "column_stats", "numeric_summary", 
+        "chart_specs", "dtypes_summary", "target_summary", "missing_summary", "render", "pdf_layout" and 
+        "pdf_output". 
+        Memory is traced with `tracemalloc`, which slows the report down, and the peak resident set 
+        size of the process is recorded at the end of every stage.
+
+    profile_callback : callable, optional, default=None
+        Called with the `StageTiming` of every stage call when it ends, e.g. to forward the stages 
+        to a telemetry system. Giving a callback turns `profile` on.
+
+    state : DatasetAccumulator, optional, default=None
+        The summary state of the rows summarized so far, e.g. loaded with `DatasetAccumulator.load`. 
+        `dataset` then only holds the new rows: they are folded into the state, which is updated in 
+        place and can be saved for the next run, and the report covers every row of the state. The 
+        report is built in time proportional to the new rows. Only `summarize_by="table"` is supported.
+
+    cache : SummaryCache, optional, default=None
+        Memoizes the column statistics, target summary and chart specifications under a fingerprint 
+        of the dataset (see `fingerprint`), so summarizing the same DataFrame again (e.g., in table 
+        mode and then in plot mode) reuses them. Only for DataFrames.
+
     Returns:
     --------
-    None
+    TimingReport or None
         This function outputs the summary of the dataset in an output file, including statistical summaries, visualizations, and cleaning steps (if applicable).
+        If `profile` is True or a `profile_callback` is given, the timings of the stages are returned.
 
     Notes:
     ------
     - The `show_observations` parameter can be customized to display a certain number of observations.
     - The `summarize_by` parameter offers flexibility in the type of summary (table or plot).
+    - Correlations are computed between the numeric columns of the same chunk only.
 
     Example:
     --------
     >>> import pandas as pd
-    >>> from summarease import summarize
+    >>> from summarease.summarize import summarize
     >>> data = pd.DataFrame({
     ...     "Age": [23, 45, 31, 35, 29],
     ...     "Gender": ["Male", "Female", "Female", "Male", "Male"],
@@ -269,18 +683,127 @@ def summarize(dataset: pd.DataFrame,
     # This will generate a summary of the `data` dataframe
     # and save the summary as 'employee_summary.pdf' in the default output directory.
     """
-    assert isinstance(dataset, pd.DataFrame), f"Argument 'dataset' should be pandas dataframe (pd.DataFrame)! You have {type(dataset)}."
+    profiler, options = _prepare_report(
+        dataset, dataset_name=dataset_name, description=description, summarize_by=summarize_by,
+        target_variable=target_variable, target_type=target_type, target_top_n=target_top_n, output_file=output_file,
+        output_dir=output_dir, columns_per_chunk=columns_per_chunk, density_method=density_method,
+        plot_sample_size=plot_sample_size, sampling=sampling, sampling_seed=sampling_seed, chunksize=chunksize,
+        quantile_error=quantile_error, memory_budget=memory_budget, partition_workers=partition_workers,
+        render_workers=render_workers, render_cache_dir=render_cache_dir, render_cache_max_bytes=render_cache_max_bytes, profile=profile, profile_callback=profile_callback, state=state,
+        cache=cache
+    )
+    with profiler:
+        _build_report(dataset, **options, profiler=profiler)
+    print("PDF created!")
+
+    return profiler.report() if profiler.enabled else None
+
+
+async def summarize_async(dataset, executor=None, timeout: float = None, **options):
+    """
+    Summarize the given dataset like `summarize`, without blocking the event loop.
+
+    The statistics, chart specifications and PDF layout run in `executor`, and the charts are 
+    rendered by worker processes whose output is read by the event loop (see `render_charts_async`), 
+    so the loop keeps serving other requests while the report is built. The numeric, target and 
+    missing values sections are independent, so they are submitted to `executor` at the same time 
+    and run concurrently; the data types are merged from the numeric chunks afterwards.
+
+    Parameters:
+    -----------
+    dataset : pd.DataFrame, str, Path or iterable of pd.DataFrame
+        The dataset to summarize, see `summarize`.
+
+    executor : concurrent.futures.Executor, optional, default=None
+        The executor running the CPU-bound stages. If None, the default executor of the event loop. 
+        The stages share the dataset, the profiler and the cache with the loop, so it should be a 
+        thread pool, with at least 3 threads for the sections to run concurrently.
+
+    timeout : float, optional, default=None
+        The maximum number of seconds the report may take. `TimeoutError` is raised once it is over.
+
+    **options
+        The other arguments of `summarize` (e.g., `summarize_by`, `output_file`, `profile`).
+
+    Returns:
+    --------
+    TimingReport or None
+        The timings of the stages if `profile` is True or a `profile_callback` is given, see `summarize`.
+
+    Notes:
+    ------
+    - When the task is cancelled, or the timeout is over, the render workers are killed. A stage 
+      already running in the executor can't be interrupted: the summary stops at its next chunk of 
+      columns, in the background, and a PDF layout already started is still written.
+    - The profiler traces the memory of the whole process, including the other tasks of the loop.
+
+    Example:
+    --------
+    >>> async def handle(request):
+    ...     await summarize_async(df, summarize_by="plot", output_file="report.pdf", timeout=60)
+    """
+    assert timeout is None or (isinstance(timeout, (int, float)) and timeout > 0), f"Argument 'timeout' should be a positive number! You have {timeout}."
+    arguments = inspect.signature(summarize).bind(dataset, **options)
+    arguments.apply_defaults()
+    profiler, report_options = _prepare_report(**arguments.arguments)
+
+    cancelled = threading.Event()
+    try:
+        await asyncio.wait_for(_build_report_async(dataset, executor=executor, cancelled=cancelled, profiler=profiler, **report_options),
+                               timeout)
+    finally:
+        # Stop the summary running in the executor, if the task was cancelled
+        cancelled.set()
+    print("PDF created!")
+
+    return profiler.report() if profiler.enabled else None
+
+
+def _prepare_report(dataset, *, dataset_name, description, summarize_by, target_variable, target_type, target_top_n, output_file,
+                    output_dir, columns_per_chunk, density_method, plot_sample_size, sampling, sampling_seed, chunksize, quantile_error, memory_budget,
+                    partition_workers, render_workers, render_cache_dir,
+                    render_cache_max_bytes, profile, profile_callback, state, cache):
+    """
+    Validate the arguments of `summarize`, create the output directory and return the profiler of the
+    report and the options of `_build_report`.
+    """
+    streamed = not isinstance(dataset, pd.DataFrame)
+    assert not streamed or is_streamable_source(dataset), f"Argument 'dataset' should be pandas dataframe (pd.DataFrame), a CSV/Parquet file path or an iterable of dataframes! You have {type(dataset)}."
     assert isinstance(dataset_name, str), f"Argument 'dataset_name' should be string (str)! You have {type(dataset_name)}."
     assert isinstance(description, str), f"Argument 'description' should be string (str)! You have {type(description)}."
     assert isinstance(summarize_by, str), f"Argument 'summarize_by' should be a string (str)! You have {type(summarize_by)}."
     if target_variable is not None:
         assert isinstance(target_variable, str), f"Argument 'target_variable' should be a string (str)! You have {type(target_variable)}."
         assert isinstance(target_type, str), f"Argument 'target_type' should be a string (str)! You have {type(target_type)}."
+    if target_top_n is not None:
+        assert isinstance(target_top_n, int) and target_top_n > 0, f"Argument 'target_top_n' should be a positive integer! You have {target_top_n}."
     assert isinstance(output_file, str), f"Argument 'output_file' should be a string (str)! You have {type(output_file)}."
     assert isinstance(output_dir, str), f"Argument 'output_dir' should be a string (str)! You have {type(output_dir)}."
+    assert isinstance(columns_per_chunk, int) and columns_per_chunk > 0, f"Argument 'columns_per_chunk' should be a positive integer! You have {columns_per_chunk}."
+    if plot_sample_size is not None:
+        assert isinstance(plot_sample_size, int) and plot_sample_size > 0, f"Argument 'plot_sample_size' should be a positive integer! You have {plot_sample_size}."
+    assert sampling in SAMPLING_STRATEGIES, f"Argument 'sampling' should be one of the following options: [uniform, stratified]! You have {sampling}."
+    assert sampling != "stratified" or target_variable is not None, "Stratified sampling needs a 'target_variable'!"
+    if memory_budget is not None:
+        assert isinstance(memory_budget, int) and memory_budget > 0, f"Argument 'memory_budget' should be a positive integer! You have {memory_budget}."
+    if partition_workers is not None:
+        assert isinstance(partition_workers, int) and partition_workers > 0, f"Argument 'partition_workers' should be a positive integer! You have {partition_workers}."
+        assert is_partitionable_source(dataset), f"Argument 'partition_workers' needs a dataset stored in files (a CSV/Parquet file path, a directory or a list of file paths)! You have {type(dataset)}."
+    if render_workers is not None:
+        assert isinstance(render_workers, int) and render_workers > 0, f"Argument 'render_workers' should be a positive integer! You have {render_workers}."
+    if render_cache_dir is not None:
+        assert isinstance(render_cache_dir, str), f"Argument 'render_cache_dir' should be a string (str)! You have {type(render_cache_dir)}."
+    assert isinstance(profile, bool), f"Argument 'profile' should be a boolean (bool)! You have {type(profile)}."
+    assert profile_callback is None or callable(profile_callback), f"Argument 'profile_callback' should be callable! You have {type(profile_callback)}."
 
     summarize_by = summarize_by.lower()
     assert summarize_by in {"table", "plot", "mix"}, f"Argument 'summarize_by' should be one of the following options: [table, plot, mix]! You have {summarize_by}."
+    if state is not None:
+        assert isinstance(state, DatasetAccumulator), f"Argument 'state' should be a DatasetAccumulator! You have {type(state)}."
+        assert summarize_by == "table", "Summary states only support summarize_by='table'!"
+    if cache is not None:
+        assert isinstance(cache, SummaryCache), f"Argument 'cache' should be a SummaryCache! You have {type(cache)}."
+        assert not streamed and state is None, "Caching needs the whole dataset in memory, as a DataFrame!"
 
     output_dir = Path(output_dir)
     output_path = output_dir / output_file
@@ -290,79 +813,329 @@ def summarize(dataset: pd.DataFrame,
     # If the path doesn't exist, create it
     validate_or_create_path(output_dir)
 
-    if summarize_by in {"plot", "mix"}:
-        plot_output_path = output_dir / "img"
-        validate_or_create_path(plot_output_path)
+    profiler = StageProfiler(enabled=profile or profile_callback is not None, callback=profile_callback)
+    options = dict(dataset_name=dataset_name, description=description, summarize_by=summarize_by,
+                   target_variable=target_variable, target_type=target_type, target_top_n=target_top_n, output_path=output_path,
+                   columns_per_chunk=columns_per_chunk, density_method=density_method, plot_sample_size=plot_sample_size,
+                   sampling=sampling, sampling_seed=sampling_seed, chunksize=chunksize, quantile_error=quantile_error,
+                   memory_budget=memory_budget, partition_workers=partition_workers, render_workers=render_workers, render_cache_dir=render_cache_dir,
+                   render_cache_max_bytes=render_cache_max_bytes, streamed=streamed, state=state, cache=cache)
+    return profiler, options
 
 
-    dataset_shape = dataset.shape
-    assert (dataset_shape[1] >= 2 and dataset_shape[1] <= 15), f"The function currently supports dataframes having less than 15 columns and more than 2 columns! You have {dataset_shape[1]}"
+def _build_report(dataset, *, output_path, render_workers, render_cache_dir, render_cache_max_bytes, profiler, **options):
+    """
+    Summarize the dataset and write the PDF report, measuring every stage with `profiler`.
+    """
+    elements, charts = _collect_report(dataset, profiler=profiler, **options)
 
-    # Create the PDF
-    pdf = FPDF()
+    # Rasterize every chart in parallel to PNG bytes, embedded in the PDF in report order
+    if charts:
+        with profiler.stage("render"):
+            render_cache = RenderCache(render_cache_dir, max_bytes=render_cache_max_bytes) if render_cache_dir is not None else None
+            images = render_charts(charts, max_workers=render_workers, cache=render_cache)
+    else:
+        images = {}
 
-    # Add a new page
-    pdf.add_page()
+    _write_report(elements, images, output_path, profiler)
 
-    page_width = pdf.w
-    page_height = pdf.h
 
-    element_padding = 10
-    text_line_padding = 10
+async def _build_report_async(dataset, *, executor, cancelled, output_path, render_workers, render_cache_dir, render_cache_max_bytes,
+                              profiler, **options):
+    """
+    The asynchronous variant of `_build_report`, the CPU-bound stages run in `executor`. The numeric,
+    target and missing values sections are independent, so they run concurrently.
+    """
+    loop = asyncio.get_running_loop()
+    with profiler:
+        context = await loop.run_in_executor(executor, partial(_prepare_sections, dataset, profiler=profiler,
+                                                               cancelled=cancelled, **options))
+        numeric, target, missing = await asyncio.gather(*(loop.run_in_executor(executor, section, context)
+                                                          for section in (_numeric_section, _target_section, _missing_section)))
+        elements, charts = _assemble_report(context, numeric, target, missing)
+        if charts:
+            with profiler.stage("render"):
+                render_cache = RenderCache(render_cache_dir, max_bytes=render_cache_max_bytes) if render_cache_dir is not None else None
+                images = await render_charts_async(charts, max_workers=render_workers, cache=render_cache)
+        else:
+            images = {}
+
+        await loop.run_in_executor(executor, partial(_write_report, elements, images, output_path, profiler))
+
+
+@dataclass
+class _ReportContext:
+    """
+    The inputs shared by the sections of a report, prepared once by `_prepare_sections`.
+    """
+    dataset: object
+    options: dict
+    profiler: StageProfiler
+    cancelled: threading.Event
+    dataset_key: str
+    dataset_stats: object
+    plot_dataset: object
+    sampling_note: str
+    n_columns: int
+
+    def memoized(self, parts, compute):
+        # Reuse the value computed for the same dataset and parameters, if any
+        cache = self.options["cache"]
+        if cache is None:
+            return compute()
+        return cache.get_or_compute(cache.key(*parts, self.dataset_key), compute)
+
+    def check_cancelled(self):
+        if self.cancelled is not None and self.cancelled.is_set():
+            raise CancelledError("The report was cancelled.")
+
+
+def _prepare_sections(dataset, *, profiler, cancelled=None, **options):
+    """
+    Compute what the sections of the report share: the fingerprint of the dataset, the statistics
+    of streamed datasets and summary states, and the plot sample.
+    """
+    summarize_by, target_variable, target_type = options["summarize_by"], options["target_variable"], options["target_type"]
+    value_counts_for = [target_variable] if target_variable is not None and target_type == "categorical" else None
+
+    dataset_key = None
+    if options["cache"] is not None:
+        with profiler.stage("fingerprint"):
+            dataset_key = fingerprint(dataset)
+
+    # Fold the new rows into the summary state, or a streamed dataset into mergeable accumulators
+    # in a single pass over its rows
+    state = options["state"]
+    if state is not None:
+        with profiler.stage("column_stats"):
+            for col in value_counts_for or []:
+                state.track_value_counts(col)
+            dataset_stats = state.update_from(dataset, chunksize=options["chunksize"]).to_stats()
+    elif options["streamed"]:
+        with profiler.stage("column_stats"):
+            # Only the heavy hitters of the target are counted if the top classes are enough
+            target_top_n = options["target_top_n"]
+            heavy_hitters = None if target_top_n is None else max(DEFAULT_HEAVY_HITTERS, 10 * target_top_n)
+            # The correlation plots are computed from the co-moments accumulated with the statistics
+            accumulate_options = dict(value_counts_for=value_counts_for, chunksize=options["chunksize"], heavy_hitters=heavy_hitters,
+                                      quantile_error=options["quantile_error"] or DEFAULT_QUANTILE_ERROR,
+                                      co_moments=summarize_by != "table")
+            if options["partition_workers"] is not None:
+                dataset_stats = accumulate_partitions(dataset, max_workers=options["partition_workers"], **accumulate_options).to_stats()
+            else:
+                dataset_stats = accumulate_stats(dataset, **accumulate_options)
+    else:
+        dataset_stats = None
 
-    # Set the font to Helvetica, set the size, write the title
-    pdf.set_font("Helvetica", size=15)
-    pdf.cell(page_width - 2 * pdf.l_margin, element_padding, txt=dataset_name, ln=True, align='C')
+    n_columns = len(dataset_stats.columns) if dataset_stats is not None else dataset.shape[1]
+    assert n_columns >= 2, f"The function currently supports dataframes having at least 2 columns! You have {n_columns}"
 
-    # Change the size for the description and write it
-    pdf.set_font("Helvetica", size=11)
-    pdf.multi_cell(page_width - 2 * pdf.l_margin, text_line_padding, txt=description, align='L')
+    # The plots only need a sample of the rows, drawn once for every chunk of columns
+    plot_dataset = dataset
+    sampling_note = None
+    if summarize_by in {"plot", "mix"} and options["plot_sample_size"] is not None and not options["streamed"]:
+        with profiler.stage("sampling"):
+            plot_dataset, sampling_rate = sample_rows(dataset, options["plot_sample_size"], strategy=options["sampling"],
+                                                      stratify_by=target_variable, seed=options["sampling_seed"])
+        if sampling_rate < 1:
+            sampling_note = describe_sampling(len(plot_dataset), len(dataset), options["sampling"], target_variable)
 
-    pdf = switch_page_if_needed(pdf)
-    pdf.set_font("Helvetica", size=13)
-    pdf.cell(page_width - 2 * pdf.l_margin, element_padding, txt="Numeric Columns Summary", ln=True, align='C')
+    return _ReportContext(dataset=dataset, options=options, profiler=profiler, cancelled=cancelled, dataset_key=dataset_key,
+                          dataset_stats=dataset_stats, plot_dataset=plot_dataset, sampling_note=sampling_note, n_columns=n_columns)
 
-    if summarize_by == "plot":
-        summarized_numeric_output = summarize_numeric(dataset, summarize_by="plot")
-        if summarized_numeric_output:
-            for key, item in summarized_numeric_output.items():
-                plot_file = plot_output_path / f'{key}.png'
-                str_plot_file = str(plot_file)
-                item.save(plot_file)
-                pdf = add_image(pdf, image_path=str_plot_file, pdf_height=page_height, pdf_width=page_width, element_padding=10)
 
-        if target_variable is not None:
-            pdf = switch_page_if_needed(pdf)
-            pdf.set_font("Helvetica", size=13)
-            pdf.cell(page_width - 2 * pdf.l_margin, element_padding, txt="Target Variable Summary", ln=True, align='C')
-            pdf.set_font("Helvetica", size=11)
-            pdf.multi_cell(page_width - 2 * pdf.l_margin, text_line_padding, txt=f"Target variable is a {target_type} variable. Please find the information about the target variable below:", align='L')
-            summarized_target_output = summarize_target_df(dataset, target_variable, target_type)
-            summarized_target_plot = summarize_target_balance_plot(summarized_target_output)
-            target_plot_file = plot_output_path / "target_plot.png"
-            summarized_target_plot.save(target_plot_file)
-            pdf = add_image(pdf, target_plot_file, pdf_height=page_height, pdf_width=page_width, element_padding=0)
-
-    elif summarize_by == "table":
-        summarized_numeric_output = summarize_numeric(dataset, summarize_by="table")
-        if summarized_numeric_output:
-            pdf = add_table(pdf, table = summarized_numeric_output["numeric_describe"], pdf_height=page_height, pdf_width=page_width, element_padding=15)
-
-        if target_variable is not None:
-            pdf = switch_page_if_needed(pdf)
-            summarized_target_output = summarize_target_df(dataset, target_variable, target_type)
-            pdf.set_font("Helvetica", size=13)
-            pdf.cell(page_width - 2 * pdf.l_margin, element_padding, txt="Target Variable Summary", ln=True, align='C')
-            pdf.set_font("Helvetica", size=11)
-            pdf.multi_cell(page_width - 2 * pdf.l_margin, text_line_padding, txt=f"Target variable is a {target_type} variable. Please find the information about the target variable below:", align='L')
-            pdf = add_table(pdf, table = summarized_target_output, pdf_height=page_height, pdf_width=page_width, element_padding=15)
+def _numeric_section(context):
+    """
+    Summarize the numeric columns chunk by chunk. Return the elements and charts of the section and
+    the data type tables of the chunks.
+    """
+    dataset, profiler, memoized = context.dataset, context.profiler, context.memoized
+    options = context.options
+    summarize_by, target_variable, target_type = options["summarize_by"], options["target_variable"], options["target_type"]
+    columns_per_chunk, density_method, memory_budget = options["columns_per_chunk"], options["density_method"], options["memory_budget"]
+    sample_key = (options["plot_sample_size"], options["sampling"], options["sampling_seed"])
+    streamed, plot_dataset = options["streamed"], context.plot_dataset
+    value_counts_for = [target_variable] if target_variable is not None and target_type == "categorical" else None
+
+    elements = [("heading", "Numeric Columns Summary")]
+    if context.sampling_note is not None:
+        elements.append(("text", context.sampling_note))
+    charts = {}
+    dtypes_tables = []
+    n_chunks = (context.n_columns + columns_per_chunk - 1) // columns_per_chunk
+
+    # Summarize the columns chunk by chunk, so only one chunk's data is alive at a time
+    # The column statistics of every chunk are computed once, every section reads from them
+    for chunk_index, chunk, chunk_stats in iter_report_chunks(dataset, columns_per_chunk, context.dataset_stats, value_counts_for,
+                                                              options["quantile_error"], profiler, options["cache"], context.dataset_key):
+        context.check_cancelled()
+        chunk_columns = chunk_stats.columns.index
+        if n_chunks > 1:
+            elements.append(("subheading", f"Columns {chunk_columns[0]} to {chunk_columns[-1]} ({chunk_index + 1}/{n_chunks})"))
+
+        if summarize_by == "plot":
+            def numeric_specs():
+                with profiler.stage("numeric_summary"):
+                    # Streamed datasets are summarized from their accumulated statistics only
+                    numeric_dataset = chunk if streamed else select_columns(plot_dataset, chunk.columns)
+                    summarized_numeric_output = summarize_numeric(numeric_dataset, summarize_by="plot",
+                                                                  density_method=density_method, stats=chunk_stats,
+                                                                  memory_budget=memory_budget)
+                # Keep the Vega-Lite specs only, they are all the renderer needs
+                with profiler.stage("chart_specs"):
+                    return {key: item.to_dict() for key, item in (summarized_numeric_output or {}).items()}
+
+            # The stratified sample depends on the target
+            specs = memoized(("numeric_charts", chunk_index, columns_per_chunk, density_method, *sample_key, target_variable),
+                             numeric_specs)
+            for key, spec in specs.items():
+                chart_name = chunk_file_name(key, chunk_index)
+                charts[chart_name] = spec
+                elements.append(("image", chart_name, 10))
+
+        elif summarize_by == "table":
+            with profiler.stage("numeric_summary"):
+                summarized_numeric_output = summarize_numeric(chunk, summarize_by="table", stats=chunk_stats)
+            if summarized_numeric_output:
+                elements.append(("table", summarized_numeric_output["numeric_describe"]))
+
+        else:
+            def numeric_mix():
+                # The tables and the charts are built from the same statistics and correlations
+                with profiler.stage("numeric_summary"):
+                    summarized_numeric_output = summarize_numeric(chunk, summarize_by="mix", density_method=density_method,
+                                                                  stats=chunk_stats,
+                                                                  plot_dataset=None if streamed else select_columns(plot_dataset, chunk.columns),
+                                                                  memory_budget=memory_budget)
+                with profiler.stage("chart_specs"):
+                    return {key: item if isinstance(item, pd.DataFrame) else item.to_dict()
+                            for key, item in (summarized_numeric_output or {}).items()}
+
+            outputs = memoized(("numeric_mix", chunk_index, columns_per_chunk, density_method, *sample_key, target_variable),
+                               numeric_mix)
+            if "numeric_describe" in outputs:
+                elements.append(("table", outputs["numeric_describe"]))
+            for key in ("numeric_plot", "corr_plot"):
+                if key in outputs:
+                    chart_name = chunk_file_name(key, chunk_index)
+                    charts[chart_name] = outputs[key]
+                    elements.append(("image", chart_name, 10))
+            if "corr_table" in outputs and not outputs["corr_table"].empty:
+                elements.append(("text", "Most correlated pairs of numeric columns:"))
+                elements.append(("table", outputs["corr_table"]))
+
+        with profiler.stage("dtypes_summary"):
+            dtypes_tables.append(summarize_dtypes_table(chunk, stats=chunk_stats))
+
+    return elements, charts, dtypes_tables
+
+
+def _target_section(context):
+    """
+    Summarize the target variable. Return the elements and charts of the section.
+    """
+    options, profiler, memoized = context.options, context.profiler, context.memoized
+    summarize_by, target_variable, target_type, target_top_n = (options["summarize_by"], options["target_variable"],
+                                                                options["target_type"], options["target_top_n"])
+    if target_variable is None:
+        return [], {}
+    context.check_cancelled()
+
+    # The statistics of streamed datasets hold the value counts of the target, DataFrames are read
+    target_stats = None
+    if context.dataset_stats is not None and target_variable in context.dataset_stats.columns.index:
+        target_stats = context.dataset_stats.select([target_variable])
+
+    elements = [("page_break",), ("heading", "Target Variable Summary"),
+                ("text", f"Target variable is a {target_type} variable. Please find the information about the target variable below:")]
+    charts = {}
+    with profiler.stage("target_summary"):
+        summarized_target_output = memoized(("target_summary", target_variable, target_type, target_top_n),
+                                            lambda: summarize_target_df(context.dataset, target_variable, target_type, stats=target_stats,
+                                                                        top_n=target_top_n if target_type == "categorical" else None))
+
+    if summarize_by in {"table", "mix"}:
+        elements.append(("table", summarized_target_output))
 
-    summarized_dtypes_table = summarize_dtypes_table(dataset)
-    pdf.set_font("Helvetica", size=13)
-    pdf.cell(page_width - 2 * pdf.l_margin, element_padding, txt="Dataset Data Types Summary", ln=True, align='C')
-    pdf = add_table(pdf, table = summarized_dtypes_table, pdf_height=page_height, pdf_width=page_width, element_padding=15)
+    if summarize_by in {"plot", "mix"}:
+        with profiler.stage("chart_specs"):
+            charts["target_plot"] = memoized(("target_plot", target_variable, target_type, target_top_n),
+                                             lambda: summarize_target_balance_plot(summarized_target_output).to_dict())
+        elements.append(("image", "target_plot", 0))
+    return elements, charts
 
-    pdf.output(output_path)
-    assert output_path.exists(), "Something went wrong... The PDF output was not saved."
-    print("PDF created!")
 
+def _missing_section(context):
+    """
+    Summarize the missing values. Return the elements and charts of the section.
+    """
+    summarize_by = context.options["summarize_by"]
+    context.check_cancelled()
+
+    # The missing values are counted on every column at once, for the co-missingness of columns of different chunks
+    elements = [("heading", "Missing Values Summary")]
+    charts = {}
+    with context.profiler.stage("missing_summary"):
+        missing_outputs = context.memoized(("missing_summary", summarize_by),
+                                           lambda: {key: item if isinstance(item, pd.DataFrame) else item.to_dict()
+                                                    for key, item in summarize_missing(context.dataset, summarize_by=summarize_by,
+                                                                                       stats=context.dataset_stats).items()})
+    if not missing_outputs:
+        elements.append(("text", "The dataset has no missing values."))
+    if "missing_table" in missing_outputs:
+        elements.append(("table", missing_outputs["missing_table"]))
+    for key in ("missing_plot", "co_missing_plot"):
+        if key in missing_outputs:
+            charts[key] = missing_outputs[key]
+            elements.append(("image", key, 10))
+    if "missing_rows_table" in missing_outputs:
+        elements.append(("text", "Number of rows by number of missing values:"))
+        elements.append(("table", missing_outputs["missing_rows_table"]))
+    return elements, charts
+
+
+def _assemble_report(context, numeric, target, missing):
+    """
+    Put the sections together in report order, followed by the data types merged from the numeric chunks.
+    """
+    numeric_elements, numeric_charts, dtypes_tables = numeric
+    elements = [("title", context.options["dataset_name"]), ("text", context.options["description"]), ("page_break",)]
+    charts = {}
+    for section_elements, section_charts in [(numeric_elements, numeric_charts), target, missing]:
+        elements.extend(section_elements)
+        charts.update(section_charts)
+
+    elements.append(("heading", "Dataset Data Types Summary"))
+    with context.profiler.stage("dtypes_summary"):
+        elements.append(("table", merge_dtypes_tables(dtypes_tables)))
+    return elements, charts
+
+
+def _collect_report(dataset, *, profiler, cancelled=None, **options):
+    """
+    Summarize the dataset into the elements of the report and the charts to render.
+
+    If the `cancelled` event is set, the summary stops before the next section or chunk of columns
+    by raising `concurrent.futures.CancelledError`.
+    """
+    context = _prepare_sections(dataset, profiler=profiler, cancelled=cancelled, **options)
+    numeric = _numeric_section(context)
+    target = _target_section(context)
+    missing = _missing_section(context)
+    return _assemble_report(context, numeric, target, missing)
+
+
+def _write_report(elements, images, output_path, profiler):
+    """
+    Lay out the report elements and the rendered charts into the PDF file `output_path`.
+    """
+    from fpdf import FPDF
+
+    with profiler.stage("pdf_layout"):
+        pdf = FPDF()
+        pdf.add_page()
+        pdf = emit_report(pdf, elements, images)
+
+    with profiler.stage("pdf_output"):
+        pdf.output(output_path)
+    assert output_path.exists(), "Something went wrong... The PDF output was not saved."
@@ -0,0 +1,169 @@
+import json
+import numbers
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from summarease.column_stats import DEFAULT_QUANTILE_ERROR, compute_column_stats, describe_from_stats, select_columns
+from summarease.accumulators import DEFAULT_HEAVY_HITTERS, DatasetAccumulator, accumulate_stats, is_streamable_source
+from summarease.summarize_dtypes import summarize_dtypes_table
+from summarease.summarize_numeric import compute_correlation
+from summarease.summarize_target import summarize_target_df
+
+SUMMARY_FORMAT_VERSION = 1
+
+
+def to_builtin(value):
+    """
+    Convert a summary value to plain Python types that `json.dumps` accepts, recursively.
+
+    NumPy scalars become Python numbers, missing values (NaN, None, pd.NA, NaT) become None and the
+    keys of dictionaries become strings.
+    """
+    if isinstance(value, dict):
+        return {str(key): to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray, pd.Index)):
+        return [to_builtin(item) for item in value]
+    if value is None or (np.ndim(value) == 0 and pd.isna(value)):
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+def summarize_dict(dataset,
+                   target_variable: str = None,
+                   target_type: str = "categorical",
+                   target_top_n: int = None,
+                   correlation: bool = True,
+                   chunksize: int = 100_000,
+                   quantile_error: float = None,
+                   state: DatasetAccumulator = None,
+                   output_path: str = None):
+    """
+    Summarize the dataset into a nested dictionary of numbers, without charts or a PDF report.
+
+    The statistics are the ones of `summarize`: the describe table of the numeric columns, the counts
+    of the data types, the target summary and the correlation matrix of the numeric columns. No chart
+    is built and neither Altair, vl-convert nor FPDF is loaded, so it is cheap enough for data
+    quality checks in pipelines.
+
+    Parameters
+    ----------
+    dataset : pd.DataFrame, str, Path or iterable of pd.DataFrame
+        The dataset to summarize. It can also be the path of a CSV or Parquet file, or an iterable of
+        DataFrame chunks, read chunk by chunk into mergeable accumulators. The quartiles of such
+        datasets are approximate, and their correlation matrix is computed from the co-moments
+        accumulated with the statistics (see `CoMomentsAccumulator`).
+    target_variable : str, optional
+        The name of the target variable. If None, the summary has no target section.
+    target_type : str, within {"categorical", "numerical"}
+        The type of the target variable. Default is "categorical".
+    target_top_n : int, optional
+        Only the `target_top_n` most frequent classes of a categorical target are listed (see
+        `summarize_target_df`).
+    correlation : bool, optional
+        Whether to compute the correlation matrix of the numeric columns. Default is True.
+    chunksize : int, optional
+        The number of rows per chunk when reading a CSV file. Default is 100,000.
+    quantile_error : float, optional
+        The rank error of the approximate quartiles. If None, the quartiles of DataFrames are exact.
+    state : DatasetAccumulator, optional
+        The summary state of the rows seen so far. `dataset` only holds the new rows (or is None),
+        which are folded into the state, and every row of the state is summarized. The correlation
+        matrix is computed from the co-moments of the state, which an empty state starts tracking;
+        it is None for a state that accumulated rows without them.
+    output_path : str, optional
+        If given, the summary is also written to this JSON file.
+
+    Returns
+    -------
+    dict
+        The summary, with plain Python values (missing values are None):
+        - "version" : the format version of the summary.
+        - "n_rows", "n_columns" : the shape of the dataset.
+        - "dtypes" : the number of columns of every data type.
+        - "numeric" : maps every numeric column to its count, mean, std, min, quartiles and max.
+        - "target" : None without a target, the list of class rows (class, proportion, imbalanced,
+          threshold) of a categorical target, or the statistics of a numerical target.
+        - "correlation" : maps every numeric column to its correlations with the numeric columns,
+          or None if it was not computed.
+
+    Examples
+    --------
+    >>> summary = summarize_dict(df, target_variable="target")
+    >>> assert summary["numeric"]["age"]["min"] >= 0
+    >>> summarize_dict("data.parquet", output_path="summary.json")
+    """
+    streamed = not isinstance(dataset, pd.DataFrame)
+    if state is None or dataset is not None:
+        assert not streamed or is_streamable_source(dataset), f"Argument 'dataset' should be pandas dataframe (pd.DataFrame), a CSV/Parquet file path or an iterable of dataframes! You have {type(dataset)}."
+    if state is not None:
+        assert isinstance(state, DatasetAccumulator), f"Argument 'state' should be a DatasetAccumulator! You have {type(state)}."
+    if target_variable is not None:
+        assert isinstance(target_variable, str), f"Argument 'target_variable' should be a string (str)! You have {type(target_variable)}."
+        assert target_type in {"categorical", "numerical"}, f"Argument 'target_type' should be one of the following options: [categorical, numerical]! You have {target_type}."
+    if target_top_n is not None:
+        assert isinstance(target_top_n, int) and target_top_n > 0, f"Argument 'target_top_n' should be a positive integer! You have {target_top_n}."
+    assert isinstance(correlation, bool), f"Argument 'correlation' should be a boolean (bool)! You have {type(correlation)}."
+    if output_path is not None:
+        assert isinstance(output_path, (str, Path)), f"Argument 'output_path' should be a string (str)! You have {type(output_path)}."
+
+    value_counts_for = [target_variable] if target_variable is not None and target_type == "categorical" else None
+
+    # The statistics are computed once, in a single pass for streamed datasets
+    if state is not None:
+        for col in value_counts_for or []:
+            state.track_value_counts(col)
+        if correlation and state.n_rows == 0:
+            state.track_co_moments()
+        if dataset is not None:
+            state.update_from(dataset, chunksize=chunksize)
+        stats = state.to_stats()
+    elif streamed:
+        heavy_hitters = None if target_top_n is None else max(DEFAULT_HEAVY_HITTERS, 10 * target_top_n)
+        stats = accumulate_stats(dataset, value_counts_for=value_counts_for, chunksize=chunksize,
+                                 quantile_error=quantile_error or DEFAULT_QUANTILE_ERROR, heavy_hitters=heavy_hitters,
+                                 co_moments=correlation)
+    else:
+        stats = compute_column_stats(dataset, value_counts_for=value_counts_for, quantile_error=quantile_error)
+
+    dtypes = summarize_dtypes_table(dataset, stats=stats)
+    numeric_columns = stats.numeric_columns
+    summary = {
+        "version": SUMMARY_FORMAT_VERSION,
+        "n_rows": stats.n_rows,
+        "n_columns": len(stats.columns),
+        "dtypes": dict(zip(dtypes['DataType'], dtypes['Count'])),
+        "numeric": describe_from_stats(stats, numeric_columns).to_dict(),
+        "target": None,
+        "correlation": None,
+    }
+
+    if target_variable is not None:
+        if target_variable not in stats.columns.index:
+            raise KeyError(f"Column not found in the dataset: {target_variable}")
+        if target_type == "categorical":
+            target = summarize_target_df(dataset, target_variable, target_type, stats=stats, top_n=target_top_n)
+            summary["target"] = target.to_dict(orient="records")
+        else:
+            target = summarize_target_df(dataset, target_variable, target_type, threshold=None, stats=stats)
+            summary["target"] = target.iloc[0].to_dict() if len(target) else None
+
+    # The correlations of streamed datasets and states are derived from their accumulated co-moments
+    if correlation and numeric_columns:
+        if streamed or state is not None:
+            if stats.correlation is not None:
+                summary["correlation"] = stats.correlation.loc[numeric_columns, numeric_columns].to_dict()
+        else:
+            summary["correlation"] = compute_correlation(select_columns(dataset, numeric_columns)).to_dict()
+
+    summary = to_builtin(summary)
+    if output_path is not None:
+        Path(output_path).write_text(json.dumps(summary, indent=2, allow_nan=False))
+    return summary
@@ -1,13 +1,20 @@
 import pandas as pd
+from summarease.column_stats import DatasetStats
+from summarease.arrow_stats import arrow_pandas_dtypes, is_arrow_table, is_polars_frame, to_arrow_table
 
-def summarize_dtypes_table(dataset: pd.DataFrame) -> pd.DataFrame:
+def summarize_dtypes_table(dataset: pd.DataFrame, stats: DatasetStats = None) -> pd.DataFrame:
     """
     Summarize the data types in the dataset and return a DataFrame.
 
     Parameters
     ----------
-    dataset : DataFrame
-        The input dataset to analyze.
+    dataset : DataFrame, pyarrow.Table or polars.DataFrame
+        The input dataset to analyze. The data types of pyarrow Tables and Polars DataFrames are 
+        read from their schema and reported as the pandas dtypes of their columns (see 
+        `arrow_pandas_dtypes`), without converting them.
+    stats : DatasetStats, optional
+        Precomputed column statistics of the dataset (see `compute_column_stats`). 
+        If given, the data types are read from them.
 
     Returns
     -------
@@ -17,7 +24,8 @@ def summarize_dtypes_table(dataset: pd.DataFrame) -> pd.DataFrame:
     Raises
     ------
     TypeError
-        If the input dataset is not a pandas DataFrame.
+        If the input dataset is not a pandas DataFrame, a pyarrow Table or a Polars DataFrame and 
+        no statistics are given.
 
     Examples
     --------
@@ -34,11 +42,18 @@ def summarize_dtypes_table(dataset: pd.DataFrame) -> pd.DataFrame:
     2   object      1
     3     bool      1
     """
-    if not isinstance(dataset, pd.DataFrame):
-        raise TypeError("The input dataset must be a pandas DataFrame.")
+    arrow = is_arrow_table(dataset) or is_polars_frame(dataset)
+    if stats is None and not isinstance(dataset, pd.DataFrame) and not arrow:
+        raise TypeError("The input dataset must be a pandas DataFrame, a pyarrow Table or a Polars DataFrame.")
     
     # Get data types and their counts
-    dtype_counts = dataset.dtypes.value_counts().reset_index()
+    if stats is not None:
+        dtype_counts = stats.columns['dtype'].value_counts().reset_index()
+    elif arrow:
+        dtypes = arrow_pandas_dtypes(to_arrow_table(dataset))
+        dtype_counts = pd.Series([str(dtype) for dtype in dtypes]).value_counts().reset_index()
+    else:
+        dtype_counts = dataset.dtypes.value_counts().reset_index()
     dtype_counts.columns = ['DataType', 'Count']
 
     # Convert DataType column to string for consistent output
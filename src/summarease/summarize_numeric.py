@@ -1,7 +1,80 @@
+import base64
+import numpy as np
 import pandas as pd
-import altair as alt
+from summarease.column_stats import (DEFAULT_QUANTILE_ERROR, DatasetStats, compute_column_stats, describe_from_stats,
+                                    is_summarizable_numeric, select_columns)
+from summarease.accumulators import DatasetAccumulator, accumulate_stats, is_streamable_source
+from summarease.sampling import sample_rows
+from summarease.arrow_stats import compute_arrow_stats, is_arrow_table, is_polars_frame, to_arrow_table
 
-def plot_numeric_density(dataset_numeric: pd.DataFrame):
+def compute_density_grid(values, bandwidth=None, n_points: int = 200):
+    """
+    Estimate the density of a numeric sample with a Gaussian kernel, evaluated on an evenly spaced grid.
+
+    The sample is linearly binned onto the grid and the binned counts are convolved with the kernel, 
+    so the cost is linear in the number of values and only `n_points` points are returned.
+
+    Parameters:
+    ----------
+    values : array-like
+        The numeric sample. Missing values are ignored.
+    bandwidth : float, optional
+        The standard deviation of the Gaussian kernel. If None, the bandwidth is estimated with 
+        Scott's rule, the same default as the Vega-Lite density transform.
+    n_points : int, optional
+        The number of grid points the density is evaluated on. Default is 200.
+
+    Returns:
+    -------
+    pd.DataFrame
+        A DataFrame with the columns ['value', 'density'] and `n_points` rows. Empty if the sample 
+        has no non-missing values.
+
+    Example:
+    -------
+    >>> compute_density_grid(df["col1"], n_points=100)
+    """
+    assert isinstance(n_points, int) and n_points > 1, f"Argument 'n_points' should be an integer greater than 1! You have {n_points}."
+    if bandwidth is not None:
+        assert isinstance(bandwidth, (int, float)) and bandwidth > 0, f"Argument 'bandwidth' should be a positive number! You have {bandwidth}."
+
+    values = pd.Series(values).to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    n = values.size
+
+    if n == 0:
+        return pd.DataFrame({'value': pd.Series(dtype=float), 'density': pd.Series(dtype=float)})
+
+    if bandwidth is None:
+        q25, q75 = np.quantile(values, [0.25, 0.75])
+        spread = min(values.std(ddof=1) if n > 1 else 0.0, (q75 - q25) / 1.34)
+        bandwidth = 1.06 * spread * n ** -0.2
+        if not bandwidth > 0:
+            bandwidth = 1.0
+
+    low, high = values.min(), values.max()
+    if low == high:
+        low, high = low - 3 * bandwidth, high + 3 * bandwidth
+
+    grid = np.linspace(low, high, n_points)
+    step = grid[1] - grid[0]
+
+    # Linear binning: split every value between its two neighbouring grid points
+    position = (values - low) / step
+    left = np.clip(np.floor(position).astype(np.int64), 0, n_points - 2)
+    right_weight = position - left
+    counts = np.bincount(left, weights=1 - right_weight, minlength=n_points)
+    counts += np.bincount(left + 1, weights=right_weight, minlength=n_points)
+
+    # Convolve the binned counts with the Gaussian kernel sampled on the grid spacing
+    offsets = np.arange(-(n_points - 1), n_points) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    density = np.convolve(counts, kernel, mode='valid') / n
+
+    return pd.DataFrame({'value': grid, 'density': density})
+
+def plot_numeric_density(dataset_numeric: pd.DataFrame, density_method: str = "vega", 
+                         bandwidth=None, n_points: int = 200):
     """
     Generate density plots for each numeric column in the provided dataset. Each plot represents the 
     distribution of values in a numeric column using a density estimate.
@@ -11,6 +84,15 @@ def plot_numeric_density(dataset_numeric: pd.DataFrame):
     dataset_numeric : pd.DataFrame
         A pandas DataFrame containing numeric columns. The function will generate a density plot for 
         each numeric column in the dataset.
+    density_method : str, optional
+        Where the density is estimated. Options are "vega" (default) or "numpy". With "vega", the raw 
+        rows are embedded in the chart and the density is estimated by the Vega-Lite renderer. With 
+        "numpy", the density is estimated with `compute_density_grid` and only the grid points are 
+        embedded in the chart. `summarize_numeric` and `summarize` use "numpy" by default.
+    bandwidth : float, optional
+        The kernel bandwidth used when `density_method="numpy"`. If None, Scott's rule is used.
+    n_points : int, optional
+        The number of grid points per column used when `density_method="numpy"`. Default is 200.
 
     Returns:
     -------
@@ -22,13 +104,22 @@ def plot_numeric_density(dataset_numeric: pd.DataFrame):
     -------
     >>> plot_numeric_density(dataset_numeric=df)
     """
+    import altair as alt
     assert isinstance(dataset_numeric, pd.DataFrame), f"Argument 'dataset_numeric' should be pandas dataframe (pd.DataFrame)! You have {type(dataset_numeric)}."
+    assert isinstance(density_method, str), f"Argument 'density_method' should be a string (str)! You have {type(density_method)}."
+
+    density_method = density_method.lower()
+    assert density_method in {"vega", "numpy"}, f"Argument 'density_method' should be one of the following options: [vega, numpy]! You have {density_method}."
 
     plots = []
     for col in dataset_numeric.columns:
-        plot = alt.Chart(dataset_numeric).transform_density(
-            col, as_=['value', 'density']
-        ).mark_line().encode(
+        if density_method == "numpy":
+            base = alt.Chart(compute_density_grid(dataset_numeric[col], bandwidth=bandwidth, n_points=n_points))
+        else:
+            base = alt.Chart(dataset_numeric).transform_density(
+                col, as_=['value', 'density']
+            )
+        plot = base.mark_line().encode(
             x='value:Q',
             y='density:Q',
             color=alt.value('steelblue')
@@ -49,63 +140,328 @@ def plot_numeric_density(dataset_numeric: pd.DataFrame):
     
     return final_plot
 
-def plot_correlation_heatmap(dataset_numeric: pd.DataFrame):
+def _standardize_columns(dataset_numeric: pd.DataFrame, start: int, stop: int):
+    """
+    Standardize the columns `start` to `stop` of a dataset into float32 (zero where missing), and
+    return them with their float32 masks of present values.
+    """
+    block = dataset_numeric.iloc[:, start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = ~np.isnan(block)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centered = block - np.nansum(block, axis=0) / mask.sum(axis=0)
+        # Constant columns are scaled by zero and become missing, as their correlations
+        centered /= np.sqrt(np.nansum(centered ** 2, axis=0))
+    return np.where(mask, centered, 0).astype(np.float32), mask.astype(np.float32)
+
+def correlation_block_size(n_rows: int, memory_budget: int, max_block_size: int = 256):
+    """
+    Return the largest number of columns per block (at most `max_block_size`) whose working memory
+    in `compute_correlation` fits in `memory_budget` bytes, about 40 bytes per row and column.
+    """
+    return int(max(1, min(max_block_size, memory_budget // (40 * max(n_rows, 1)))))
+
+def compute_correlation(dataset_numeric: pd.DataFrame, block_size: int = 256, memory_budget: int = None):
     """
-    Generate and save a correlation heatmap for the specified numeric columns in a dataset.
+    Compute the Pearson correlation matrix of numeric columns in blocks of columns, in float32.
+
+    Every column is standardized once into a float32 copy (zero where missing), and the matrix is
+    filled block by block with matrix products, computing each pair of blocks once. Missing values are
+    excluded pairwise, like `pd.DataFrame.corr`.
 
     Parameters:
     ----------
-    dataset : pd.DataFrame
-        The input dataset containing the data for the heatmap.
-    
-    numeric_columns : list of str, optional
-        A list of column names to include in the correlation heatmap. If None, all numeric columns in the dataset will be used.
-    
-    save_path : str, optional
-        File path to save the generated heatmap. If None, the plot will not be saved.
+    dataset_numeric : pd.DataFrame
+        A pandas DataFrame containing numeric columns.
+    block_size : int, optional
+        The number of columns per block. Default is 256.
+    memory_budget : int, optional
+        If given, the working memory is kept under about this many bytes (besides the matrix): the
+        blocks are made smaller to fit (see `correlation_block_size`) and, if the standardized
+        copy of every column does not fit, the columns are standardized again for every pair of
+        blocks instead of once. Default is None, no budget.
 
     Returns:
     -------
-    alt.Chart
-        The Altair chart visualizing the correlation heatmap.
+    pd.DataFrame
+        The k x k correlation matrix (float32), indexed by the column names. Correlations involving a
+        constant column, or pairs with less than two complete rows, are missing.
 
     Example:
     -------
-    >>> plot_correlation_heatmap(dataset=df, numeric_columns=["col1", "col2", "col3"], save_path="heatmap.png")
+    >>> compute_correlation(df[["col1", "col2", "col3"]])
+    >>> compute_correlation(wide_df, memory_budget=256 * 1024 ** 2)
     """
     assert isinstance(dataset_numeric, pd.DataFrame), f"Argument 'dataset_numeric' should be pandas dataframe (pd.DataFrame)! You have {type(dataset_numeric)}."
-    # Calculate the correlations
-    corr = dataset_numeric.corr() 
-    # Melt the correlation matrix into long-form
-    corr_melted = corr.reset_index().melt(id_vars='index')
-    corr_melted.columns = ['Var1', 'Var2', 'Correlation']
-
-    # Round the correlation values to 2 decimal places
-    corr_melted['Correlation'] = corr_melted['Correlation'].round(2)
-    
-    # Create the heatmap with correlation values
+    assert isinstance(block_size, int) and block_size > 0, f"Argument 'block_size' should be a positive integer! You have {block_size}."
+    if memory_budget is not None:
+        assert isinstance(memory_budget, int) and memory_budget > 0, f"Argument 'memory_budget' should be a positive integer! You have {memory_budget}."
+
+    n_rows, n_columns = dataset_numeric.shape
+    if memory_budget is not None:
+        block_size = correlation_block_size(n_rows, memory_budget, block_size)
+    starts = range(0, n_columns, block_size)
+
+    # The standardized columns and their masks take 8 bytes per value
+    if memory_budget is None or 8 * n_rows * n_columns <= memory_budget:
+        blocks = {start: _standardize_columns(dataset_numeric, start, start + block_size) for start in starts}
+        standardized = blocks.__getitem__
+    else:
+        standardized = lambda start: _standardize_columns(dataset_numeric, start, start + block_size)
+
+    corr = np.full((n_columns, n_columns), np.nan, dtype=np.float32)
+    for i in starts:
+        z_i, m_i = standardized(i)
+        for j in range(i, n_columns, block_size):
+            z_j, m_j = (z_i, m_i) if j == i else standardized(j)
+            if not (m_i.all() and m_j.all()):
+                # Moments over the rows where both columns are present (pairwise deletion)
+                count = m_i.T @ m_j
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    sum_i, sum_j = z_i.T @ m_j, m_i.T @ z_j
+                    covariance = z_i.T @ z_j - sum_i * sum_j / count
+                    variance_i = (z_i ** 2).T @ m_j - sum_i ** 2 / count
+                    variance_j = m_i.T @ z_j ** 2 - sum_j ** 2 / count
+                    block = covariance / np.sqrt(variance_i * variance_j)
+                block[count < 2] = np.nan
+            else:
+                block = z_i.T @ z_j
+            corr[i:i + block_size, j:j + block_size] = block
+            corr[j:j + block_size, i:i + block_size] = block.T
+
+    np.clip(corr, -1, 1, out=corr)
+    # A constant column has no correlation, except with itself
+    defined = ~np.isnan(np.diag(corr))
+    corr[np.diag_indices(n_columns)] = np.where(defined, 1, np.nan)
+    return pd.DataFrame(corr, index=dataset_numeric.columns, columns=dataset_numeric.columns)
+
+def strongest_correlations(corr: pd.DataFrame, top_k: int = 20):
+    """
+    Return the `top_k` pairs of distinct columns with the largest absolute correlation.
+
+    Parameters:
+    ----------
+    corr : pd.DataFrame
+        A square correlation matrix, e.g. from `compute_correlation`.
+    top_k : int, optional
+        The number of pairs returned. Default is 20.
+
+    Returns:
+    -------
+    pd.DataFrame
+        The columns ['Var1', 'Var2', 'Correlation'], sorted by decreasing absolute correlation. Every
+        pair appears once, and missing correlations are left out.
+
+    Example:
+    -------
+    >>> strongest_correlations(compute_correlation(df), top_k=10)
+    """
+    assert isinstance(corr, pd.DataFrame) and corr.shape[0] == corr.shape[1], "Argument 'corr' should be a square pandas dataframe (pd.DataFrame)!"
+    assert isinstance(top_k, int) and top_k > 0, f"Argument 'top_k' should be a positive integer! You have {top_k}."
+
+    values = corr.to_numpy()
+    rows, cols = np.triu_indices(len(values), k=1)
+    pair_values = values[rows, cols]
+    defined = ~np.isnan(pair_values)
+    rows, cols, pair_values = rows[defined], cols[defined], pair_values[defined]
 
-    heatmap = alt.Chart(corr_melted).mark_rect().encode(
-        x='Var1:N',
-        y='Var2:N',
+    # Partially sort, only the selected pairs are ordered
+    top = np.argsort(-np.abs(pair_values))[:top_k] if len(pair_values) <= top_k else np.argpartition(-np.abs(pair_values), top_k - 1)[:top_k]
+    top = top[np.argsort(-np.abs(pair_values[top]), kind="stable")]
+    return pd.DataFrame({
+        'Var1': corr.index[rows[top]],
+        'Var2': corr.columns[cols[top]],
+        'Correlation': pair_values[top].astype(np.float64)
+    })
+
+def cluster_order(corr: pd.DataFrame):
+    """
+    Return the columns of a correlation matrix reordered so that correlated columns are adjacent.
+
+    The columns are clustered hierarchically (average linkage) on the distance 1 - |correlation|,
+    and ordered like the leaves of the dendrogram.
+
+    Parameters:
+    ----------
+    corr : pd.DataFrame
+        A square correlation matrix, e.g. from `compute_correlation`.
+
+    Returns:
+    -------
+    list
+        The column names in the clustered order.
+
+    Raises:
+    ------
+    ImportError
+        If scipy is not installed.
+    """
+    try:
+        from scipy.cluster.hierarchy import leaves_list, linkage
+        from scipy.spatial.distance import squareform
+    except ImportError as error:
+        raise ImportError("Ordering the columns by cluster requires scipy. Install it with `pip install scipy`.") from error
+
+    if len(corr) < 3:
+        return list(corr.columns)
+    distance = 1 - np.abs(np.nan_to_num(corr.to_numpy(dtype=np.float64), nan=0.0))
+    distance = (distance + distance.T) / 2
+    np.fill_diagonal(distance, 0)
+    order = leaves_list(linkage(squareform(np.clip(distance, 0, None), checks=False), method="average"))
+    return list(corr.columns[order])
+
+def correlation_image(corr: pd.DataFrame, min_size: int = 400):
+    """
+    Draw a correlation matrix as a PNG image, one square of pixels per cell.
+
+    The correlations are colored on a diverging scale from blue (-1) through white (0) to red (1).
+    Missing correlations are gray.
+
+    Parameters:
+    ----------
+    corr : pd.DataFrame
+        A square correlation matrix.
+    min_size : int, optional
+        The minimum width and height of the image in pixels, the cells are enlarged up to it. Default is 400.
+
+    Returns:
+    -------
+    bytes
+        The PNG image.
+    """
+    from summarease.rendering import encode_png
+
+    values = corr.to_numpy(dtype=np.float32)
+    blue, white, red = np.array([33, 102, 172]), np.array([247, 247, 247]), np.array([178, 24, 43])
+    weight = np.abs(np.nan_to_num(values))[..., None]
+    pixels = np.where(values[..., None] < 0, blue, red) * weight + white * (1 - weight)
+    pixels[np.isnan(values)] = 190
+
+    cell = max(1, -(-min_size // max(len(values), 1)))
+    pixels = np.repeat(np.repeat(pixels.round().astype(np.uint8), cell, axis=0), cell, axis=1)
+    return encode_png(pixels)
+
+def plot_correlation_heatmap(dataset_numeric: pd.DataFrame, top_k: int = None, order: str = None,
+                             raster_threshold: int = 60, annotate_threshold: int = 20, block_size: int = 256,
+                             corr: pd.DataFrame = None):
+    """
+    Plot the correlation heatmap of the numeric columns in a dataset.
+
+    The correlations are computed with `compute_correlation`. The cells of the heatmap share one
+    dataset between the color and the label layers, and large matrices are drawn as a single
+    image instead of one mark per cell.
+
+    Parameters:
+    ----------
+    dataset_numeric : pd.DataFrame
+        The input dataset containing the numeric columns of the heatmap. It can be None if `corr` 
+        is given.
+    top_k : int, optional
+        If given, plot the `top_k` most strongly correlated pairs of columns as a bar chart instead 
+        of the whole matrix (see `strongest_correlations`).
+    order : str, optional
+        The order of the columns. Options are None (the order of the dataset, default) or "cluster", 
+        which places correlated columns next to each other (see `cluster_order`).
+    raster_threshold : int, optional
+        Above this number of columns, the matrix is rasterized into an image embedded in the chart 
+        (see `correlation_image`), without axis labels. Default is 60.
+    annotate_threshold : int, optional
+        Up to this number of columns, the correlations are written in the cells. Default is 20.
+    block_size : int, optional
+        The number of columns per block of the correlation computation. Default is 256.
+    corr : pd.DataFrame, optional
+        The correlation matrix of `dataset_numeric`, if it was already computed (e.g., shared with 
+        a correlation table). If None, it is computed with `compute_correlation`.
+
+    Returns:
+    -------
+    alt.Chart
+        The Altair chart visualizing the correlations.
+
+    Example:
+    -------
+    >>> plot_correlation_heatmap(dataset_numeric=df[["col1", "col2", "col3"]])
+    >>> plot_correlation_heatmap(dataset_numeric=df, top_k=15)
+    """
+    import altair as alt
+    assert isinstance(dataset_numeric, pd.DataFrame) or corr is not None, f"Argument 'dataset_numeric' should be pandas dataframe (pd.DataFrame)! You have {type(dataset_numeric)}."
+    assert order in {None, "cluster"}, f"Argument 'order' should be one of the following options: [None, cluster]! You have {order}."
+    assert isinstance(raster_threshold, int), f"Argument 'raster_threshold' should be an integer! You have {type(raster_threshold)}."
+    assert isinstance(annotate_threshold, int), f"Argument 'annotate_threshold' should be an integer! You have {type(annotate_threshold)}."
+
+    # Calculate the correlations, unless they are given
+    if corr is None:
+        corr = compute_correlation(dataset_numeric, block_size=block_size)
+
+    if top_k is not None:
+        pairs = strongest_correlations(corr, top_k=top_k)
+        pairs['Pair'] = pairs['Var1'].astype(str) + " × " + pairs['Var2'].astype(str)
+        pairs['Correlation'] = pairs['Correlation'].round(2)
+        return alt.Chart(pairs).mark_bar().encode(
+            x=alt.X('Correlation:Q', scale=alt.Scale(domain=[-1, 1])),
+            y=alt.Y('Pair:N', sort=None),
+            color=alt.Color('Correlation:Q', scale=alt.Scale(scheme='redblue', domain=[-1, 1], reverse=True)),
+            tooltip=['Var1:N', 'Var2:N', 'Correlation:Q']
+        ).properties(
+            width=400,
+            title=f"Top {len(pairs)} correlated pairs"
+        )
+
+    if order == "cluster":
+        columns = cluster_order(corr)
+        corr = corr.loc[columns, columns]
+
+    if len(corr) > raster_threshold:
+        url = "data:image/png;base64," + base64.b64encode(correlation_image(corr)).decode()
+        return alt.Chart(pd.DataFrame({'x': [0], 'y': [0], 'url': [url]})).mark_image(
+            width=400, height=400, aspect=False
+        ).encode(
+            x=alt.X('x:Q', axis=None),
+            y=alt.Y('y:Q', axis=None),
+            url='url:N'
+        ).properties(
+            width=400,
+            height=400,
+            title=alt.TitleParams(f"Correlation of {len(corr)} columns", subtitle="blue: -1, white: 0, red: 1")
+        )
+
+    # Melt the correlation matrix into long-form, column by column (whatever the column names)
+    labels = corr.columns
+    corr_melted = pd.DataFrame({
+        'Var1': np.tile(labels, len(labels)),
+        'Var2': np.repeat(labels, len(labels)),
+        # Round the correlation values to 2 decimal places
+        'Correlation': corr.to_numpy(dtype=np.float64).ravel(order='F').round(2)
+    })
+
+    # Both layers share the data, which is embedded once in the specification
+    base = alt.Chart(corr_melted)
+    heatmap = base.mark_rect().encode(
+        x=alt.X('Var1:N', sort=None),
+        y=alt.Y('Var2:N', sort=None),
         color='Correlation:Q',
         tooltip=['Var1:N', 'Var2:N', 'Correlation:Q']
     ).properties(
         width=400,
         height=400
     )
-    
+    if len(corr) > annotate_threshold:
+        return heatmap
+
     # Add correlation value labels on the heatmap cells
-    text = alt.Chart(corr_melted).mark_text(dy=-5).encode(
-        x='Var1:N',
-        y='Var2:N',
+    text = base.mark_text(dy=-5).encode(
+        x=alt.X('Var1:N', sort=None),
+        y=alt.Y('Var2:N', sort=None),
         text='Correlation:Q'
     )
 
     # Overlay the text on top of the heatmap
     return heatmap + text
 
-def summarize_numeric(dataset: pd.DataFrame, summarize_by: str = "table"):
+def summarize_numeric(dataset, summarize_by: str = "table", density_method: str = "numpy", 
+                      bandwidth=None, stats: DatasetStats = None, chunksize: int = 100_000, 
+                      quantile_error: float = None, state: DatasetAccumulator = None, plot_sample_size: int = None,
+                      sampling_seed: int = 0, plot_dataset: pd.DataFrame = None, top_correlations: int = 10,
+                      memory_budget: int = None):
     """
     Summarize the numeric variables in the dataset by providing the summary statistics (e.g., mean, 
     standard deviation, min, max, etc.) for each numeric column or plotting the correlation heatmap 
@@ -114,52 +470,158 @@ def summarize_numeric(dataset: pd.DataFrame, summarize_by: str = "table"):
 
     Parameters:
     ----------
-        dataset : pd.DataFrame
-            The dataset to analyze.
+        dataset : pd.DataFrame, pyarrow.Table, polars.DataFrame, str, Path or iterable of pd.DataFrame
+            The dataset to analyze. It can also be the path of a CSV or Parquet file, or an iterable 
+            of DataFrame chunks, in which case the statistics are accumulated chunk by chunk and the 
+            plots are limited to the correlation heatmap, computed from the accumulated co-moments 
+            of the columns, as the density plots need the rows. The statistics of pyarrow Tables and Polars 
+            DataFrames are computed with Arrow compute kernels (see `compute_arrow_stats`), without 
+            converting them to pandas; only the numeric columns are converted for the plots.
         summarize_by (str): 
             The format for summarizing the numeric variables. 
-                            Options are "table" (default) or "plot". If "table", a summary table is 
+                            Options are "table" (default), "plot" or "mix". If "table", a summary table is 
                             generated with statistics for each numeric column. If "plot", a correlation 
-                            heatmap is displayed to visualize the correlation between numeric variables.
+                            heatmap is displayed to visualize the correlation between numeric variables. 
+                            If "mix", both are returned, along with a table of the most correlated pairs 
+                            of columns, and the correlation matrix is computed once for the heatmap and 
+                            the table.
+        density_method (str):
+            Where the density plots are estimated when `summarize_by="plot"`. Options are "numpy" 
+                            (default, like `summarize`) or "vega". See `plot_numeric_density`.
+        bandwidth (float, optional):
+            The kernel bandwidth used when `density_method="numpy"`. If None, Scott's rule is used.
+        stats (DatasetStats, optional):
+            Precomputed column statistics of `dataset` (see `compute_column_stats`). If None, they 
+                            are computed when needed.
+        chunksize (int):
+            The number of rows read at a time when `dataset` is a file path. Default is 100,000.
+        quantile_error (float, optional):
+            If given, the quartiles of the table are estimated with mergeable KLL sketches with this 
+                            normalized rank error (e.g., 0.01) instead of being computed exactly. Streamed 
+                            datasets always use sketches, with an error of 0.01 by default.
+        state (DatasetAccumulator, optional):
+            The summary state of the rows seen so far, e.g. loaded with `DatasetAccumulator.load`. 
+                            `dataset` only holds the new rows (or is None): they are folded into the state, 
+                            which is updated in place, and the table summarizes every row of the state. 
+                            Only `summarize_by="table"` is supported.
+        plot_sample_size (int, optional):
+            If given, the plots are drawn from a uniform random sample of at most this many rows 
+                            (see `sample_rows`), so they are approximate. Default is None, every row.
+        sampling_seed (int):
+            The seed of the sample, so the same rows are drawn every time. Default is 0.
+        plot_dataset (pd.DataFrame, optional):
+            The rows the density plots are drawn from, e.g. a sample of `dataset` drawn with 
+                            `sample_rows`. If None, they are drawn from `dataset` (see `plot_sample_size`). 
+                            With `summarize_by="mix"`, the tables and the correlations use every row of 
+                            `dataset`.
+        top_correlations (int):
+            The number of pairs of columns in the correlation table of `summarize_by="mix"`. 
+                            Default is 10.
+        memory_budget (int, optional):
+            If given, the working memory of the correlations is kept under about this many bytes 
+                            (see `compute_correlation`). Default is None, no budget.
 
     Returns:
     -------
-        A table of summary statistics or a plot (correlation heatmap), depending on the 
-              `summarize_by` argument.
+        A dictionary with the table of summary statistics ("numeric_describe") and/or the plots 
+              ("numeric_plot", "corr_plot"), depending on the `summarize_by` argument. With 
+              `summarize_by="mix"`, the most correlated pairs are given in "corr_table".
 
     Notes:
     ------
         - The correlation heatmap is only applicable if there are two or more numeric columns in the dataset.
-        - The summary statistics for numeric columns are computed using `df.describe()`, and additional details 
-          (such as count, mean, standard deviation, min, max, etc.) will be included.
+        - The summary statistics for numeric columns are laid out like `df.describe()` (count, mean, standard 
+          deviation, min, quartiles and max) and are read from the shared column statistics.
+        - When the dataset is streamed or `quantile_error` is given, the quartiles are approximate.
 
     Example:
     -------
     >>> summarize_numeric(dataset=df, summarize_by="table")
+    >>> state = DatasetAccumulator(quantile_error=0.01)
+    >>> summarize_numeric(dataset=new_partition, summarize_by="table", state=state)
     """
-    assert isinstance(dataset, pd.DataFrame), f"Argument 'dataset' should be pandas dataframe (pd.DataFrame)! You have {type(dataset)}."
+    arrow = is_arrow_table(dataset) or is_polars_frame(dataset)
+    streamed = not isinstance(dataset, pd.DataFrame) and not arrow
+    assert not streamed or is_streamable_source(dataset) or (state is not None and dataset is None), f"Argument 'dataset' should be pandas dataframe (pd.DataFrame), a pyarrow Table, a Polars DataFrame, a CSV/Parquet file path or an iterable of dataframes! You have {type(dataset)}."
     assert isinstance(summarize_by, str), f"Argument 'summarize_by' should be a string (str)! You have {type(summarize_by)}."
 
     # Lower the summarize by
     summarize_by = summarize_by.lower()
 
-    assert summarize_by in {"table", "plot"}, f"Argument 'summarize_by' should be one of the following options: [table, plot]! You have {summarize_by}."
-    
+    assert summarize_by in {"table", "plot", "mix"}, f"Argument 'summarize_by' should be one of the following options: [table, plot, mix]! You have {summarize_by}."
+    if stats is not None:
+        assert isinstance(stats, DatasetStats), f"Argument 'stats' should be a DatasetStats object! You have {type(stats)}."
+    if plot_dataset is not None:
+        assert isinstance(plot_dataset, pd.DataFrame), f"Argument 'plot_dataset' should be pandas dataframe (pd.DataFrame)! You have {type(plot_dataset)}."
+
+    # Fold the new rows into the summary state, the table summarizes every row of the state
+    if state is not None:
+        assert isinstance(state, DatasetAccumulator), f"Argument 'state' should be a DatasetAccumulator! You have {type(state)}."
+        assert summarize_by == "table", "Summary states only support summarize_by='table'!"
+        assert stats is None, "Arguments 'stats' and 'state' can't be given together!"
+        assert not arrow, "Summary states only support pandas dataframes (pd.DataFrame)!"
+        if dataset is not None:
+            state.update_from(dataset, chunksize=chunksize)
+        stats = state.to_stats()
+
+    # Fold the chunks into the column statistics if the dataset is streamed, with the co-moments of the
+    # columns for the correlation plots
+    if streamed and stats is None:
+        stats = accumulate_stats(dataset, chunksize=chunksize, quantile_error=quantile_error or DEFAULT_QUANTILE_ERROR,
+                                 co_moments=summarize_by != "table")
+    if streamed and summarize_by != "table":
+        assert stats.correlation is not None, "Plots of streamed datasets need statistics accumulated with co_moments=True!"
+
+    # Arrow tables are summarized by Arrow kernels, only the plots need the numeric columns in pandas
+    if arrow:
+        if stats is None:
+            stats = compute_arrow_stats(dataset, quantile_error=quantile_error)
+        if summarize_by != "table" and stats.n_rows > 0:
+            dataset = to_arrow_table(dataset).select(stats.numeric_columns).to_pandas()
+
     # Select the numeric columns from the dataset
-    dataset_numeric = dataset.select_dtypes(include=['number'])
+    if stats is not None:
+        numeric_columns = stats.numeric_columns
+        n_rows = stats.n_rows
+    else:
+        numeric_columns = [col for col, dtype in dataset.dtypes.items() if is_summarizable_numeric(dtype)]
+        n_rows = len(dataset)
 
-    if dataset_numeric.empty:
+    if n_rows == 0 or not numeric_columns:
         return
 
     outputs = {}
 
-    if (summarize_by == "plot"):
-        outputs["numeric_plot"] = plot_numeric_density(dataset_numeric)
+    # The numeric columns are selected without copying them
+    if summarize_by in {"table", "mix"}:
+        if stats is None:
+            stats = compute_column_stats(select_columns(dataset, numeric_columns), quantile_error=quantile_error)
+        outputs["numeric_describe"] = describe_from_stats(stats, numeric_columns)
+
+    if summarize_by in {"plot", "mix"} and streamed:
+        # Without the rows, only the correlations accumulated with the statistics are plotted
+        if len(numeric_columns) > 1:
+            corr = stats.correlation.loc[numeric_columns, numeric_columns]
+            outputs["corr_plot"] = plot_correlation_heatmap(None, corr=corr)
+            if summarize_by == "mix":
+                outputs["corr_table"] = strongest_correlations(corr, top_k=top_correlations)
+
+    elif summarize_by in {"plot", "mix"}:
+        if plot_dataset is not None:
+            dataset_numeric = select_columns(plot_dataset, numeric_columns)
+        else:
+            dataset_numeric = select_columns(dataset, numeric_columns)
+            if plot_sample_size is not None:
+                dataset_numeric, _ = sample_rows(dataset_numeric, plot_sample_size, seed=sampling_seed)
+        outputs["numeric_plot"] = plot_numeric_density(dataset_numeric, density_method=density_method, bandwidth=bandwidth)
         
         if (dataset_numeric.shape[1] > 1):
-            outputs["corr_plot"] = plot_correlation_heatmap(dataset_numeric)
-
-    elif (summarize_by == "table"):
-        outputs["numeric_describe"] = dataset_numeric.describe()
+            if summarize_by == "mix":
+                # The heatmap and the table share the correlations of every row
+                corr = compute_correlation(select_columns(dataset, numeric_columns), memory_budget=memory_budget)
+                outputs["corr_table"] = strongest_correlations(corr, top_k=top_correlations)
+            else:
+                corr = compute_correlation(dataset_numeric, memory_budget=memory_budget)
+            outputs["corr_plot"] = plot_correlation_heatmap(dataset_numeric, corr=corr)
         
     return outputs
\ No newline at end of file
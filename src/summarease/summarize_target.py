@@ -1,9 +1,12 @@
+import numpy as np
 import pandas as pd
-import altair as alt
 import warnings
+from summarease.column_stats import DatasetStats, describe_from_stats
+from summarease.accumulators import DatasetAccumulator
 
 def summarize_target_df(dataset_name: pd.DataFrame, target_variable: str, 
-                     target_type: str, threshold=0.2):
+                     target_type: str, threshold=0.2, stats: DatasetStats = None,
+                     state: DatasetAccumulator = None, top_n: int = None):
     """Summarize and evaluate the target variable for categarical or numerical types.
 
     Parameters
@@ -17,13 +20,30 @@ def summarize_target_df(dataset_name: pd.DataFrame, target_variable: str,
     threshold : float, optional
         Only feasible for "categorical" type to identify class imbalance.
         Default is 0.2.
+    stats : DatasetStats, optional
+        Precomputed column statistics of the dataset (see `compute_column_stats`). 
+        The value counts of a categorical target are read from `stats.value_counts` 
+        and the summary of a numerical target from `stats.columns` when available.
+    state : DatasetAccumulator, optional
+        The summary state of the rows seen so far. `dataset_name` only holds the new 
+        rows (or is None): they are folded into the state, which is updated in place, 
+        and the target is summarized over every row of the state.
+    top_n : int, optional
+        Only for "categorical" type. If given, only the `top_n` most frequent classes 
+        are listed, by decreasing proportion, and the other classes are folded into 
+        a last "other" row. The imbalance flags are computed for the top classes only.
+        With statistics counting the heavy hitters only (see `DatasetAccumulator`), 
+        the proportions are lower bounds and the classes are not flagged, as the 
+        number of classes is unknown.
 
     Returns
     -------
     DataFrame
         If target_type="categorical", returns a summary DataFrame 
             containing classes, proportions, imbalance flag,
-            and threshold.
+            and threshold. With `top_n`, the expected proportion range of every 
+            class is given as well, in the columns 'expected_lower' and 
+            'expected_upper'.
         If target_type="numerical", returns the DataFrame with the basic 
             statistical summary. 
 
@@ -48,21 +68,53 @@ def summarize_target_df(dataset_name: pd.DataFrame, target_variable: str,
     """
     if target_type == "categorical" and (threshold < 0 or threshold > 1):
         raise ValueError("Threshold must be between 0 and 1.")
+
+    # Fold the new rows into the summary state and summarize every row of the state
+    if state is not None:
+        assert isinstance(state, DatasetAccumulator), f"Argument 'state' should be a DatasetAccumulator! You have {type(state)}."
+        if target_type == "categorical":
+            state.track_value_counts(target_variable)
+        if dataset_name is not None:
+            state.update_from(dataset_name)
+        stats = state.to_stats()
+        if target_variable not in stats.columns.index:
+            raise KeyError(f"Column not found in the summary state: {target_variable}")
     
     if target_type == "categorical":
-        # Calculate class proportions
-        value_counts = dataset_name[target_variable].value_counts(normalize=True).sort_index()
-        n_classes = len(value_counts)
-
+        if top_n is not None:
+            assert isinstance(top_n, int) and top_n > 0, f"Argument 'top_n' should be a positive integer! You have {top_n}."
+
+        # Count the classes
+        if stats is not None and target_variable in stats.value_counts:
+            counts = stats.value_counts[target_variable]
+            n_values = stats.columns.loc[target_variable, 'count'] if target_variable in stats.columns.index else counts.sum()
+            n_unique = stats.columns.loc[target_variable, 'n_unique'] if target_variable in stats.columns.index else len(counts)
+        else:
+            counts = dataset_name[target_variable].value_counts()
+            n_values = counts.sum()
+            n_unique = len(counts)
         # Deal with empty data
-        if n_classes == 0:
+        if len(counts) == 0:
             return pd.DataFrame(columns=['class', 'proportion', 'imbalanced', 'threshold'])
 
+        # The counts of a heavy hitters sketch leave out the rare classes, so the number of classes
+        # and the expected proportion are unknown
+        exact = not pd.isna(n_unique)
+        n_classes = int(n_unique) if exact else np.nan
+
+        # Calculate class proportions, of the most frequent classes only with `top_n`
+        if top_n is None:
+            value_counts = (counts / n_values).sort_index()
+        else:
+            value_counts = counts.nlargest(top_n) / n_values
+
         # Calculate expected range for balance
         expected_proportion = 1 / n_classes
         lower_bound = expected_proportion * (1 - threshold)
         upper_bound = expected_proportion * (1 + threshold)
         imbalance_flag = (value_counts < lower_bound) | (value_counts > upper_bound)
+        if not exact:
+            imbalance_flag = pd.Series([None] * len(value_counts), index=value_counts.index, dtype=object)
 
         # Generate summary table
         summary_df = pd.DataFrame({
@@ -72,9 +124,23 @@ def summarize_target_df(dataset_name: pd.DataFrame, target_variable: str,
         })
         summary_df['threshold'] = threshold
 
+        if top_n is not None:
+            summary_df['expected_lower'] = lower_bound
+            summary_df['expected_upper'] = upper_bound
+
+            # Fold the remaining classes into one row, without an imbalance flag
+            n_other = n_values - counts.loc[value_counts.index].sum()
+            if n_other > 0:
+                label = f"other ({n_classes - len(value_counts)} classes)" if exact else "other"
+                other = pd.DataFrame({'class': [label], 'proportion': [n_other / n_values], 'imbalanced': [None],
+                                      'threshold': [threshold], 'expected_lower': [np.nan], 'expected_upper': [np.nan]})
+                summary_df = pd.concat([summary_df.astype({'imbalanced': object}), other], ignore_index=True)
+
     elif target_type == "numerical":
+        use_stats = stats is not None and target_variable in stats.numeric_columns
+
         # Check for empty numerical data
-        if dataset_name[target_variable].empty:
+        if (stats.n_rows == 0) if use_stats else dataset_name[target_variable].empty:
             return pd.DataFrame()
 
         # Warn if threshold is provided
@@ -82,7 +148,10 @@ def summarize_target_df(dataset_name: pd.DataFrame, target_variable: str,
             warnings.warn("Threshold is not used for numerical targets.", UserWarning)
 
         # Get statistical summary
-        summary_df = dataset_name[target_variable].describe().to_frame().T
+        if use_stats:
+            summary_df = describe_from_stats(stats, [target_variable]).T
+        else:
+            summary_df = dataset_name[target_variable].describe().to_frame().T
 
     else:
         raise ValueError("Invalid target_type. Must be 'categorical' or 'numerical'.")
@@ -109,12 +178,16 @@ def summarize_target_balance_plot(summary_df: pd.DataFrame):
 
     Notes
     -----
+    The classes are drawn in the order of `summary_df`. The "other" row of a summary 
+    of the top classes is drawn in gray, without an expected range.
+
     The chart includes the following:
         - A bar plot for actual class proportions.
         - Expected proportion range (lower and upper bounds) as balance range.
         - Imbalance status for each class indicated by color.
         - Highlighted ticks for expected lower and upper bounds.
     """
+    import altair as alt
     # Validate input DataFrame
     required_columns = {'class', 'proportion', 'imbalanced', 'threshold'}
     if not required_columns.issubset(summary_df.columns):
@@ -128,25 +201,27 @@ def summarize_target_balance_plot(summary_df: pd.DataFrame):
             title="Categorical Target Balance Visualization (Empty)"
         )
 
-    # Add expected proportion range to the DataFrame
-    n_classes = len(summary_df)
-    expected_proportion = 1 / n_classes
-    threshold = summary_df['threshold'].iloc[0]
-    summary_df['expected_lower'] = expected_proportion * (1 - threshold)
-    summary_df['expected_upper'] = expected_proportion * (1 + threshold)
+    # Add expected proportion range to a copy of the DataFrame, unless the summary of the top classes has it
+    if not {'expected_lower', 'expected_upper'}.issubset(summary_df.columns):
+        n_classes = len(summary_df)
+        expected_proportion = 1 / n_classes
+        threshold = summary_df['threshold'].iloc[0]
+        summary_df = summary_df.assign(expected_lower=expected_proportion * (1 - threshold),
+                                       expected_upper=expected_proportion * (1 + threshold))
 
     # Bar chart for actual proportions
     actual_dist = alt.Chart(summary_df).mark_bar(opacity=0.6).encode(
-        x=alt.X('class:N', title='Class'),
+        x=alt.X('class:N', title='Class', sort=None),
         y=alt.Y('proportion:Q', title='Proportion'),
-        color=alt.Color('imbalanced:N', scale=alt.Scale(domain=[True, False], range=['red', 'green']),
-                        legend=alt.Legend(title="Imbalanced")),
+        color=alt.condition('datum.imbalanced === null', alt.value('gray'),
+                            alt.Color('imbalanced:N', scale=alt.Scale(domain=[True, False], range=['red', 'green']),
+                                      legend=alt.Legend(title="Imbalanced"))),
         tooltip=['class', 'proportion', 'imbalanced']
     )
 
     # Error bars for expected range
     error_bar = alt.Chart(summary_df).mark_errorbar(color='black').encode(
-        x=alt.X('class:N', title='Class'),
+        x=alt.X('class:N', title='Class', sort=None),
         y=alt.Y('expected_lower:Q', title='Expected Proportion Range'),
         y2='expected_upper:Q'
     )
@@ -157,7 +232,7 @@ def summarize_target_balance_plot(summary_df: pd.DataFrame):
         thickness=2,
         size=20  
     ).encode(
-        x=alt.X('class:N', title='Class'),
+        x=alt.X('class:N', title='Class', sort=None),
         y=alt.Y('expected_lower:Q')  
     )
 
@@ -166,7 +241,7 @@ def summarize_target_balance_plot(summary_df: pd.DataFrame):
         thickness=2,
         size=20  
     ).encode(
-        x=alt.X('class:N'),
+        x=alt.X('class:N', sort=None),
         y=alt.Y('expected_upper:Q')  
     )
 
@@ -0,0 +1,17 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def dataset():
+    """
+    A synthetic dataset of 1,200 rows: a float column, a float column of integers with missing
+    values and a categorical column of 3 classes.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'A': rng.normal(10, 2, size=1_200),
+        'B': np.where(rng.random(1_200) < 0.1, np.nan, rng.integers(0, 50, size=1_200)),
+        'label': rng.choice(['x', 'y', 'z'], size=1_200),
+    })
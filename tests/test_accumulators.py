@@ -0,0 +1,325 @@
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from pandas.testing import assert_frame_equal
+from summarease.accumulators import (NumericAccumulator, ValueCountsAccumulator, DatasetAccumulator, CoMomentsAccumulator,
+                                     accumulate_stats, iter_dataset_chunks, is_streamable_source, list_dataset_files)
+from summarease.column_stats import compute_column_stats, describe_from_stats
+from summarease.summarize_numeric import summarize_numeric
+from summarease.summarize_target import summarize_target_df
+from summarease.summarize import summarize
+
+
+def split_rows(dataset, n_chunks):
+    bounds = np.linspace(0, len(dataset), n_chunks + 1).astype(int)
+    return [dataset.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def test_numeric_accumulator_matches_full_pass(dataset):
+    """
+    Tests that folding a column in batches gives the statistics of a single pass.
+    """
+    acc = NumericAccumulator()
+    for chunk in split_rows(dataset, 7):
+        acc.update(chunk['B'])
+
+    assert acc.count == dataset['B'].count()
+    assert acc.nulls == dataset['B'].isna().sum()
+    assert acc.mean == pytest.approx(dataset['B'].mean())
+    assert acc.std == pytest.approx(dataset['B'].std())
+    assert acc.min == dataset['B'].min()
+    assert acc.max == dataset['B'].max()
+
+
+def test_numeric_accumulator_merge_is_stable(dataset):
+    """
+    Tests merging accumulators of partitions with a large mean and a small variance.
+    """
+    values = dataset['A'] + 1e6
+    left, right = NumericAccumulator(), NumericAccumulator()
+    left.update(values.iloc[:300])
+    right.update(values.iloc[300:])
+    left.merge(right)
+
+    assert left.mean == pytest.approx(values.mean())
+    assert left.std == pytest.approx(values.std(), rel=1e-9)
+
+    empty = NumericAccumulator().merge(NumericAccumulator())
+    assert empty.count == 0
+    assert np.isnan(empty.std)
+
+
+def test_value_counts_accumulator(dataset):
+    acc = ValueCountsAccumulator()
+    other = ValueCountsAccumulator()
+    acc.update(dataset['label'].iloc[:500])
+    other.update(dataset['label'].iloc[500:])
+    acc.merge(other)
+
+    assert acc.counts.sort_index().to_dict() == dataset['label'].value_counts().sort_index().to_dict()
+
+
+def test_value_counts_accumulator_heavy_hitters():
+    """
+    Tests the Misra-Gries guarantees: the frequent values are kept and underestimated by at most the error.
+    """
+    rng = np.random.default_rng(0)
+    values = pd.Series(rng.zipf(1.3, size=50_000) % 10_000)
+    acc = ValueCountsAccumulator(capacity=50)
+    for part in split_rows(values, 7):
+        acc.update(part)
+    other = ValueCountsAccumulator(capacity=50).update(values.iloc[:10_000])
+    acc.merge(other)
+
+    exact = values.value_counts().add(values.iloc[:10_000].value_counts(), fill_value=0)
+    assert len(acc.counts) <= 50 and not acc.exact
+    assert acc.error <= exact.sum() / 51
+    assert set(exact[exact > exact.sum() / 51].index) <= set(acc.counts.index)
+    underestimate = exact.loc[acc.counts.index] - acc.counts
+    assert (underestimate >= 0).all() and (underestimate <= acc.error).all()
+
+    assert ValueCountsAccumulator(capacity=10).update(['a', 'b', 'a']).exact
+    with pytest.raises(AssertionError):
+        ValueCountsAccumulator(capacity=0)
+
+
+def test_dataset_accumulator_heavy_hitters(dataset):
+    stats = accumulate_stats(split_rows(dataset, 4), value_counts_for=['label', 'B'], heavy_hitters=5)
+
+    assert stats.columns.loc['label', 'n_unique'] == 3
+    assert pd.isna(stats.columns.loc['B', 'n_unique'])
+    assert len(stats.value_counts['B']) <= 5
+
+
+def test_dataset_accumulator_matches_column_stats(dataset):
+    """
+    Tests that the streamed statistics match the in-memory statistics, quartiles excluded.
+    """
+    acc = DatasetAccumulator(value_counts_for=['label'])
+    for chunk in split_rows(dataset, 4):
+        acc.update(chunk)
+    streamed = acc.to_stats()
+    in_memory = compute_column_stats(dataset, value_counts_for=['label'])
+
+    assert streamed.n_rows == in_memory.n_rows
+    assert streamed.numeric_columns == in_memory.numeric_columns
+    assert_frame_equal(
+        describe_from_stats(streamed).drop(index=['25%', '50%', '75%']),
+        describe_from_stats(in_memory).drop(index=['25%', '50%', '75%'])
+    )
+    assert streamed.columns.loc['label', 'n_unique'] == 3
+    assert streamed.columns.loc['B', 'dtype'] == 'float64'
+    assert streamed.columns[['25%', '50%', '75%']].isna().all().all()
+
+
+def test_dataset_accumulator_sketches(dataset):
+    parts = [DatasetAccumulator(quantile_error=0.01).update(chunk) for chunk in split_rows(dataset, 3)]
+    merged = parts[0].merge(parts[1]).merge(parts[2]).to_stats()
+    expected = dataset['A'].quantile([0.25, 0.5, 0.75]).to_numpy()
+
+    assert merged.columns.loc['A', ['25%', '50%', '75%']].to_numpy(dtype=float) == pytest.approx(expected, abs=0.2)
+
+
+def test_dataset_accumulator_merge(dataset):
+    parts = [DatasetAccumulator().update(chunk) for chunk in split_rows(dataset, 3)]
+    merged = parts[0].merge(parts[1]).merge(parts[2]).to_stats()
+
+    assert merged.n_rows == len(dataset)
+    assert merged.columns.loc['B', 'nulls'] == dataset['B'].isna().sum()
+    assert merged.columns.loc['label', 'count'] == len(dataset)
+
+
+@pytest.mark.parametrize("options", [{'quantile_error': 0.01}, {'co_moments': True}, {'value_counts_for': ['label']},
+                                     {'value_counts_for': ['label'], 'heavy_hitters': 2}])
+def test_dataset_accumulator_merge_mismatched_states(dataset, options):
+    """
+    Tests that states tracking different statistics are not merged into statistics of part of the rows.
+    """
+    base = {'value_counts_for': ['label']} if 'heavy_hitters' in options else {}
+    left = DatasetAccumulator(**base).update(dataset.iloc[:600])
+    right = DatasetAccumulator(**options).update(dataset.iloc[600:])
+
+    with pytest.raises(ValueError, match="do not track the same statistics"):
+        left.merge(right)
+    with pytest.raises(ValueError, match="do not track the same statistics"):
+        right.merge(left)
+
+
+def test_dataset_accumulator_merge_copies_sketches(dataset):
+    merged = DatasetAccumulator(quantile_error=0.01)
+    other = DatasetAccumulator(quantile_error=0.01).update(dataset)
+    merged.merge(other).update(dataset)
+
+    assert merged.sketches['A'].count == 2 * len(dataset)
+    assert other.sketches['A'].count == len(dataset)
+
+
+def test_co_moments_accumulator_matches_pandas(dataset):
+    """
+    Tests that the correlations merged from chunks with different columns match a full pass.
+    """
+    data = dataset[['A', 'B']].assign(C=lambda df: df['A'] * 2 - df['B'], D=1.0)
+    chunks = split_rows(data, 4)
+    parts = [CoMomentsAccumulator().update(chunk) for chunk in chunks[:3]]
+    # A chunk without the column C, which is then missing from its rows
+    parts.append(CoMomentsAccumulator().update(chunks[3].drop(columns='C')))
+    merged = parts[0].merge(parts[1]).merge(parts[2]).merge(parts[3]).correlation()
+    expected = data.assign(C=data['C'].mask(data.index >= chunks[3].index[0])).corr()
+
+    assert list(merged.columns) == ['A', 'B', 'C', 'D']
+    assert_frame_equal(merged, expected.astype(np.float32), atol=1e-6)
+    # The correlations of constant columns are undefined
+    assert merged['D'].isna().all()
+
+
+def test_accumulate_stats_co_moments(dataset):
+    stats = accumulate_stats(iter(split_rows(dataset, 3)), co_moments=True)
+
+    assert list(stats.correlation.columns) == ['A', 'B']
+    assert stats.correlation.loc['A', 'B'] == pytest.approx(dataset[['A', 'B']].corr().loc['A', 'B'], abs=1e-6)
+    assert accumulate_stats(iter(split_rows(dataset, 3))).correlation is None
+
+
+def test_dtype_promotion_across_chunks():
+    chunks = [pd.DataFrame({'A': [1, 2]}), pd.DataFrame({'A': [1.5, np.nan]})]
+    stats = accumulate_stats(iter(chunks))
+
+    assert stats.columns.loc['A', 'dtype'] == 'float64'
+    assert stats.columns.loc['A', 'count'] == 3
+
+
+def test_iter_dataset_chunks_csv(dataset, tmp_path):
+    path = tmp_path / "data.csv"
+    dataset.to_csv(path, index=False)
+    chunks = list(iter_dataset_chunks(path, chunksize=500))
+
+    assert [len(chunk) for chunk in chunks] == [500, 500, 200]
+    assert is_streamable_source(str(path))
+    assert not is_streamable_source("not a dataframe")
+
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        list(iter_dataset_chunks(tmp_path / "data.xlsx"))
+
+
+def test_iter_dataset_chunks_parquet(dataset, tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.parquet"
+    dataset.to_parquet(path, row_group_size=250)
+
+    assert sum(len(chunk) for chunk in iter_dataset_chunks(path, chunksize=250)) == len(dataset)
+
+
+def test_iter_dataset_chunks_directory(dataset, tmp_path):
+    for index, chunk in enumerate(split_rows(dataset, 3)):
+        (tmp_path / f"part={index}").mkdir()
+        chunk.to_csv(tmp_path / f"part={index}" / "data.csv", index=False)
+    (tmp_path / "_SUCCESS").write_text("")
+
+    assert [path.parent.name for path in list_dataset_files(tmp_path)] == ["part=0", "part=1", "part=2"]
+    assert is_streamable_source(tmp_path)
+    assert sum(len(chunk) for chunk in iter_dataset_chunks(tmp_path, chunksize=100)) == len(dataset)
+    assert sum(len(chunk) for chunk in iter_dataset_chunks(list_dataset_files(tmp_path))) == len(dataset)
+
+
+def test_summarize_numeric_from_csv(dataset, tmp_path):
+    path = tmp_path / "data.csv"
+    dataset.to_csv(path, index=False)
+    result = summarize_numeric(str(path), summarize_by="table", chunksize=128)["numeric_describe"]
+    expected = dataset[['A', 'B']].describe()
+
+    assert list(result.columns) == ['A', 'B']
+    assert result.loc['mean', 'A'] == pytest.approx(expected.loc['mean', 'A'])
+    assert result.loc['std', 'B'] == pytest.approx(expected.loc['std', 'B'])
+    assert result.loc['50%', 'B'] == pytest.approx(expected.loc['50%', 'B'], abs=2)
+
+    # The correlations are accumulated with the statistics, the density plots need the rows
+    charts = summarize_numeric(str(path), summarize_by="plot", chunksize=128)
+    assert set(charts) == {"corr_plot"}
+
+
+def test_summarize_from_chunks(dataset, tmp_path):
+    output_dir = tmp_path / "summary"
+    summarize(
+        dataset=iter(split_rows(dataset, 5)),
+        target_variable="label",
+        summarize_by="table",
+        output_file="streamed.pdf",
+        output_dir=str(output_dir)
+    )
+
+    assert (output_dir / "streamed.pdf").exists()
+
+
+def test_summarize_top_classes_from_chunks(dataset, tmp_path):
+    summarize(
+        dataset=iter(split_rows(dataset, 5)),
+        target_variable="label",
+        target_top_n=2,
+        summarize_by="table",
+        output_dir=str(tmp_path) + "/"
+    )
+
+    assert (tmp_path / "summary.pdf").exists()
+    with pytest.raises(AssertionError, match="Argument 'target_top_n' should be a positive integer"):
+        summarize(dataset, target_variable="label", target_top_n=0, output_dir=str(tmp_path) + "/")
+
+
+def test_state_save_and_load(dataset, tmp_path):
+    state = DatasetAccumulator(value_counts_for=['label'], quantile_error=0.01).update(dataset)
+    path = state.save(tmp_path / "events.state")
+    loaded = DatasetAccumulator.load(path)
+
+    assert_frame_equal(loaded.to_stats().columns, state.to_stats().columns)
+    assert loaded.value_counts['label'].counts.equals(state.value_counts['label'].counts)
+
+    (tmp_path / "other.state").write_bytes(b"\x80\x04K\x01.")
+    with pytest.raises(ValueError, match="Not a summary state"):
+        DatasetAccumulator.load(tmp_path / "other.state")
+
+
+def test_summarize_numeric_incremental_state(dataset, tmp_path):
+    """
+    Tests that summarizing the partitions one by one through a saved state covers every row.
+    """
+    path = tmp_path / "events.state"
+    DatasetAccumulator(quantile_error=0.01).save(path)
+    for partition in split_rows(dataset, 4):
+        state = DatasetAccumulator.load(path)
+        result = summarize_numeric(partition, summarize_by="table", state=state)["numeric_describe"]
+        state.save(path)
+    expected = dataset[['A', 'B']].describe()
+
+    assert_frame_equal(result.drop(index=['25%', '50%', '75%']), expected.drop(index=['25%', '50%', '75%']))
+    assert result.loc['50%', 'B'] == pytest.approx(expected.loc['50%', 'B'], abs=2)
+    assert summarize_numeric(None, summarize_by="table", state=state)["numeric_describe"].equals(result)
+
+    with pytest.raises(AssertionError, match="Summary states only support"):
+        summarize_numeric(dataset, summarize_by="plot", state=state)
+
+
+def test_summarize_target_df_state_merge(dataset):
+    """
+    Tests that the states of two partitions merge into the summary of the whole dataset.
+    """
+    left, right = DatasetAccumulator(), DatasetAccumulator()
+    summarize_target_df(dataset.iloc[:400], 'label', 'categorical', state=left)
+    summarize_target_df(dataset.iloc[400:], 'label', 'categorical', state=right)
+    result = summarize_target_df(None, 'label', 'categorical', state=left.merge(right))
+    expected = summarize_target_df(dataset, 'label', 'categorical')
+
+    assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
+
+    with pytest.raises(ValueError, match="does not track the value counts"):
+        DatasetAccumulator().update(dataset).track_value_counts('label')
+
+
+def test_summarize_with_state(dataset, tmp_path):
+    state = DatasetAccumulator(quantile_error=0.01)
+    for partition in split_rows(dataset, 2):
+        summarize(partition, summarize_by="table", target_variable="label", output_file="incremental.pdf",
+                  output_dir=str(tmp_path), state=state)
+
+    assert state.n_rows == len(dataset)
+    assert state.value_counts['label'].counts.sum() == len(dataset)
+    assert (tmp_path / "incremental.pdf").exists()
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from summarease.arrow_stats import arrow_numpy_dtype, arrow_pandas_dtypes, compute_arrow_stats, is_arrow_table, is_polars_frame
+from summarease.column_stats import compute_column_stats
+from summarease.summarize_dtypes import summarize_dtypes_table
+from summarease.summarize_numeric import summarize_numeric
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def dataset(dataset):
+    """
+    The shared dataset, with the types pyarrow converts differently: integers, booleans and strings with nulls.
+    """
+    return dataset.assign(int_col=np.arange(len(dataset)), bool_col=dataset['A'] > 10,
+                          label=np.where(dataset.index % 11 == 0, None, dataset['label']))
+
+
+def test_is_arrow_table(dataset):
+    table = pa.Table.from_pandas(dataset)
+
+    assert is_arrow_table(table) and is_arrow_table(table.to_batches()[0])
+    assert not is_arrow_table(dataset) and not is_polars_frame(table)
+
+
+def test_arrow_numpy_dtype():
+    assert arrow_numpy_dtype(pa.int32()) == np.int32
+    assert arrow_numpy_dtype(pa.string()) == object
+    assert str(arrow_numpy_dtype(pa.dictionary(pa.int32(), pa.string()))) == "category"
+
+
+@pytest.mark.parametrize("nan_as_null", [True, False])
+def test_compute_arrow_stats_matches_pandas(dataset, nan_as_null):
+    """
+    Tests that the Arrow statistics match the pandas ones, whether the missing floats are nulls or NaN.
+    """
+    table = pa.table({col: pa.array(dataset[col], from_pandas=nan_as_null) for col in dataset.columns})
+    expected = compute_column_stats(dataset, value_counts_for=['label'])
+    stats = compute_arrow_stats(table, value_counts_for=['label'])
+
+    assert stats.n_rows == expected.n_rows
+    assert_frame_equal(stats.columns, expected.columns, check_dtype=False, check_exact=False)
+    assert stats.value_counts['label'].to_dict() == expected.value_counts['label'].to_dict()
+
+
+def test_compute_arrow_stats_sketch_and_empty_column():
+    table = pa.table({'x': pa.array(np.arange(10_000, dtype=np.float64)), 'empty': pa.nulls(10_000, pa.float64())})
+    stats = compute_arrow_stats(table, quantile_error=0.01)
+
+    assert stats.columns.loc['x', '50%'] == pytest.approx(5_000, abs=200)
+    assert stats.columns.loc['empty', 'count'] == 0 and np.isnan(stats.columns.loc['empty', 'min'])
+    with pytest.raises(KeyError, match="not found"):
+        compute_arrow_stats(table, value_counts_for=['missing'])
+
+
+def test_summarize_numeric_arrow(dataset):
+    table = pa.Table.from_pandas(dataset, preserve_index=False)
+    expected = summarize_numeric(dataset, summarize_by="table")["numeric_describe"]
+
+    assert_frame_equal(summarize_numeric(table, summarize_by="table")["numeric_describe"], expected)
+    charts = summarize_numeric(table, summarize_by="plot", density_method="numpy")
+    assert set(charts) == {"numeric_plot", "corr_plot"}
+
+
+def test_summarize_dtypes_table_arrow(dataset):
+    table = pa.Table.from_pandas(dataset, preserve_index=False)
+
+    assert_frame_equal(summarize_dtypes_table(table), summarize_dtypes_table(dataset))
+
+
+def test_arrow_pandas_dtypes_nullable_ints():
+    """
+    Tests that integer columns with missing values get the dtypes of their conversion to pandas.
+    """
+    table = pa.table({'int_nulls': pa.array([1, None, 3], pa.int64()), 'int_col': pa.array([1, 2, 3], pa.int8()),
+                      'bool_nulls': pa.array([True, None, False])})
+    nullable = pa.Table.from_pandas(pd.DataFrame({'a': pd.array([1, None, 3], dtype='Int64'), 'b': [1.0, 2.0, 3.0]}))
+
+    assert [str(dtype) for dtype in arrow_pandas_dtypes(table)] == ['float64', 'int8', 'object']
+    assert [str(dtype) for dtype in arrow_pandas_dtypes(nullable)] == ['Int64', 'float64']
+    for data in [table, nullable]:
+        assert_frame_equal(summarize_dtypes_table(data), summarize_dtypes_table(data.to_pandas()))
+        assert (compute_arrow_stats(data).columns['dtype'] == compute_column_stats(data.to_pandas()).columns['dtype']).all()
+
+
+def test_polars_input(dataset):
+    pl = pytest.importorskip("polars")
+    frame = pl.from_pandas(dataset)
+    expected = summarize_numeric(dataset, summarize_by="table")["numeric_describe"]
+
+    assert is_polars_frame(frame)
+    assert_frame_equal(summarize_numeric(frame, summarize_by="table")["numeric_describe"], expected)
+    assert summarize_dtypes_table(frame)['Count'].sum() == 5
@@ -0,0 +1,83 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from summarease.batch import report_file_name, summarize_batch
+
+
+@pytest.fixture
+def datasets(tmp_path):
+    rng = np.random.default_rng(0)
+    sales = pd.DataFrame({'amount': rng.normal(size=200), 'store': rng.choice(['a', 'b'], size=200)})
+    sales_path = tmp_path / "sales.csv"
+    sales.to_csv(sales_path, index=False)
+    return {
+        'sales': str(sales_path),
+        'users': pd.DataFrame({'age': rng.integers(18, 80, size=100), 'score': rng.random(100)}),
+        # The reports need at least two columns, so this one fails
+        'broken': pd.DataFrame({'only': [1, 2, 3]}),
+    }
+
+
+def test_report_file_name():
+    assert report_file_name("sales") == "sales.pdf"
+    assert report_file_name("db/table name") == "db_table_name.pdf"
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_summarize_batch_isolates_failures(datasets, tmp_path, max_workers):
+    output_dir = tmp_path / "reports"
+    manifest = summarize_batch(datasets, output_dir=str(output_dir), max_workers=max_workers, summarize_by="table")
+
+    assert [entry['name'] for entry in manifest['datasets']] == ['sales', 'users', 'broken']
+    assert [entry['status'] for entry in manifest['datasets']] == ['ok', 'ok', 'failed']
+    assert manifest['n_failed'] == 1
+    assert "at least 2 columns" in manifest['datasets'][2]['error']
+    assert all(entry['wall_time'] > 0 for entry in manifest['datasets'])
+
+    assert (output_dir / "sales.pdf").exists() and (output_dir / "users.pdf").exists()
+    assert not (output_dir / "broken.pdf").exists()
+    assert json.loads((output_dir / "manifest.json").read_text())['datasets'][0]['name'] == 'sales'
+
+
+class CrashOnUnpickle:
+    """
+    A value that kills the worker process receiving it, like a worker running out of memory.
+    """
+
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def test_summarize_batch_isolates_crashed_workers(datasets, tmp_path):
+    """
+    Tests that a worker that dies only fails its own dataset, not the others of the broken pool.
+    """
+    users = datasets['users']
+    batch = {f'users_{index}': users for index in range(5)}
+    batch['crash'] = pd.DataFrame({'a': [1, 2], 'b': [CrashOnUnpickle(), CrashOnUnpickle()]})
+    batch['sales'] = datasets['sales']
+    manifest = summarize_batch(batch, output_dir=str(tmp_path), max_workers=2, summarize_by="table")
+
+    statuses = {entry['name']: entry['status'] for entry in manifest['datasets']}
+    assert statuses.pop('crash') == 'failed'
+    assert set(statuses.values()) == {'ok'}
+    assert manifest['n_failed'] == 1
+    assert "BrokenProcessPool" in manifest['datasets'][5]['error']
+
+
+def test_summarize_batch_stage_timings(datasets, tmp_path):
+    manifest = summarize_batch({'users': datasets['users']}, output_dir=str(tmp_path), summarize_by="table", profile=True)
+
+    stages = {stage['name'] for stage in manifest['datasets'][0]['stages']}
+    assert {"column_stats", "pdf_output"} <= stages
+
+
+def test_summarize_batch_invalid_arguments(datasets, tmp_path):
+    with pytest.raises(AssertionError, match="Every dataset should be"):
+        summarize_batch({'chunks': iter([datasets['users']])}, output_dir=str(tmp_path))
+    with pytest.raises(AssertionError, match="distinct report file names"):
+        summarize_batch({'a b': datasets['users'], 'a_b': datasets['users']}, output_dir=str(tmp_path))
+    with pytest.raises(AssertionError, match="named after the datasets"):
+        summarize_batch({'users': datasets['users']}, output_dir=str(tmp_path), output_file="x.pdf")
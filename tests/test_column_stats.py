@@ -0,0 +1,108 @@
+import pytest
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from summarease.column_stats import DatasetStats, compute_column_stats, describe_from_stats, select_columns
+from summarease.summarize_numeric import summarize_numeric
+from summarease.summarize_target import summarize_target_df
+from summarease.summarize_dtypes import summarize_dtypes_table
+
+
+@pytest.fixture
+def mixed_dataset():
+    return pd.DataFrame({
+        'int_col': [1, 2, 3, 4, 5, 6],
+        'float_col': [1.5, np.nan, 3.25, -2.0, 10.0, np.nan],
+        'nullable_col': pd.array([1, None, 3, 4, None, 9], dtype='Int64'),
+        'str_col': ['a', 'b', 'a', None, 'c', 'a'],
+        'bool_col': [True, False, True, True, False, True]
+    })
+
+
+def test_compute_column_stats_values(mixed_dataset):
+    """
+    Tests the counts, sums, extremes and cardinality computed for each column.
+    """
+    stats = compute_column_stats(mixed_dataset, value_counts_for=['str_col'])
+
+    assert isinstance(stats, DatasetStats)
+    assert stats.n_rows == 6
+    assert stats.numeric_columns == ['int_col', 'float_col', 'nullable_col']
+    assert stats.columns.loc['float_col', 'count'] == 4
+    assert stats.columns.loc['float_col', 'nulls'] == 2
+    assert stats.columns.loc['float_col', 'sum'] == pytest.approx(12.75)
+    assert stats.columns.loc['float_col', 'min'] == -2.0
+    assert stats.columns.loc['float_col', 'max'] == 10.0
+    assert stats.columns.loc['str_col', 'n_unique'] == 3
+    # The cardinality is only counted for the columns with value counts
+    assert stats.columns['n_unique'].drop('str_col').isna().all()
+    assert stats.columns.loc['str_col', 'nulls'] == 1
+    assert np.isnan(stats.columns.loc['str_col', 'sum'])
+
+
+def test_describe_from_stats_matches_describe(mixed_dataset):
+    """
+    Tests that the describe-style table matches `DataFrame.describe()`.
+    """
+    stats = compute_column_stats(mixed_dataset)
+    expected = mixed_dataset[stats.numeric_columns].describe().astype(float)
+
+    assert_frame_equal(describe_from_stats(stats), expected)
+
+
+def test_describe_from_stats_all_null_column():
+    data = pd.DataFrame({'A': [np.nan, np.nan], 'B': [1.0, 2.0]})
+    result = describe_from_stats(compute_column_stats(data))
+
+    assert result.loc['count', 'A'] == 0
+    assert result[['A']].iloc[1:].isna().all().all()
+    assert np.isnan(describe_from_stats(compute_column_stats(data[['B']].head(1))).loc['std', 'B'])
+
+
+def test_value_counts_for(mixed_dataset):
+    stats = compute_column_stats(mixed_dataset, value_counts_for=['str_col'])
+
+    assert stats.value_counts['str_col'].to_dict() == {'a': 3, 'b': 1, 'c': 1}
+
+    with pytest.raises(KeyError):
+        compute_column_stats(mixed_dataset, value_counts_for=['missing'])
+
+
+def test_summarizers_read_shared_stats(mixed_dataset):
+    """
+    Tests that every summarizer gives the same output with and without precomputed statistics.
+    """
+    stats = compute_column_stats(mixed_dataset, value_counts_for=['str_col'])
+
+    assert_frame_equal(
+        summarize_numeric(mixed_dataset, summarize_by="table", stats=stats)["numeric_describe"],
+        summarize_numeric(mixed_dataset, summarize_by="table")["numeric_describe"]
+    )
+    assert_frame_equal(
+        summarize_target_df(mixed_dataset, 'str_col', 'categorical', stats=stats),
+        summarize_target_df(mixed_dataset, 'str_col', 'categorical')
+    )
+    assert_frame_equal(
+        summarize_dtypes_table(mixed_dataset, stats=stats),
+        summarize_dtypes_table(mixed_dataset)
+    )
+    with pytest.warns(UserWarning):
+        numerical = summarize_target_df(mixed_dataset, 'float_col', 'numerical', stats=stats)
+    assert numerical.loc['float_col', 'mean'] == pytest.approx(mixed_dataset['float_col'].mean())
+
+
+def test_invalid_stats_argument(mixed_dataset):
+    with pytest.raises(AssertionError):
+        compute_column_stats("not a dataframe")
+
+    with pytest.raises(AssertionError):
+        describe_from_stats(mixed_dataset)
+
+
+def test_select_columns_shares_memory(mixed_dataset):
+    selected = select_columns(mixed_dataset, ['float_col', 'int_col'])
+
+    assert_frame_equal(selected, mixed_dataset[['float_col', 'int_col']])
+    for col in selected.columns:
+        assert np.shares_memory(selected[col].to_numpy(), mixed_dataset[col].to_numpy())
+    assert select_columns(mixed_dataset, []).shape == (len(mixed_dataset), 0)
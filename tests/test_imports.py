@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+import pytest
+
+HEAVY_MODULES = ["altair", "fpdf", "PIL", "vl_convert"]
+
+
+def loaded_modules(code):
+    """
+    Run `code` in a fresh interpreter and return the heavy modules it loaded.
+    """
+    script = f"{code}\nimport json, sys\nprint(json.dumps([m for m in {HEAVY_MODULES + ['pandas']!r} if m in sys.modules]))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_summarease_is_lazy():
+    """
+    Tests that importing the package does not import pandas or the plotting and PDF dependencies.
+    """
+    assert loaded_modules("import summarease") == []
+
+
+def test_summarize_dtypes_table_does_not_load_plotting():
+    code = ("import pandas as pd\n"
+            "from summarease import summarize_dtypes_table\n"
+            "summarize_dtypes_table(pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}))")
+
+    assert loaded_modules(code) == ["pandas"]
+
+
+def test_summarize_dict_does_not_load_plotting():
+    code = ("import pandas as pd\n"
+            "from summarease.summarize_dict import summarize_dict\n"
+            "summarize_dict(pd.DataFrame({'a': [1, 2, 3], 'b': [2.0, 1.0, 0.5], 'c': ['x', 'y', 'x']}), target_variable='c')")
+
+    assert loaded_modules(code) == ["pandas"]
+
+
+def test_import_summarize_module_does_not_load_plotting():
+    assert loaded_modules("import summarease.summarize") == ["pandas"]
+
+
+def test_lazy_exports():
+    import summarease
+
+    assert set(summarease.__all__) <= set(dir(summarease))
+    assert summarease.summarize_dtypes_table.__name__ == "summarize_dtypes_table"
+    assert callable(summarease.KLLSketch)
+
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_function'"):
+        summarease.not_a_function
+
+
+@pytest.mark.parametrize("name", ["summarize", "summarize_dict", "summarize_numeric", "summarize_missing"])
+def test_submodules_named_like_their_function(name):
+    """
+    Tests that the submodules named after their function are imported as modules, not as the function.
+    """
+    code = ("import inspect\n"
+            "import summarease\n"
+            f"from summarease.{name} import {name}\n"
+            f"import summarease.{name} as module\n"
+            f"assert inspect.ismodule(module) and inspect.ismodule(summarease.{name})\n"
+            f"assert inspect.isfunction({name}) and module.{name} is {name}")
+
+    subprocess.run([sys.executable, "-c", code], check=True)
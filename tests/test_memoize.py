@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+from summarease.memoize import SummaryCache, fingerprint
+import summarease.summarize as summarize_module
+from summarease.summarize import summarize
+
+
+@pytest.fixture
+def dataset():
+    """
+    A dataset large enough for the sampled blocks of the fingerprint, with an integer column.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'A': rng.normal(size=20_000),
+        'B': rng.integers(0, 10, size=20_000),
+        'label': rng.choice(['x', 'y'], size=20_000)
+    })
+
+
+def test_fingerprint(dataset):
+    key = fingerprint(dataset)
+
+    assert fingerprint(dataset.copy()) == key
+    assert fingerprint(dataset.astype({'B': 'float64'})) != key
+    assert fingerprint(dataset.rename(columns={'A': 'C'})) != key
+
+    changed = dataset.copy()
+    changed.iloc[0, 0] += 1
+    assert fingerprint(changed) != key
+
+
+def test_fingerprint_sampling(dataset):
+    """
+    Tests that only the sampled blocks are hashed, unless every row is requested.
+    """
+    changed = dataset.copy()
+    changed.iloc[1500, 0] += 1
+
+    assert fingerprint(changed, n_blocks=2, block_rows=100) == fingerprint(dataset, n_blocks=2, block_rows=100)
+    assert fingerprint(changed, n_blocks=None) != fingerprint(dataset, n_blocks=None)
+    assert fingerprint(pd.DataFrame({'a': [[1], [2]]})) != fingerprint(pd.DataFrame({'a': [[1], [3]]}))
+
+
+def test_summary_cache_lru():
+    cache = SummaryCache(max_bytes=2_500)
+    for key in ['a', 'b']:
+        cache.put(key, b"x" * 1_000)
+    assert cache.get('a') is not None  # "a" becomes the most recently used value
+    cache.put('c', b"x" * 1_000)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_summary_cache_returns_copies():
+    cache = SummaryCache()
+    table = cache.get_or_compute('table', lambda: pd.DataFrame({'a': [1]}))
+    table['b'] = 2
+
+    assert list(cache.get('table').columns) == ['a']
+
+
+def test_summary_cache_on_disk(tmp_path):
+    SummaryCache(cache_dir=tmp_path).put('a', {'spec': 1})
+    cache = SummaryCache(cache_dir=tmp_path)
+
+    assert cache.get_or_compute('a', lambda: pytest.fail("The value should come from the disk")) == {'spec': 1}
+    assert cache.disk_hits == 1
+
+    small = SummaryCache(cache_dir=tmp_path, max_disk_bytes=10)
+    small.put('b', "x" * 100)
+    assert list(tmp_path.glob("*.pkl")) == []
+
+    with pytest.raises(AssertionError):
+        SummaryCache(max_bytes=0)
+
+
+def test_summarize_reuses_cache(dataset, tmp_path):
+    """
+    Tests that summarizing the same DataFrame in table and then plot mode reuses the statistics.
+    """
+    cache = SummaryCache()
+    options = dict(target_variable='label', output_dir=str(tmp_path) + "/", render_workers=1, cache=cache)
+    summarize(dataset, summarize_by="table", **options)
+    assert cache.hits == 0
+
+    summarize(dataset, summarize_by="plot", **options)
+    assert cache.hits == 2  # The column statistics and the target summary
+
+    misses = cache.misses
+    summarize(dataset.copy(), summarize_by="plot", **options)
+    assert cache.misses == misses
+
+    with pytest.raises(AssertionError, match="Caching needs the whole dataset in memory"):
+        summarize(iter([dataset]), summarize_by="table", cache=cache)
+
+
+@pytest.mark.parametrize("summarize_by", ["plot", "mix"])
+def test_summarize_cache_keys_depend_on_target(dataset, tmp_path, monkeypatch, summarize_by):
+    """
+    Tests that the charts of a stratified sample are not reused for another target variable.
+    """
+    calls = []
+    summarize_numeric = summarize_module.summarize_numeric
+    monkeypatch.setattr(summarize_module, "summarize_numeric", lambda *args, **kwargs: calls.append(1) or summarize_numeric(*args, **kwargs))
+
+    cache = SummaryCache()
+    data = dataset.assign(other=dataset['B'] % 2)
+    options = dict(summarize_by=summarize_by, output_dir=str(tmp_path) + "/", render_workers=1, cache=cache,
+                   plot_sample_size=1_000, sampling="stratified")
+    summarize(data, target_variable='label', **options)
+    summarize(data, target_variable='label', **options)
+    assert len(calls) == 1
+
+    summarize(data, target_variable='other', **options)
+    assert len(calls) == 2
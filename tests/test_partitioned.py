@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import summarease.partitioned as partitioned
+import pytest
+from summarease.accumulators import DatasetAccumulator
+from summarease.column_stats import compute_column_stats
+from summarease.partitioned import accumulate_partitions, is_partitionable_source, list_partitions
+from summarease.summarize import summarize
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def partitioned_dir(dataset, tmp_path):
+    """
+    A directory holding the rows of the dataset in a Parquet file of 4 row groups and a CSV file.
+    """
+    directory = tmp_path / "dataset"
+    (directory / "part=0").mkdir(parents=True)
+    (directory / "part=1").mkdir(parents=True)
+    dataset.iloc[:800].to_parquet(directory / "part=0" / "data.parquet", row_group_size=200)
+    dataset.iloc[800:].to_csv(directory / "part=1" / "data.csv", index=False)
+    return directory
+
+
+def test_list_partitions(partitioned_dir):
+    parquet_path = str(partitioned_dir / "part=0" / "data.parquet")
+    csv_path = str(partitioned_dir / "part=1" / "data.csv")
+
+    assert list_partitions(partitioned_dir) == [(parquet_path, (0,)), (parquet_path, (1,)), (parquet_path, (2,)),
+                                                (parquet_path, (3,)), (csv_path, None)]
+    assert list_partitions([csv_path, parquet_path], partition_by="file") == [(csv_path, None), (parquet_path, None)]
+    assert is_partitionable_source(partitioned_dir) and not is_partitionable_source(pd.DataFrame())
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_accumulate_partitions_matches_full_pass(dataset, partitioned_dir, max_workers):
+    """
+    Tests that the merged partial summaries match the statistics of the whole dataset, for any
+    number of workers.
+    """
+    merged = accumulate_partitions(partitioned_dir, value_counts_for=['label'], max_workers=max_workers, chunksize=150)
+    stats = merged.to_stats()
+    expected = compute_column_stats(dataset, value_counts_for=['label'])
+
+    assert isinstance(merged, DatasetAccumulator)
+    assert stats.n_rows == len(dataset)
+    for col in ['A', 'B']:
+        assert stats.columns.loc[col, 'count'] == expected.columns.loc[col, 'count']
+        assert stats.columns.loc[col, 'sum'] == pytest.approx(expected.columns.loc[col, 'sum'])
+        assert stats.columns.loc[col, 'm2'] == pytest.approx(expected.columns.loc[col, 'm2'])
+        assert stats.columns.loc[col, 'min'] == expected.columns.loc[col, 'min']
+    assert stats.value_counts['label'].to_dict() == expected.value_counts['label'].to_dict()
+
+    corr = dataset[['A', 'B']].corr()
+    assert stats.correlation.to_numpy() == pytest.approx(corr.to_numpy(), abs=1e-6)
+
+
+def test_accumulate_partitions_seeds(dataset, tmp_path, monkeypatch):
+    """
+    Tests that the sketches of identical partitions flip independent compaction coins.
+    """
+    for name in ["a", "b"]:
+        pd.concat([dataset] * 5).to_parquet(tmp_path / f"{name}.parquet")
+    partials = []
+    accumulate_partition = partitioned._accumulate_partition
+    monkeypatch.setattr(partitioned, "_accumulate_partition",
+                        lambda *args, **kwargs: partials.append(accumulate_partition(*args, **kwargs)) or partials[-1])
+    accumulate_partitions(tmp_path, quantile_error=0.05, partition_by="file", max_workers=1)
+
+    left, right = (accumulator.sketches['A'] for accumulator in partials)
+    assert left.count == right.count
+    assert any(not np.array_equal(a, b) for a, b in zip(left.levels, right.levels))
+
+
+def test_accumulate_partitions_invalid_arguments(partitioned_dir, tmp_path):
+    with pytest.raises(AssertionError, match="Argument 'source' should be"):
+        accumulate_partitions(pd.DataFrame())
+    with pytest.raises(AssertionError, match="Argument 'partition_by' should be one of"):
+        accumulate_partitions(partitioned_dir, partition_by="column")
+    with pytest.raises(AssertionError, match="Argument 'max_workers' should be"):
+        accumulate_partitions(partitioned_dir, max_workers=0)
+    (tmp_path / "empty").mkdir()
+    with pytest.raises(AssertionError, match="No CSV or Parquet file"):
+        accumulate_partitions(tmp_path / "empty")
+
+
+def test_summarize_partitioned(dataset, partitioned_dir, tmp_path):
+    output_dir = tmp_path / "summary"
+    summarize(
+        dataset=str(partitioned_dir),
+        target_variable="label",
+        summarize_by="mix",
+        partition_workers=2,
+        output_file="partitioned.pdf",
+        output_dir=str(output_dir)
+    )
+
+    assert (output_dir / "partitioned.pdf").exists()
+
+    with pytest.raises(AssertionError, match="Argument 'partition_workers' needs a dataset stored in files"):
+        summarize(dataset=dataset, partition_workers=2, output_dir=str(output_dir))
@@ -0,0 +1,129 @@
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+from summarease.profiling import StageProfiler, StageTiming, TimingReport
+from summarease.summarize import summarize
+
+
+def test_stage_profiler_records_stages():
+    with StageProfiler() as profiler:
+        for _ in range(2):
+            with profiler.stage("sleep"):
+                time.sleep(0.01)
+        with profiler.stage("allocate"):
+            data = np.ones(1_000_000)
+            del data
+    report = profiler.report()
+
+    assert [stage.name for stage in report.stages] == ["sleep", "allocate"]
+    assert report["sleep"].calls == 2
+    assert report["sleep"].wall_time >= 0.02
+    assert report["allocate"].peak_memory >= 8_000_000
+    assert report.wall_time >= report["sleep"].wall_time
+    assert report["allocate"].peak_rss >= report["sleep"].peak_rss > 8_000_000
+    assert not tracemalloc.is_tracing()
+
+
+def test_stage_profiler_nested_peak():
+    """
+    Tests that an enclosing stage keeps the peak memory of the stages nested in it.
+    """
+    with StageProfiler() as profiler:
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                data = np.ones(1_000_000)
+                del data
+            with profiler.stage("inner"):
+                pass
+    report = profiler.report()
+
+    assert report["inner"].peak_memory >= 8_000_000
+    assert report["outer"].peak_memory >= report["inner"].peak_memory
+
+
+def test_stage_profiler_callback_and_disabled():
+    spans = []
+    with StageProfiler(callback=spans.append, trace_memory=False) as profiler:
+        with profiler.stage("a"):
+            pass
+    assert len(spans) == 1 and isinstance(spans[0], StageTiming)
+    assert spans[0].peak_memory is None
+
+    disabled = StageProfiler(enabled=False, callback=spans.append)
+    with disabled, disabled.stage("a"):
+        pass
+    assert len(spans) == 1
+    assert disabled.report().stages == []
+
+    with pytest.raises(AssertionError, match="Argument 'callback' should be callable"):
+        StageProfiler(callback="print")
+
+
+def test_stage_profiler_threads():
+    """
+    Tests that stages nested in several threads at the same time are all recorded.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def section(profiler):
+        for _ in range(50):
+            with profiler.stage("outer"), profiler.stage("inner"):
+                bytearray(10_000)
+
+    with StageProfiler() as profiler, ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(section, [profiler] * 4))
+    report = profiler.report()
+
+    assert report["outer"].calls == report["inner"].calls == 200
+    assert report["inner"].peak_memory >= 0
+
+
+def test_timing_report_export():
+    report = TimingReport(stages=[StageTiming("render", 1.5, 0.5, 1024, 1)], wall_time=2.0)
+
+    assert report.to_dict() == {"wall_time": 2.0, "stages": [
+        {"name": "render", "wall_time": 1.5, "cpu_time": 0.5, "peak_memory": 1024, "calls": 1,
+         "peak_rss": None}]}
+    assert report.to_dataframe().loc["render", "calls"] == 1
+
+    with pytest.raises(KeyError):
+        report["missing"]
+
+
+def test_summarize_profile(tmp_path):
+    dataset = pd.DataFrame({"a": range(50), "b": np.linspace(0, 1, 50), "label": ["x", "y"] * 25})
+    spans = []
+    report = summarize(dataset, summarize_by="plot", target_variable="label", output_dir=str(tmp_path) + "/",
+                       render_workers=1, profile_callback=spans.append)
+
+    stages = [stage.name for stage in report.stages]
+    assert stages == ["column_stats", "numeric_summary", "chart_specs", "dtypes_summary", "target_summary", "missing_summary",
+                      "render", "pdf_layout", "pdf_output"]
+    assert len(spans) == sum(stage.calls for stage in report.stages)
+    assert all(stage.peak_memory is not None for stage in report.stages)
+
+    assert summarize(dataset, summarize_by="table", output_dir=str(tmp_path) + "/") is None
+
+
+def test_summarize_memory_budget(tmp_path):
+    """
+    Tests that a report with a memory budget leaves its input unchanged and reports the memory of
+    every stage.
+    """
+    rng = np.random.default_rng(0)
+    dataset = pd.DataFrame(rng.normal(size=(2_000, 6)), columns=list("abcdef"))
+    dataset["label"] = rng.choice(["x", "y"], size=2_000)
+    original = dataset.copy()
+
+    report = summarize(dataset, summarize_by="mix", target_variable="label", output_dir=str(tmp_path) + "/",
+                       render_workers=1, memory_budget=200_000, profile=True)
+
+    pd.testing.assert_frame_equal(dataset, original)
+    assert all(stage.peak_rss is not None for stage in report.stages)
+    # The correlations are computed in blocks of 2 columns of 2,000 rows
+    assert report["numeric_summary"].peak_memory < 2_000_000
+
+    with pytest.raises(AssertionError, match="Argument 'memory_budget' should be a positive integer"):
+        summarize(dataset, output_dir=str(tmp_path) + "/", memory_budget=0)
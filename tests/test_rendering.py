@@ -0,0 +1,220 @@
+import asyncio
+import io
+import json
+import os
+import pytest
+import numpy as np
+import pandas as pd
+import altair as alt
+from PIL import Image
+from summarease import rendering
+from summarease.rendering import render_charts_async, RenderCache, chart_to_spec, render_spec, render_charts, render_jobs, png_size, encode_png
+
+
+@pytest.fixture
+def charts():
+    data = pd.DataFrame({'x': [1, 2, 3], 'y': [3, 1, 2]})
+    return {
+        'line_plot': alt.Chart(data).mark_line().encode(x='x:Q', y='y:Q'),
+        'bar_plot': alt.Chart(data).mark_bar().encode(x='x:O', y='y:Q').properties(width=300),
+        'point_plot': alt.Chart(data).mark_point().encode(x='x:Q', y='y:Q').to_dict()
+    }
+
+
+def test_chart_to_spec(charts):
+    spec = chart_to_spec(charts['line_plot'])
+    assert isinstance(spec, dict)
+    assert chart_to_spec(spec) is spec
+
+    with pytest.raises(AssertionError, match="Argument 'chart' should be an Altair chart"):
+        chart_to_spec("not a chart")
+
+
+def test_render_spec(charts):
+    data = render_spec(chart_to_spec(charts['line_plot']))
+
+    with Image.open(io.BytesIO(data)) as image:
+        assert image.format == "PNG"
+        assert png_size(data) == image.size
+
+
+def test_png_size_invalid():
+    with pytest.raises(ValueError, match="Not a PNG image"):
+        png_size(b"GIF89a" + bytes(30))
+
+
+def test_encode_png():
+    pixels = np.arange(2 * 5 * 3, dtype=np.uint8).reshape(2, 5, 3)
+    data = encode_png(pixels)
+
+    assert png_size(data) == (5, 2)
+    assert np.array_equal(np.asarray(Image.open(io.BytesIO(data)).convert("RGB")), pixels)
+    with pytest.raises(AssertionError):
+        encode_png(pixels.astype(np.float32))
+
+
+def test_render_charts_serial(charts):
+    images = render_charts(charts, max_workers=1)
+
+    assert list(images) == ['line_plot', 'bar_plot', 'point_plot']
+    assert all(png_size(data)[0] > 0 for data in images.values())
+
+
+def test_render_charts_default_renders_small_reports_in_process(charts, monkeypatch):
+    """
+    Tests that a report of a few charts does not pay the cold start of worker processes by default.
+    """
+    def no_workers(*args, **kwargs):
+        raise AssertionError("No worker process should be started")
+
+    monkeypatch.setattr(rendering.subprocess, "Popen", no_workers)
+    images = render_charts(charts)
+
+    assert list(images) == list(charts)
+
+
+def test_default_render_workers(monkeypatch):
+    monkeypatch.setattr(rendering.os, "cpu_count", lambda: 4)
+
+    assert rendering.default_render_workers(0) == 1
+    assert rendering.default_render_workers(rendering.CHARTS_PER_WORKER - 1) == 1
+    assert rendering.default_render_workers(3 * rendering.CHARTS_PER_WORKER) == 3
+    assert rendering.default_render_workers(100 * rendering.CHARTS_PER_WORKER) == 4
+
+
+def test_render_charts_parallel_keeps_order(charts):
+    """
+    Tests that the worker pool renders the same images and returns them in the order of the charts.
+    """
+    serial = render_charts(charts, max_workers=1)
+    parallel = render_charts(charts, max_workers=2)
+
+    assert list(parallel) == list(charts)
+    assert parallel == serial
+
+
+def test_render_charts_async(charts):
+    images = asyncio.run(render_charts_async(charts, max_workers=2))
+
+    assert list(images) == list(charts)
+    assert images == render_charts(charts, max_workers=1)
+
+
+def test_render_charts_async_cancel_kills_workers(charts, monkeypatch):
+    workers = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def recording_create_subprocess_exec(*args, **kwargs):
+        workers.append(await create_subprocess_exec(*args, **kwargs))
+        return workers[-1]
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_create_subprocess_exec)
+
+    async def main():
+        task = asyncio.create_task(render_charts_async(charts, max_workers=2))
+        while len(workers) < 2:
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert all(worker.returncode is not None for worker in workers)
+
+
+def test_render_jobs_frames(charts, tmp_path):
+    jobs_file = tmp_path / "jobs.json"
+    specs = [chart_to_spec(chart) for chart in charts.values()]
+    jobs_file.write_text(json.dumps([[spec, 1.0] for spec in specs]))
+    output = io.BytesIO()
+    render_jobs(jobs_file, output)
+
+    assert rendering._read_frames(output.getvalue()) == [render_spec(spec) for spec in specs]
+
+
+def test_render_charts_worker_failure():
+    invalid_spec = {'mark': 'point', 'encoding': {'x': {'field': 'x', 'type': 'not_a_type'}}}
+
+    with pytest.raises(RuntimeError, match="Rendering the charts failed"):
+        render_charts({'a': invalid_spec, 'b': invalid_spec}, max_workers=2)
+
+
+def test_render_charts_invalid_arguments(charts):
+    with pytest.raises(AssertionError):
+        render_charts(list(charts.values()))
+
+    with pytest.raises(AssertionError):
+        render_charts(charts, max_workers=0)
+
+    assert render_charts({}) == {}
+
+
+def test_render_cache_skips_cached_charts(charts, tmp_path, monkeypatch):
+    """
+    Tests that a second render of the same charts is served from the cache without rendering.
+    """
+    cache = RenderCache(tmp_path / "cache")
+    first = render_charts(charts, max_workers=1, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The chart should have been served from the cache")
+
+    monkeypatch.setattr(rendering, "render_spec", fail)
+    second = render_charts(charts, max_workers=1, cache=cache)
+
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert second == first
+
+
+def test_render_cache_key(charts):
+    spec = chart_to_spec(charts['line_plot'])
+    reordered = dict(reversed(list(spec.items())))
+
+    assert RenderCache.key(spec) == RenderCache.key(reordered)
+    assert RenderCache.key(spec) != RenderCache.key(spec, scale=2.0)
+    assert RenderCache.key(spec) != RenderCache.key(chart_to_spec(charts['bar_plot']))
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+    source = b"x" * 100
+    cache = RenderCache(tmp_path / "cache", max_bytes=250)
+
+    for age, key in enumerate(["a", "b"]):
+        cache.put(key, source)
+        os.utime(cache.path(key), (age, age))
+    assert cache.get("a") is not None  # "a" becomes the most recently used image
+
+    cache.put("c", source)
+
+    assert cache.path("a").exists() and cache.path("c").exists()
+    assert not cache.path("b").exists()
+
+
+def test_render_cache_scans_directory_once(tmp_path, monkeypatch):
+    """
+    Tests that the images are only listed when the cache is opened, in their order of last use.
+    """
+    cache = RenderCache(tmp_path, max_bytes=250)
+    for age, key in enumerate(["a", "b"]):
+        cache.put(key, b"x" * 100)
+        os.utime(cache.path(key), (age, age))
+    os.utime(cache.path("a"), (2, 2))
+
+    reopened = RenderCache(tmp_path, max_bytes=250)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The cache directory should not be listed again")
+
+    monkeypatch.setattr(type(tmp_path), "glob", fail)
+    reopened.put("c", b"x" * 100)
+
+    assert sorted(path.stem for path in tmp_path.iterdir()) == ["a", "c"]
+
+
+def test_render_cache_invalid_arguments(tmp_path):
+    with pytest.raises(AssertionError):
+        RenderCache(1)
+
+    with pytest.raises(AssertionError):
+        RenderCache(tmp_path, max_bytes=0)
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+import summarease.summarize as summarize_module
+from summarease.sampling import allocate_sample, describe_sampling, sample_rows
+from summarease.summarize import summarize
+from summarease.summarize_numeric import summarize_numeric
+
+
+@pytest.fixture
+def dataset():
+    """
+    A dataset with imbalanced classes, so the stratified samples keep a rare class.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'value': rng.normal(size=10_000),
+        'label': rng.choice(['a', 'b', 'c'], p=[0.7, 0.25, 0.05], size=10_000)
+    })
+
+
+def test_allocate_sample():
+    # Ties of the remainders go to the first strata
+    assert allocate_sample([70, 25, 5], 10).tolist() == [7, 3, 0]
+    assert allocate_sample([1, 1000], 500).tolist() == [0, 500]
+    assert allocate_sample([3, 3, 3], 9).tolist() == [3, 3, 3]
+
+
+def test_sample_rows_uniform(dataset):
+    sample, rate = sample_rows(dataset, 1_000, seed=1)
+
+    assert len(sample) == 1_000 and rate == 0.1
+    assert sample.index.is_monotonic_increasing
+    assert sample.index.equals(sample_rows(dataset, 1_000, seed=1)[0].index)
+    assert not sample.index.equals(sample_rows(dataset, 1_000, seed=2)[0].index)
+    assert sample_rows(dataset, 20_000)[0] is dataset
+
+
+def test_sample_rows_stratified(dataset):
+    dataset.loc[:9, 'label'] = None
+    sample, rate = sample_rows(dataset, 2_000, strategy="stratified", stratify_by='label')
+
+    assert len(sample) == 2_000 and rate == 0.2
+    expected = dataset['label'].value_counts(dropna=False) * 0.2
+    counts = sample['label'].value_counts(dropna=False)
+    assert (counts.reindex(expected.index) - expected).abs().max() <= 1
+    assert sample['label'].isna().sum() == 2
+
+
+def test_sample_rows_invalid_arguments(dataset):
+    with pytest.raises(AssertionError, match="Argument 'max_rows' should be a positive integer"):
+        sample_rows(dataset, 0)
+    with pytest.raises(AssertionError, match="Argument 'strategy' should be one of"):
+        sample_rows(dataset, 10, strategy="systematic")
+    with pytest.raises(AssertionError, match="Argument 'stratify_by' should be a column"):
+        sample_rows(dataset, 10, strategy="stratified", stratify_by="missing")
+
+
+def test_summarize_numeric_plot_sample(dataset):
+    dataset['other'] = dataset['value'] * 2
+    charts = summarize_numeric(dataset, summarize_by="plot", density_method="vega", plot_sample_size=500)
+
+    # The raw rows of the sample are embedded in the density plots
+    assert all(len(rows) == 500 for rows in charts['numeric_plot'].to_dict()['datasets'].values())
+
+
+def test_summarize_states_sampling_rate(dataset, tmp_path, monkeypatch):
+    reports = []
+    emit_report = summarize_module.emit_report
+
+    def recording_emit_report(pdf, elements, images):
+        reports.append(elements)
+        return emit_report(pdf, elements, images)
+
+    monkeypatch.setattr(summarize_module, "emit_report", recording_emit_report)
+    summarize(dataset, summarize_by="plot", target_variable='label', output_dir=str(tmp_path), render_workers=1,
+              plot_sample_size=1_000, sampling="stratified")
+    summarize(dataset, summarize_by="plot", output_dir=str(tmp_path), render_workers=1, plot_sample_size=50_000)
+
+    assert ("text", describe_sampling(1_000, 10_000, "stratified", 'label')) in reports[0]
+    assert "sampling rate 10.00%" in describe_sampling(1_000, 10_000)
+    assert describe_sampling(1_000, 10_000).startswith("The plots of the numeric columns are drawn from a uniform")
+    assert "target and missing values sections use every row" in describe_sampling(1_000, 10_000)
+    assert not any("sampling rate" in str(element) for element in reports[1])
+
+    with pytest.raises(AssertionError, match="Stratified sampling needs a 'target_variable'"):
+        summarize(dataset, summarize_by="plot", output_dir=str(tmp_path), sampling="stratified")
@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+import pandas as pd
+from summarease.sketches import KLLSketch, kll_k_for_error
+from summarease.column_stats import compute_column_stats, describe_from_stats
+from summarease.summarize_numeric import summarize_numeric
+
+
+def rank_errors(values, sketch, qs):
+    """
+    Return the distance between the requested quantiles and the true ranks of the estimates.
+    """
+    sorted_values = np.sort(values)
+    estimates = sketch.quantiles(qs)
+    ranks = np.searchsorted(sorted_values, estimates, side='right') / len(values)
+    return np.abs(ranks - np.asarray(qs))
+
+
+def test_kll_k_for_error():
+    assert kll_k_for_error(0.01) > kll_k_for_error(0.05)
+    k = kll_k_for_error(0.02)
+    assert 2.296 / k ** 0.9723 <= 0.02 < 2.296 / (k - 1) ** 0.9723
+
+    with pytest.raises(AssertionError):
+        kll_k_for_error(1.5)
+
+
+def test_kll_sketch_error_bound():
+    """
+    Tests that the rank error of the estimated quantiles stays within the requested bound.
+    """
+    values = np.random.default_rng(0).lognormal(size=200_000)
+    sketch = KLLSketch(epsilon=0.01).update(values)
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+    assert sketch.count == len(values)
+    assert sketch.n_retained < 2_000
+    assert (rank_errors(values, sketch, qs) <= 0.01).all()
+    assert sketch.quantiles([0, 1]).tolist() == [values.min(), values.max()]
+
+
+def test_kll_sketch_merge():
+    """
+    Tests that sketches of partitions merge into a sketch of the whole column.
+    """
+    values = np.random.default_rng(1).normal(size=100_000)
+    partitions = np.array_split(values, 10)
+    merged = KLLSketch(epsilon=0.01)
+    for seed, partition in enumerate(partitions):
+        merged.merge(KLLSketch(epsilon=0.01, seed=seed).update(partition))
+
+    assert merged.count == len(values)
+    assert (rank_errors(values, merged, [0.25, 0.5, 0.75]) <= 0.01).all()
+
+
+def test_kll_sketch_small_and_empty():
+    assert np.isnan(KLLSketch().quantiles([0.5])).all()
+
+    sketch = KLLSketch().update(pd.Series([3.0, None, 1.0, 2.0]))
+    assert sketch.count == 3
+    assert sketch.quantiles([0.5])[0] == 2.0
+
+
+def test_approximate_describe_layout():
+    """
+    Tests that the approximate table keeps the layout of the exact one.
+    """
+    rng = np.random.default_rng(2)
+    data = pd.DataFrame({'A': rng.normal(size=50_000), 'B': rng.uniform(size=50_000), 'C': 'x'})
+    exact = summarize_numeric(data, summarize_by="table")["numeric_describe"]
+    approximate = summarize_numeric(data, summarize_by="table", quantile_error=0.01)["numeric_describe"]
+
+    assert approximate.index.tolist() == exact.index.tolist()
+    assert approximate.columns.tolist() == exact.columns.tolist()
+    assert approximate.loc[['count', 'mean', 'std', 'min', 'max']].equals(exact.loc[['count', 'mean', 'std', 'min', 'max']])
+    assert approximate.loc['50%', 'B'] == pytest.approx(exact.loc['50%', 'B'], abs=0.02)
+
+    stats = compute_column_stats(data, quantile_error=0.05)
+    assert describe_from_stats(stats).shape == exact.shape
@@ -1,11 +1,17 @@
 import pytest
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import os
 from pathlib import Path
 from unittest.mock import patch
 import pandas as pd
 import shutil
+from io import BytesIO
 from fpdf import FPDF
-from summarease.summarize import summarize, validate_or_create_path, add_image, add_table, switch_page_if_needed
+import summarease.summarize as summarize_module
+import summarease.summarize_numeric as numeric_module
+from summarease.summarize import summarize, summarize_async, validate_or_create_path, add_image, add_table, switch_page_if_needed, iter_column_chunks, merge_dtypes_tables, emit_report, register_png, format_table_column
 from unittest.mock import MagicMock
 import time
 
@@ -99,8 +105,8 @@ def test_invalid_target_variable(mock_dataset):
         summarize(dataset=mock_dataset, target_variable=123)
 
 
-# Check if the plot is created after the numeric analysis
-def test_check_if_image_is_saved(mock_dataset):
+# Check if the plots are embedded in the PDF without writing image files
+def test_check_if_image_is_embedded(mock_dataset):
     output_dir = "./summarease_summary_test/"
     output_dir_path = Path(output_dir)
     summarize(
@@ -113,8 +119,194 @@ def test_check_if_image_is_saved(mock_dataset):
         output_dir=output_dir
     )
 
-    assert (output_dir_path / "img" / "numeric_plot.png").exists()
-    assert (output_dir_path / "img" / "corr_plot.png").exists()
+    pdf_bytes = (output_dir_path / "test_summary.pdf").read_bytes()
+    # The numeric, correlation and target plots
+    assert pdf_bytes.count(b"/Subtype /Image") >= 3
+    assert not (output_dir_path / "img").exists()
+
+
+def test_summarize_wide_dataset_table():
+    """
+    Tests if `summarize()` handles datasets wider than a single chunk of columns in table mode.
+    """
+    wide_dataset = pd.DataFrame({f"col_{i}": range(10) for i in range(40)})
+    wide_dataset["label"] = ["a", "b"] * 5
+    summarize(
+        dataset=wide_dataset,
+        target_variable="label",
+        summarize_by="table",
+        output_file="wide_summary.pdf",
+        output_dir="./summarease_summary_test/",
+        columns_per_chunk=15
+    )
+
+    assert Path("./summarease_summary_test/wide_summary.pdf").exists()
+
+
+def test_summarize_wide_dataset_plot():
+    """
+    Tests if `summarize()` saves the charts of every chunk in plot mode.
+    """
+    output_dir_path = Path("./summarease_summary_test/")
+    wide_dataset = pd.DataFrame({f"col_{i}": range(10) for i in range(6)})
+    summarize(
+        dataset=wide_dataset,
+        summarize_by="plot",
+        output_file="wide_plot_summary.pdf",
+        output_dir=str(output_dir_path),
+        columns_per_chunk=3,
+        render_workers=2
+    )
+
+    # A density and a correlation plot per chunk
+    pdf_bytes = (output_dir_path / "wide_plot_summary.pdf").read_bytes()
+    assert pdf_bytes.count(b"/Subtype /Image") >= 4
+
+
+def test_summarize_render_cache(mock_dataset, tmp_path):
+    """
+    Tests if `summarize()` serves the charts of an unchanged dataset from the render cache.
+    """
+    cache_dir = tmp_path / "cache"
+    for run in range(2):
+        summarize(
+            dataset=mock_dataset,
+            summarize_by="plot",
+            output_file=f"cached_summary_{run}.pdf",
+            output_dir=str(tmp_path / "summary"),
+            render_workers=1,
+            render_cache_dir=str(cache_dir)
+        )
+
+    assert len(list(cache_dir.glob("*.png"))) == 2
+    assert (tmp_path / "summary" / "cached_summary_1.pdf").exists()
+
+
+def test_summarize_mix(mock_dataset, tmp_path, monkeypatch):
+    """
+    Tests if `summarize()` emits tables and charts in mix mode, computing the correlations once.
+    """
+    reports, correlations = [], []
+    monkeypatch.setattr(summarize_module, "emit_report", lambda pdf, elements, images: reports.append(elements) or emit_report(pdf, elements, images))
+    compute_correlation = numeric_module.compute_correlation
+    monkeypatch.setattr(numeric_module, "compute_correlation", lambda *args, **kwargs: correlations.append(1) or compute_correlation(*args, **kwargs))
+
+    summarize(mock_dataset, summarize_by="mix", target_variable="Gender", output_dir=str(tmp_path), render_workers=1)
+
+    elements = reports[0]
+    tables = [element[1] for element in elements if element[0] == "table"]
+    images = [element[1] for element in elements if element[0] == "image"]
+    assert list(tables[0].columns) == ["Age", "Salary"]
+    assert list(tables[1].columns) == ["Var1", "Var2", "Correlation"]
+    assert list(tables[2]["class"]) == ["Female", "Male"]
+    # The target table is not modified by the target plot
+    assert "expected_lower" not in tables[2].columns
+    assert images == ["numeric_plot", "corr_plot", "target_plot"]
+    assert len(correlations) == 1
+    assert (tmp_path / "summary.pdf").exists()
+
+
+def test_summarize_async(mock_dataset, tmp_path):
+    """
+    Tests if `summarize_async()` writes the same report while the event loop keeps running other tasks.
+    """
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.create_task(ticker())
+        timings = await summarize_async(mock_dataset, target_variable="Gender", summarize_by="plot",
+                                        output_dir=str(tmp_path), render_workers=2, profile=True)
+        ticking.cancel()
+        return timings, ticks
+
+    timings, ticks = asyncio.run(main())
+
+    assert (tmp_path / "summary.pdf").read_bytes().count(b"/Subtype /Image") >= 3
+    assert timings["render"].calls == 1
+    assert ticks > 5
+
+
+def test_summarize_async_runs_sections_concurrently(mock_dataset, tmp_path, monkeypatch):
+    """
+    Tests that the target and missing values sections of `summarize_async()` run at the same time.
+    """
+    barrier = threading.Barrier(2, timeout=10)
+
+    def waiting(function):
+        # Every section waits for the other one, which only returns if they run concurrently
+        def wrapper(*args, **kwargs):
+            barrier.wait()
+            return function(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(summarize_module, "summarize_target_df", waiting(summarize_module.summarize_target_df))
+    monkeypatch.setattr(summarize_module, "summarize_missing", waiting(summarize_module.summarize_missing))
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        asyncio.run(summarize_async(mock_dataset, executor=executor, target_variable="Gender", summarize_by="table",
+                                    output_dir=str(tmp_path)))
+    assert (tmp_path / "summary.pdf").exists()
+
+
+def test_summarize_async_timeout(mock_dataset, tmp_path):
+    with pytest.raises(TimeoutError):
+        asyncio.run(summarize_async(mock_dataset, summarize_by="plot", output_dir=str(tmp_path), timeout=0.001))
+    assert not (tmp_path / "summary.pdf").exists()
+
+    with pytest.raises(AssertionError, match="Argument 'timeout' should be a positive number"):
+        asyncio.run(summarize_async(mock_dataset, timeout=0))
+    with pytest.raises(TypeError):
+        asyncio.run(summarize_async(mock_dataset, summarise_by="plot"))
+
+
+def test_invalid_columns_per_chunk(mock_dataset):
+    with pytest.raises(AssertionError, match="Argument 'columns_per_chunk' should be a positive integer"):
+        summarize(dataset=mock_dataset, columns_per_chunk=0)
+
+
+def test_invalid_render_workers(mock_dataset):
+    with pytest.raises(AssertionError, match="Argument 'render_workers' should be a positive integer"):
+        summarize(dataset=mock_dataset, render_workers=0)
+
+
+def test_emit_report_unknown_element():
+    pdf = FPDF()
+    pdf.add_page()
+
+    with pytest.raises(ValueError, match="Unknown report element"):
+        emit_report(pdf, [("video", "clip.mp4")], {})
+
+
+def test_iter_column_chunks():
+    dataset = pd.DataFrame({f"col_{i}": [i] for i in range(7)})
+    chunks = list(iter_column_chunks(dataset, 3))
+
+    assert [chunk_index for chunk_index, _ in chunks] == [0, 1, 2]
+    assert [chunk.shape[1] for _, chunk in chunks] == [3, 3, 1]
+    assert list(chunks[2][1].columns) == ["col_6"]
+
+    with pytest.raises(AssertionError, match="Argument 'dataset' should be pandas dataframe"):
+        list(iter_column_chunks("data.csv", 3))
+    with pytest.raises(AssertionError, match="Argument 'dataset' should be pandas dataframe"):
+        list(iter_column_chunks(iter([dataset]), 3))
+
+
+def test_merge_dtypes_tables():
+    tables = [
+        pd.DataFrame({"DataType": ["int64", "object"], "Count": [2, 1]}),
+        pd.DataFrame({"DataType": ["object", "float64"], "Count": [3, 1]}),
+        pd.DataFrame(columns=["DataType", "Count"])
+    ]
+    result = merge_dtypes_tables(tables)
+
+    assert result["DataType"].tolist() == ["object", "int64", "float64"]
+    assert result["Count"].tolist() == [4, 2, 1]
 
 
 
@@ -165,6 +357,56 @@ def test_add_table_single_column():
     result_pdf = add_table(pdf, table, 297, 210)
     assert result_pdf is not None
 
+def test_add_table_does_not_modify_table():
+    pdf = FPDF()
+    pdf.add_page()
+    table = pd.DataFrame({"Age": [25, 30]}, index=["Alice", "Bob"])
+    add_table(pdf, table, 297, 210)
+
+    assert list(table.columns) == ["Age"]
+
+def test_add_table_long_table_repeats_header():
+    """
+    Tests if `add_table()` continues long tables on new pages, with the header on every page.
+    """
+    pdf = FPDF()
+    pdf.add_page()
+    table = pd.DataFrame({"value": range(100)}, index=[f"category_{i}" for i in range(100)])
+    add_table(pdf, table, 297, 210)
+
+    assert pdf.page > 1
+    assert all("(Index)" in pdf.pages[page] for page in range(1, pdf.page + 1))
+
+def test_format_table_column():
+    """
+    Tests if `format_table_column()` formats the columns like the values formatted one by one.
+    """
+    values = pd.Series([1.23456, float("nan"), 1e20, -0.005])
+    assert format_table_column(values).tolist() == [str(round(value, 2)) for value in values.to_numpy()]
+    assert format_table_column(pd.Series([1, 2])).tolist() == ["1", "2"]
+    assert format_table_column(pd.Series([True, False])).tolist() == ["True", "False"]
+    assert format_table_column(pd.Series(["a", 2.345, None])).tolist() == ["a", "2.35", "None"]
+    assert format_table_column(pd.Index(["mean", "std"])).tolist() == ["mean", "std"]
+
+
+def test_format_table_column_nullable_dtypes():
+    """
+    Tests that the nullable columns are formatted like their values, with `<NA>` for the missing ones.
+    """
+    table = pd.DataFrame({
+        'ints': pd.array([1, None, 30], dtype='Int64'),
+        'floats': pd.array([1.2345, None, 3.0], dtype='Float64'),
+        'flags': pd.array([True, None, False], dtype='boolean'),
+    })
+
+    assert format_table_column(table['ints']).tolist() == ["1", "<NA>", "30"]
+    assert format_table_column(table['floats']).tolist() == ["1.23", "<NA>", "3.0"]
+    assert format_table_column(table['flags']).tolist() == ["True", "<NA>", "False"]
+    for col in table.columns:
+        # Like the baseline cells, formatted value by value
+        expected = [str(round(value, 2)) if isinstance(value, float) else str(value) for value in table[col]]
+        assert format_table_column(table[col]).tolist() == expected
+
 if __name__ == '__main__':
     pytest.main()
 
@@ -336,6 +578,39 @@ def test_clean_images():
         if image_path.exists():
             image_path.unlink()
 
+@pytest.mark.parametrize("mode", ["RGBA", "RGB", "L", "P"])
+def test_register_png_matches_fpdf(tmp_path, mode):
+    """
+    Tests that registering PNG bytes gives the image FPDF builds from the same file.
+    """
+    image = Image.new("RGBA", (37, 11), color=(200, 30, 60, 128))
+    image.putpixel((3, 4), (0, 0, 255, 255))
+    image_path = tmp_path / "image.png"
+    image.convert(mode).save(image_path)
+    data = image_path.read_bytes()
+
+    pdf = FPDF()
+    name = register_png(pdf, data)
+    expected = FPDF()._parsepng(str(image_path))
+
+    for key in ['w', 'h', 'cs', 'bpc', 'dp', 'pal', 'data', 'smask']:
+        assert pdf.images[name].get(key) == expected.get(key)
+    assert register_png(pdf, data) == name
+    assert len(pdf.images) == 1
+
+
+def test_add_image_bytes():
+    pdf = FPDF()
+    pdf.add_page()
+    image = Image.new("RGB", (400, 200), color=(255, 255, 255))
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+
+    pdf = add_image(pdf, buffer.getvalue(), 297, 210, 15)
+
+    assert len(pdf.images) == 1
+    assert pdf.get_y() > 15
+
 # image doesn't exist
 def test_image_not_found():
     pdf = FPDF()
@@ -0,0 +1,76 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+import warnings
+from summarease.accumulators import DatasetAccumulator
+from summarease.summarize_dict import summarize_dict, to_builtin
+
+
+def test_to_builtin():
+    converted = to_builtin({1: np.float32(0.5), 'b': [np.int64(2), np.nan, pd.NA, np.bool_(True)], 'c': pd.Timestamp(0)})
+
+    assert converted == {'1': 0.5, 'b': [2, None, None, True], 'c': '1970-01-01 00:00:00'}
+    assert type(converted['b'][0]) is int
+
+
+def test_summarize_dict(dataset, tmp_path):
+    output_path = tmp_path / "summary.json"
+    summary = summarize_dict(dataset, target_variable='label', output_path=str(output_path))
+
+    assert summary['n_rows'] == 1_200 and summary['n_columns'] == 3
+    assert summary['dtypes'] == {'float64': 2, 'object': 1}
+    assert set(summary['numeric']) == {'A', 'B'}
+    assert summary['numeric']['B']['count'] == dataset['B'].count()
+    assert summary['numeric']['A']['mean'] == pytest.approx(dataset['A'].mean())
+    assert [row['class'] for row in summary['target']] == ['x', 'y', 'z']
+    assert summary['correlation']['A']['B'] == pytest.approx(dataset['A'].corr(dataset['B']), abs=1e-5)
+
+    # The file holds strict JSON, without NaN
+    assert json.loads(output_path.read_text()) == summary
+
+
+def test_summarize_dict_numerical_target(dataset):
+    with warnings.catch_warnings():
+        # The threshold of categorical targets is not passed, so nothing is warned about
+        warnings.simplefilter("error")
+        summary = summarize_dict(dataset, target_variable='B', target_type='numerical', correlation=False)
+
+    assert summary['target']['max'] == dataset['B'].max()
+    assert summary['correlation'] is None
+
+
+def test_summarize_dict_streamed(dataset, tmp_path):
+    path = tmp_path / "data.csv"
+    dataset.to_csv(path, index=False)
+    summary = summarize_dict(str(path), target_variable='label', target_top_n=2, chunksize=100)
+
+    assert summary['numeric']['B']['count'] == dataset['B'].count()
+    assert summary['correlation']['A']['B'] == pytest.approx(dataset['A'].corr(dataset['B']), abs=1e-5)
+    assert summary['target'][-1]['class'] == "other (1 classes)"
+
+
+def test_summarize_dict_state(dataset):
+    state = DatasetAccumulator()
+    summarize_dict(dataset.iloc[:200], target_variable='label', state=state)
+    summary = summarize_dict(dataset.iloc[200:], target_variable='label', state=state)
+
+    assert summary['n_rows'] == 1_200
+    assert summary['numeric']['B']['mean'] == pytest.approx(dataset['B'].mean())
+    assert sum(row['proportion'] for row in summary['target']) == pytest.approx(1)
+    assert summary['correlation']['A']['B'] == pytest.approx(dataset['A'].corr(dataset['B']), abs=1e-5)
+
+    # A state that accumulated rows without the co-moments has no correlations
+    state = DatasetAccumulator().update(dataset)
+    assert summarize_dict(None, state=state)['correlation'] is None
+    with pytest.raises(ValueError, match="does not track the co-moments"):
+        state.track_co_moments()
+
+
+def test_summarize_dict_invalid_arguments(dataset):
+    with pytest.raises(AssertionError, match="Argument 'dataset' should be"):
+        summarize_dict(42)
+    with pytest.raises(AssertionError, match="Argument 'target_type' should be one of"):
+        summarize_dict(dataset, target_variable='label', target_type='ordinal')
+    with pytest.raises(KeyError, match="not found"):
+        summarize_dict(dataset, target_variable='missing')
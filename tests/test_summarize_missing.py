@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+from summarease.column_stats import compute_column_stats
+from summarease.summarize import summarize
+from summarease.summarize_missing import (compute_missing_summary, count_missing_per_row, pack_null_masks,
+                                          summarize_missing)
+
+
+@pytest.fixture
+def dataset():
+    """
+    A dataset with missing values in columns of different types and at different rates.
+    """
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'a': rng.normal(size=1_000),
+        'b': rng.integers(0, 10, size=1_000).astype(float),
+        'c': rng.choice(['x', 'y', None], size=1_000),
+        'd': np.arange(1_000),
+    })
+    data.loc[rng.random(1_000) < 0.2, 'a'] = np.nan
+    data.loc[rng.random(1_000) < 0.5, 'b'] = np.nan
+    return data
+
+
+def test_pack_null_masks():
+    data = pd.DataFrame({'a': [np.nan] + [1.0] * 64 + [np.nan], 'b': [None, 'x'] * 33})
+    masks = pack_null_masks(data)
+
+    assert masks.shape == (2, 2) and masks.dtype == np.uint64
+    assert np.unpackbits(masks[0].view(np.uint8), count=66, bitorder="little").nonzero()[0].tolist() == [0, 65]
+    assert np.bitwise_count(masks).sum(axis=1).tolist() == [2, 33]
+
+    with pytest.raises(AssertionError, match="Argument 'dataset' should be"):
+        pack_null_masks([1, 2])
+
+
+def test_count_missing_per_row():
+    """
+    Tests that the bit-sliced counter adds up more masks than a single bit can hold.
+    """
+    rng = np.random.default_rng(1)
+    nulls = pd.DataFrame(rng.random((200, 11)) < 0.6)
+    data = pd.DataFrame(np.where(nulls, np.nan, 1.0))
+
+    assert count_missing_per_row(pack_null_masks(data), 200).tolist() == nulls.sum(axis=1).tolist()
+
+
+def test_compute_missing_summary_matches_pandas(dataset):
+    summary = compute_missing_summary(dataset)
+    nulls = dataset.isna()
+
+    assert_series_equal(summary.null_counts, nulls.sum().rename('nulls'))
+    assert summary.null_rates['b'] == pytest.approx(nulls['b'].mean())
+    expected_rows = nulls.sum(axis=1).value_counts().sort_index()
+    assert summary.row_counts.to_dict() == expected_rows.to_dict()
+    expected_co_missing = nulls.astype(int).T @ nulls.astype(int)
+    assert (summary.co_missing.to_numpy() == expected_co_missing.to_numpy()).all()
+
+
+def test_compute_missing_summary_empty():
+    summary = compute_missing_summary(pd.DataFrame({'a': [], 'b': []}))
+
+    assert summary.n_rows == 0 and summary.null_counts.sum() == 0
+    assert summary.row_counts.empty
+
+
+def test_summarize_missing(dataset):
+    outputs = summarize_missing(dataset, summarize_by="mix")
+
+    assert set(outputs) == {"missing_table", "missing_rows_table", "missing_plot", "co_missing_plot"}
+    assert outputs["missing_table"]['Column'].tolist() == ['b', 'c', 'a']
+    assert outputs["missing_rows_table"]['Rows'].sum() == len(dataset)
+    assert set(summarize_missing(dataset, summarize_by="plot")) == {"missing_plot", "co_missing_plot"}
+    assert summarize_missing(dataset[['d']]) == {}
+
+
+def test_summarize_missing_from_stats(dataset):
+    stats = compute_column_stats(dataset)
+    outputs = summarize_missing(None, summarize_by="mix", stats=stats)
+
+    assert set(outputs) == {"missing_table", "missing_plot"}
+    assert outputs["missing_table"]['Missing'].tolist() == dataset[['b', 'c', 'a']].isna().sum().tolist()
+
+
+def test_summarize_missing_invalid_arguments(dataset):
+    with pytest.raises(AssertionError, match="Argument 'summarize_by' should be one of"):
+        summarize_missing(dataset, summarize_by="chart")
+    with pytest.raises(AssertionError, match="Argument 'max_columns' should be"):
+        summarize_missing(dataset, max_columns=0)
+    with pytest.raises(AssertionError, match="Argument 'dataset' should be"):
+        summarize_missing("data.csv")
+
+
+@pytest.mark.parametrize("summarize_by", ["table", "mix"])
+def test_summarize_missing_section(dataset, tmp_path, summarize_by):
+    output_dir = tmp_path / "summary"
+    summarize(dataset, summarize_by=summarize_by, output_file="missing.pdf", output_dir=str(output_dir))
+
+    assert (output_dir / "missing.pdf").exists()
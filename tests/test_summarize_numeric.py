@@ -1,8 +1,12 @@
 import pandas as pd
-from summarease.summarize_numeric import summarize_numeric, plot_numeric_density, plot_correlation_heatmap
+from summarease.summarize import summarize
+from summarease.summarize_numeric import summarize_numeric, plot_numeric_density, plot_correlation_heatmap, compute_density_grid, \
+    compute_correlation, correlation_block_size, strongest_correlations, cluster_order
 import pytest
 import numpy as np
 import altair as alt
+import inspect
+import sys
 from io import StringIO
 from unittest.mock import patch
 
@@ -182,3 +186,155 @@ def test_encoding():
     assert layer_2.encoding.y.shorthand == 'Var2:N'
     assert layer_2.encoding.text.shorthand == 'Correlation:Q'
 
+
+def test_compute_density_grid_integrates_to_one():
+    rng = np.random.default_rng(0)
+    values = rng.normal(loc=5, scale=2, size=10_000)
+    grid = compute_density_grid(values, n_points=300)
+
+    assert list(grid.columns) == ['value', 'density']
+    assert len(grid) == 300
+    # The grid spans the data range, so almost all of the mass is captured
+    area = np.trapezoid(grid['density'], grid['value'])
+    assert area == pytest.approx(1, abs=0.02)
+    assert grid.loc[grid['density'].idxmax(), 'value'] == pytest.approx(5, abs=0.5)
+
+
+def test_compute_density_grid_matches_direct_kde():
+    values = np.array([1.0, 2.0, 2.5, 4.0, 7.0])
+    bandwidth = 1.0
+    grid = compute_density_grid(values, bandwidth=bandwidth, n_points=500)
+
+    diffs = (grid['value'].to_numpy()[:, None] - values[None, :]) / bandwidth
+    expected = np.exp(-0.5 * diffs ** 2).sum(axis=1) / (len(values) * bandwidth * np.sqrt(2 * np.pi))
+    assert np.allclose(grid['density'], expected, atol=1e-3)
+
+
+def test_compute_density_grid_edge_cases():
+    assert compute_density_grid(pd.Series([np.nan, np.nan])).empty
+
+    constant = compute_density_grid(pd.Series([3, 3, 3, None]), n_points=50)
+    assert len(constant) == 50
+    assert constant['density'].notna().all()
+
+    with pytest.raises(AssertionError):
+        compute_density_grid([1, 2, 3], bandwidth=-1)
+
+
+def test_plot_numeric_density_numpy_embeds_grid_only():
+    df = pd.DataFrame({'A': range(5000), 'B': np.arange(5000) ** 0.5})
+    result = plot_numeric_density(df, density_method="numpy", n_points=100)
+
+    assert isinstance(result, alt.vegalite.v5.api.VConcatChart)
+    datasets = result.to_dict()['datasets']
+    assert all(len(rows) == 100 for rows in datasets.values())
+
+
+def test_plot_numeric_density_invalid_method():
+    with pytest.raises(AssertionError, match="Argument 'density_method' should be one of"):
+        plot_numeric_density(pd.DataFrame({'A': [1, 2]}), density_method="scipy")
+
+
+@pytest.fixture
+def correlated():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(500, 12)), columns=[f"c{i}" for i in range(12)])
+    df['c7'] = df['c2'] * 2 + rng.normal(scale=0.1, size=500)
+    df['c10'] = -df['c4'] + rng.normal(scale=0.5, size=500)
+    df['c11'] = 1.0
+    return df
+
+
+@pytest.mark.parametrize("missing", [0, 0.2])
+# Without budget, with the standardized columns kept (blocks of 3) and standardized per pair of blocks
+@pytest.mark.parametrize("memory_budget", [None, 60_000, 20_000])
+def test_compute_correlation_matches_pandas(correlated, missing, memory_budget):
+    df = correlated.mask(np.random.default_rng(1).random(correlated.shape) < missing)
+    corr = compute_correlation(df, block_size=5, memory_budget=memory_budget)
+
+    assert corr.dtypes.eq(np.float32).all()
+    assert list(corr.index) == list(df.columns)
+    assert np.allclose(corr, df.corr(), atol=1e-5, equal_nan=True)
+
+
+def test_correlation_block_size():
+    assert correlation_block_size(1_000, 400_000) == 10
+    assert correlation_block_size(1_000, 10**12) == 256
+    assert correlation_block_size(10**9, 1) == 1
+
+
+def test_strongest_correlations(correlated):
+    pairs = strongest_correlations(compute_correlation(correlated), top_k=2)
+
+    assert list(pairs.columns) == ['Var1', 'Var2', 'Correlation']
+    assert list(zip(pairs['Var1'], pairs['Var2'])) == [('c2', 'c7'), ('c4', 'c10')]
+    assert pairs['Correlation'].iloc[1] < -0.8
+    assert len(strongest_correlations(compute_correlation(correlated), top_k=1000)) == 11 * 10 // 2
+
+
+def test_cluster_order_places_correlated_columns_together(correlated):
+    order = cluster_order(compute_correlation(correlated))
+
+    assert sorted(order) == sorted(correlated.columns)
+    assert abs(order.index('c2') - order.index('c7')) == 1
+    assert abs(order.index('c4') - order.index('c10')) == 1
+
+
+def test_cluster_order_without_scipy(correlated, monkeypatch):
+    monkeypatch.setitem(sys.modules, "scipy.cluster.hierarchy", None)
+
+    with pytest.raises(ImportError, match="requires scipy"):
+        cluster_order(compute_correlation(correlated))
+
+
+def test_summarize_numeric_density_method_default(correlated):
+    """
+    Tests that the density plots are estimated the same way by default as in the reports of `summarize`.
+    """
+    default = summarize_numeric(correlated, summarize_by="plot")["numeric_plot"].to_dict()
+    numpy = summarize_numeric(correlated, summarize_by="plot", density_method="numpy")["numeric_plot"].to_dict()
+
+    assert default == numpy
+    assert inspect.signature(summarize).parameters['density_method'].default == "numpy"
+
+
+def test_plot_correlation_heatmap_modes(correlated):
+    spec = plot_correlation_heatmap(correlated).to_dict()
+    # The heatmap and its labels share one dataset
+    assert len(spec['datasets']) == 1
+    assert len(spec['layer']) == 2
+
+    assert 'layer' not in plot_correlation_heatmap(correlated, annotate_threshold=5).to_dict()
+
+    clustered = plot_correlation_heatmap(correlated, order="cluster").to_dict()
+    assert clustered['layer'][0]['encoding']['x']['sort'] is None
+
+    bars = plot_correlation_heatmap(correlated, top_k=3).to_dict()
+    assert bars['mark']['type'] == 'bar'
+    assert len(next(iter(bars['datasets'].values()))) == 3
+
+    with pytest.raises(AssertionError):
+        plot_correlation_heatmap(correlated, order="alphabetical")
+
+
+def test_plot_correlation_heatmap_rasterizes_large_matrices():
+    df = pd.DataFrame(np.random.default_rng(0).normal(size=(100, 80)))
+    spec = plot_correlation_heatmap(df).to_dict()
+
+    assert spec['mark']['type'] == 'image'
+    (rows,) = spec['datasets'].values()
+    assert len(rows) == 1 and rows[0]['url'].startswith("data:image/png;base64,")
+
+
+def test_summarize_numeric_mix(correlated):
+    sample = correlated.iloc[:50]
+    output = summarize_numeric(correlated, summarize_by="mix", density_method="numpy", plot_dataset=sample, top_correlations=3)
+
+    assert set(output) == {"numeric_describe", "numeric_plot", "corr_plot", "corr_table"}
+    assert output["numeric_describe"].loc["count"].eq(len(correlated)).all()
+    assert len(output["corr_table"]) == 3
+    # The heatmap shows the correlations of every row, like the table
+    cells = next(iter(output["corr_plot"].to_dict()["datasets"].values()))
+    top = output["corr_table"].iloc[0]
+    cell = next(c for c in cells if c["Var1"] == top["Var1"] and c["Var2"] == top["Var2"])
+    assert cell["Correlation"] == round(top["Correlation"], 2)
@@ -1,7 +1,9 @@
 import pytest
+import numpy as np
 import pandas as pd
 import altair as alt
 from summarease.summarize_target import summarize_target_df, summarize_target_balance_plot
+from summarease.accumulators import accumulate_stats
 
 # Nonplot test --------------------------------------------------------------------
 
@@ -162,6 +164,8 @@ def test_summarize_target_balance_plot_expected():
     chart = summarize_target_balance_plot(summary_df)
     # Validate that the output is Altair Chart
     assert isinstance(chart, alt.LayerChart), "The function should return an Altair LayerChart."
+    # The expected range is added to a copy of the summary
+    assert list(summary_df.columns) == ['class', 'proportion', 'imbalanced', 'threshold']
 
 def test_summarize_target_balance_plot_empty():
     """
@@ -240,3 +244,50 @@ def test_summarize_target_balance_plot_zero_classes():
     # Validate the chart displays a message for empty data
     assert isinstance(chart, alt.Chart), "The function should return an Altair Chart for an empty DataFrame."
     assert chart.mark == 'text', "The chart should display a message for empty data."
+
+
+def test_categorical_top_n():
+    """
+    Tests that the top classes are listed by decreasing proportion, and the tail is folded into "other".
+    """
+    data = pd.DataFrame({"target": ["x"] * 5 + ["y"] * 3 + ["z"] * 2 + ["w"] * 2 + ["v"]})
+    result = summarize_target_df(data, "target", "categorical", threshold=0.2, top_n=2)
+
+    assert result["class"].tolist() == ["x", "y", "other (3 classes)"]
+    assert result["proportion"].tolist() == pytest.approx([5 / 13, 3 / 13, 5 / 13])
+    assert result["imbalanced"].tolist() == [True, False, None]
+    assert result["expected_lower"].iloc[0] == pytest.approx(0.8 / 5)
+
+    everything = summarize_target_df(data, "target", "categorical", top_n=10)
+    assert len(everything) == 5 and "other" not in everything["class"].str.cat()
+
+    with pytest.raises(AssertionError):
+        summarize_target_df(data, "target", "categorical", top_n=0)
+
+def test_categorical_top_n_from_heavy_hitters():
+    """
+    Tests that the classes counted by a heavy hitters sketch are not flagged, their number is unknown.
+    """
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({"target": rng.zipf(1.5, size=20_000) % 5_000, "x": 1.0})
+    stats = accumulate_stats([data], value_counts_for=["target"], heavy_hitters=100)
+    result = summarize_target_df(None, "target", "categorical", stats=stats, top_n=3)
+
+    assert result["class"].tolist() == [1, 2, 3, "other"]
+    assert result["imbalanced"].isna().all()
+    assert result["proportion"].sum() == pytest.approx(1)
+    assert (result["proportion"].iloc[:3] <= data["target"].value_counts(normalize=True).iloc[:3].to_numpy()).all()
+
+def test_summarize_target_balance_plot_top_n():
+    """
+    Tests that the plot keeps the order of the top classes and the expected range of the summary.
+    """
+    data = pd.DataFrame({"target": ["b"] * 5 + ["a"] * 3 + ["c", "d"]})
+    summary = summarize_target_df(data, "target", "categorical", top_n=2)
+    spec = summarize_target_balance_plot(summary).to_dict()
+
+    rows = next(iter(spec["datasets"].values()))
+    assert [row["class"] for row in rows] == ["b", "a", "other (2 classes)"]
+    assert rows[0]["expected_lower"] == pytest.approx(0.8 / 4)
+    assert rows[-1]["imbalanced"] is None
+    assert spec["layer"][0]["encoding"]["x"]["sort"] is None